@@ -0,0 +1,11 @@
+# v0.1 - 벤치마크 패키지 추가 (2026-10-17)
+# 기능: 합성 Elementor 문서 생성기 + 스캐너/패처/매처 벤치마크 (예: python -m benchmarks.run --nodes 1000 10000)
+
+from .generator import GeneratorConfig, generate_adapter, generate_elementor_document, generate_site_spec
+
+__all__ = [
+    "GeneratorConfig",
+    "generate_adapter",
+    "generate_elementor_document",
+    "generate_site_spec",
+]
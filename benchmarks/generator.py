@@ -0,0 +1,304 @@
+# v0.1 - 시드 고정 합성 Elementor 문서 생성기 추가 (2026-10-17)
+# 기능: 위젯 구성/중첩/CSS ID 비율을 지정해 Elementor 트리를 만든다 (예: generate_elementor_document(GeneratorConfig(node_count=10000)))
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+# 위젯 타입별 기본 비율. 실제 템플릿처럼 제목/본문/버튼/이미지가 대부분을 차지한다.
+DEFAULT_WIDGET_MIX: Dict[str, float] = {
+    "heading": 0.26,
+    "text-editor": 0.22,
+    "button": 0.14,
+    "image": 0.14,
+    "icon-list": 0.08,
+    "highlighted-text": 0.06,
+    "uicore-counter": 0.05,
+    "uicore-icon-box": 0.05,
+}
+
+# 위젯 타입 → (CSS ID 어댑터 경로, op). 생성한 어댑터가 실제 패처 핸들러를 타도록 맞춘다.
+WIDGET_PATCH_TARGETS: Dict[str, Tuple[str, str]] = {
+    "heading": ("settings.title", "set_text"),
+    "text-editor": ("settings.editor", "set_html"),
+    "button": ("settings.text", "set_text"),
+    "image": ("settings.image.url", "set_image"),
+    "icon-list": ("settings.icon_list", "set_icon_list"),
+    "highlighted-text": ("settings.content", "set_highlighted_text"),
+    "uicore-counter": ("settings", "set_counter"),
+    "uicore-icon-box": ("settings", "set_iconbox"),
+}
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """합성 문서 옵션. 예: GeneratorConfig(node_count=100000, layout="container", css_id_density=0.2)
+
+    layout이 "section"이면 section > column > widget이고 nesting_depth가 2 이상이면 컬럼 안에 inner section이 들어간다.
+    "container"면 container 안에 container를 nesting_depth 단계까지 중첩한다.
+    """
+
+    node_count: int = 1000
+    seed: int = 7
+    layout: str = "section"
+    nesting_depth: int = 2
+    widget_mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_WIDGET_MIX))
+    css_id_density: float = 0.1
+    widgets_per_column: Tuple[int, int] = (2, 8)
+    columns_per_section: Tuple[int, int] = (1, 4)
+
+
+def generate_elementor_document(config: GeneratorConfig) -> Dict[str, Any]:
+    """Elementor 문서를 만든다. 요소 수는 node_count 근처에서 멈춘다. 예: generate_elementor_document(GeneratorConfig())"""
+
+    builder = _DocumentBuilder(config)
+    sections: List[Dict[str, Any]] = []
+    while builder.node_count < config.node_count:
+        if config.layout == "container":
+            sections.append(builder.container(depth=0))
+        else:
+            sections.append(builder.section(level=0))
+
+    return {
+        "version": "0.4",
+        "title": f"benchmark-{config.node_count}-{config.seed}",
+        "type": "page",
+        "elements": sections,
+    }
+
+
+def generate_site_spec(seed: int = 7, items_per_list: int = 50) -> Dict[str, Any]:
+    """필수 키와 자동 매칭용 content 배열을 모두 갖춘 site_spec을 만든다. 예: generate_site_spec(items_per_list=200)"""
+
+    rng = random.Random(seed)
+    return {
+        "brand": {
+            "name": "벤치마크",
+            "tagline": "합성 데이터",
+            "contact": {"email": "bench@example.com", "phone": "+82-2-0000-0000"},
+        },
+        "design": {
+            "colors": {"primary": "#3B82F6", "secondary": "#10B981", "accent": "#F59E0B"},
+            "fonts": {"heading": "Pretendard", "body": "Noto Sans KR"},
+        },
+        "pages": {
+            "home": {
+                "hero": {
+                    "h1": "합성 제목",
+                    "sub": "합성 부제목",
+                    "cta_text": "시작하기",
+                    "cta_url": "https://example.com/start",
+                }
+            }
+        },
+        "seo": {
+            "home": {"title": "벤치마크 홈", "description": "벤치마크용 합성 사이트"},
+            "organization": {"name": "벤치마크", "url": "https://example.com"},
+        },
+        "content": {
+            "titles": [f"제목 {index} {rng.randint(0, 999)}" for index in range(items_per_list)],
+            "paragraphs": [f"<p>본문 {index} {rng.random():.6f}</p>" for index in range(items_per_list)],
+            "ctas": [f"버튼 {index}" for index in range(items_per_list)],
+            "highlights": [f"강조 {index}" for index in range(items_per_list)],
+            "values": {f"value_{index}": f"값 {index}" for index in range(items_per_list)},
+        },
+        "images": {"list": [f"https://example.com/img/{index}.jpg" for index in range(items_per_list)]},
+    }
+
+
+def generate_adapter(
+    document: Dict[str, Any],
+    patch_count: int,
+    seed: int = 11,
+    value_count: int = 50,
+) -> Dict[str, Any]:
+    """문서의 위젯을 무작위로 골라 site_spec.content.values를 넣는 어댑터를 만든다. 예: generate_adapter(doc, 300)
+
+    validate_adapter를 통과하도록 element_id는 항상 넣고, CSS ID가 있는 위젯은 css_id도 함께 넣는다.
+    """
+
+    rng = random.Random(seed)
+    widgets = _collect_widgets(document["elements"])
+    patches = []
+    for index, widget in enumerate(rng.sample(widgets, min(patch_count, len(widgets)))):
+        widget_type = widget["widgetType"]
+        path, op = WIDGET_PATCH_TARGETS[widget_type]
+        patch: Dict[str, Any] = {
+            "key": f"content.values.value_{index % value_count}",
+            "element_id": widget["id"],
+            "path": path,
+            "op": op,
+        }
+        css_id = widget["settings"].get("_element_id")
+        if css_id:
+            patch["css_id"] = css_id
+        patches.append(patch)
+
+    return {"template_id": "bench", "pages": [{"post_slug": "home", "patches": patches}]}
+
+
+def _collect_widgets(elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """위젯 요소를 문서 순서대로 모은다. 예: _collect_widgets(document["elements"])"""
+
+    widgets: List[Dict[str, Any]] = []
+    stack = list(reversed(elements))
+    while stack:
+        element = stack.pop()
+        if element.get("elType") == "widget":
+            widgets.append(element)
+        stack.extend(reversed(element.get("elements", [])))
+    return widgets
+
+
+class _DocumentBuilder:
+    """요소 id/개수를 관리하며 트리를 만든다. 예: _DocumentBuilder(config).section()"""
+
+    def __init__(self, config: GeneratorConfig) -> None:
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.node_count = 0
+        unknown = sorted(set(config.widget_mix) - set(_WIDGET_SETTINGS))
+        if unknown:
+            raise ValueError(f"지원하지 않는 위젯 타입입니다: {', '.join(unknown)}")
+        self.widget_types = list(config.widget_mix)
+        self.widget_weights = [config.widget_mix[name] for name in self.widget_types]
+
+    def section(self, level: int) -> Dict[str, Any]:
+        """section > column > widget 묶음을 만든다. 예: builder.section(level=0)"""
+
+        columns = []
+        column_count = self.rng.randint(*self.config.columns_per_section)
+        for _ in range(column_count):
+            children = self._widgets()
+            if level + 1 < self.config.nesting_depth and self.rng.random() < 0.3:
+                children.append(self.section(level + 1))
+            columns.append(
+                self._element(
+                    "column",
+                    {"_column_size": 100 // column_count, "_inline_size": None},
+                    children,
+                    is_inner=level > 0,
+                )
+            )
+        return self._element("section", {"layout": "boxed", "gap": "default"}, columns, is_inner=level > 0)
+
+    def container(self, depth: int) -> Dict[str, Any]:
+        """container를 nesting_depth까지 중첩한다. 예: builder.container(depth=0)"""
+
+        children: List[Dict[str, Any]] = []
+        if depth + 1 < self.config.nesting_depth:
+            for _ in range(self.rng.randint(1, 3)):
+                if self.node_count >= self.config.node_count:
+                    break
+                children.append(self.container(depth + 1))
+        else:
+            children = self._widgets()
+        settings = {"content_width": "boxed", "flex_direction": self.rng.choice(["row", "column"])}
+        return self._element("container", settings, children, is_inner=depth > 0)
+
+    def _widgets(self) -> List[Dict[str, Any]]:
+        """컬럼 하나에 들어갈 위젯 목록. 예: self._widgets()"""
+
+        widgets = []
+        for _ in range(self.rng.randint(*self.config.widgets_per_column)):
+            widget_type = self.rng.choices(self.widget_types, weights=self.widget_weights)[0]
+            settings = _WIDGET_SETTINGS[widget_type](self.rng, self.node_count)
+            if self.rng.random() < self.config.css_id_density:
+                settings["_element_id"] = f"{widget_type.replace('-', '_')}_{self.node_count}"
+            widget = self._element("widget", settings, [], is_inner=False)
+            widget["widgetType"] = widget_type
+            widgets.append(widget)
+        return widgets
+
+    def _element(
+        self,
+        el_type: str,
+        settings: Dict[str, Any],
+        children: List[Dict[str, Any]],
+        is_inner: bool,
+    ) -> Dict[str, Any]:
+        """요소 하나를 만든다. Elementor처럼 8자리 16진수 id를 쓴다. 예: self._element("widget", {}, [], False)"""
+
+        self.node_count += 1
+        return {
+            # 홀수 곱셈은 2^32에서 일대일이라 id가 겹치지 않으면서 무작위처럼 보인다.
+            "id": f"{(self.node_count * 2654435761) & 0xFFFFFFFF:08x}",
+            "elType": el_type,
+            "settings": settings,
+            "elements": children,
+            "isInner": is_inner,
+        }
+
+
+def _heading(rng: random.Random, number: int) -> Dict[str, Any]:
+    return {"title": f"제목 {number}", "header_size": rng.choice(["h1", "h2", "h3"]), "align": "center"}
+
+
+def _text_editor(rng: random.Random, number: int) -> Dict[str, Any]:
+    sentences = " ".join(f"문장 {number}-{index}." for index in range(rng.randint(1, 6)))
+    return {"editor": f"<p>{sentences}</p>", "text_color": "#111827"}
+
+
+def _button(rng: random.Random, number: int) -> Dict[str, Any]:
+    return {
+        "text": f"버튼 {number}",
+        "link": {"url": f"https://example.com/page-{number}", "is_external": "", "nofollow": ""},
+        "background_color": "#3B82F6",
+    }
+
+
+def _image(rng: random.Random, number: int) -> Dict[str, Any]:
+    return {
+        "image": {"url": f"https://example.com/wp-content/uploads/img_{number}.jpg", "id": number, "alt": ""},
+        "image_size": "full",
+    }
+
+
+def _icon_list(rng: random.Random, number: int) -> Dict[str, Any]:
+    return {
+        "icon_list": [
+            {
+                "text": f"항목 {number}-{index}",
+                "selected_icon": {"value": "fas fa-check", "library": "fa-solid"},
+                "_id": f"{rng.getrandbits(28):07x}",
+            }
+            for index in range(rng.randint(2, 5))
+        ]
+    }
+
+
+def _highlighted_text(rng: random.Random, number: int) -> Dict[str, Any]:
+    return {
+        "content": [
+            {"text": f"앞 {number} ", "_id": f"{rng.getrandbits(28):07x}"},
+            {"text": f"강조 {number}", "highlight": "yes", "_id": f"{rng.getrandbits(28):07x}"},
+        ]
+    }
+
+
+def _counter(rng: random.Random, number: int) -> Dict[str, Any]:
+    return {"number": rng.randint(10, 9999), "title": f"지표 {number}", "suffix": "+", "duration": 2000}
+
+
+def _icon_box(rng: random.Random, number: int) -> Dict[str, Any]:
+    return {
+        "title": f"기능 {number}",
+        "description": f"기능 설명 {number}",
+        "icon": {"value": "fas fa-star", "library": "fa-solid"},
+        "button_text": "자세히",
+        "button_url": {"url": f"https://example.com/feature-{number}"},
+    }
+
+
+_WIDGET_SETTINGS: Dict[str, Callable[[random.Random, int], Dict[str, Any]]] = {
+    "heading": _heading,
+    "text-editor": _text_editor,
+    "button": _button,
+    "image": _image,
+    "icon-list": _icon_list,
+    "highlighted-text": _highlighted_text,
+    "uicore-counter": _counter,
+    "uicore-icon-box": _icon_box,
+}
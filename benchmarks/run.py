@@ -0,0 +1,238 @@
+# v0.2 - 기준선이 없으면 비교를 건너뛴다는 안내와 생성 방법 출력 (2026-10-17)
+# 기능: 합성 문서로 스캔/패치/자동 매칭/섹션 스캔/검증 시간을 재고 기준선과 비교 (예: python -m benchmarks.run --nodes 1000 10000)
+
+from __future__ import annotations
+
+import argparse
+import platform
+import statistics
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from site_factory import __version__
+from site_factory.auto_matcher import AutoMatcher
+from site_factory.contracts import validate_site_spec
+from site_factory.patcher import apply_patches_to_elementor
+from site_factory.scanner import scan_elementor_json
+from site_factory.section_scanner import SectionScanner
+from site_factory.utils.io_utils import JSON_BACKEND, read_json_file, write_json_file
+from site_factory.utils.time_utils import get_iso_timestamp
+
+from .generator import GeneratorConfig, generate_adapter, generate_elementor_document, generate_site_spec
+
+DEFAULT_BASELINE_PATH = Path("benchmarks/baseline.json")
+DEFAULT_RESULTS_DIR = Path("benchmarks/results")
+# 검증은 한 번이 너무 짧아 여러 번 묶어서 잰다.
+VALIDATE_LOOPS = 1000
+
+BenchmarkCase = Callable[[], Any]
+
+
+def build_cases(
+    document: Dict[str, Any],
+    site_spec: Dict[str, Any],
+    adapter: Dict[str, Any],
+    work_dir: Path,
+) -> Dict[str, BenchmarkCase]:
+    """측정할 함수 목록을 만든다. 예: build_cases(document, site_spec, adapter, Path("/tmp/bench"))"""
+
+    input_path = work_dir / "elementor.json"
+    write_json_file(input_path, document, compact=True)
+    elements = document["elements"]
+
+    def scan() -> Any:
+        # 후보 수 제한에 걸리지 않도록 전체 문서를 스캔한다.
+        return scan_elementor_json(
+            input_path=input_path,
+            output_dir=work_dir / "scan",
+            page_slug="home",
+            template_id="bench",
+            max_candidates=10**9,
+            max_depth=64,
+        )
+
+    def patch() -> Any:
+        return apply_patches_to_elementor(document, adapter, site_spec)
+
+    def patch_copy_on_write() -> Any:
+        return apply_patches_to_elementor(document, adapter, site_spec, copy_on_write=True)
+
+    def auto_match() -> Any:
+        return AutoMatcher(elements, site_spec).generate_patches()
+
+    def section_scan() -> Any:
+        return SectionScanner(elements).scan()
+
+    def validate() -> Any:
+        for _ in range(VALIDATE_LOOPS):
+            validate_site_spec(site_spec)
+
+    return {
+        "scan_elementor_json": scan,
+        "apply_patches": patch,
+        "apply_patches_cow": patch_copy_on_write,
+        "auto_matcher": auto_match,
+        "section_scanner": section_scan,
+        f"validate_site_spec_x{VALIDATE_LOOPS}": validate,
+    }
+
+
+def measure(case: BenchmarkCase, repeat: int) -> Dict[str, float]:
+    """최소/중앙값 시간을 잰다. 예: measure(case, repeat=5)"""
+
+    samples = []
+    for _ in range(repeat):
+        started = perf_counter()
+        case()
+        samples.append((perf_counter() - started) * 1000)
+    return {
+        "best_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+    }
+
+
+def run_benchmarks(
+    *,
+    node_counts: List[int],
+    repeat: int,
+    patch_count: int,
+    config: GeneratorConfig,
+    only: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """모든 크기에서 벤치마크를 실행한다. 예: run_benchmarks(node_counts=[1000], repeat=3, patch_count=300, config=GeneratorConfig())"""
+
+    site_spec = generate_site_spec(config.seed)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="site-factory-bench-") as temp_dir:
+        for node_count in node_counts:
+            document = generate_elementor_document(replace(config, node_count=node_count))
+            adapter = generate_adapter(document, patch_count, seed=config.seed + 4)
+            cases = build_cases(document, site_spec, adapter, Path(temp_dir))
+            for name, case in cases.items():
+                if only and name not in only:
+                    continue
+                results.append({"name": name, "nodes": node_count, **measure(case, repeat)})
+                print(f"{name:<28} nodes={node_count:<7} best={results[-1]['best_ms']}ms", file=sys.stderr)
+
+    return {
+        "generated_at": get_iso_timestamp(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "site_factory": __version__,
+            "json_backend": JSON_BACKEND,
+        },
+        "config": {
+            "repeat": repeat,
+            "patch_count": patch_count,
+            "seed": config.seed,
+            "layout": config.layout,
+            "nesting_depth": config.nesting_depth,
+            "css_id_density": config.css_id_density,
+            "widget_mix": config.widget_mix,
+        },
+        "results": results,
+    }
+
+
+def compare_with_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+) -> List[Dict[str, Any]]:
+    """기준선 대비 best_ms 비율을 계산한다. threshold를 넘으면 regression. 예: compare_with_baseline(report, baseline, 0.2)"""
+
+    baseline_map = {(item["name"], item["nodes"]): item for item in baseline.get("results", [])}
+    comparisons = []
+    for item in report["results"]:
+        previous = baseline_map.get((item["name"], item["nodes"]))
+        if not previous or not previous.get("best_ms"):
+            continue
+        ratio = item["best_ms"] / previous["best_ms"]
+        comparisons.append(
+            {
+                "name": item["name"],
+                "nodes": item["nodes"],
+                "baseline_ms": previous["best_ms"],
+                "current_ms": item["best_ms"],
+                "ratio": round(ratio, 3),
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return comparisons
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """벤치마크 CLI 파서. 예: build_parser().parse_args(["--nodes", "1000"])"""
+
+    parser = argparse.ArgumentParser(description="Site Factory 벤치마크")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000], help="문서 요소 수 (최대 100000 권장)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--patches", type=int, default=300, help="어댑터 패치 수")
+    parser.add_argument("--seed", type=int, default=7, help="생성기 시드")
+    parser.add_argument("--layout", choices=["section", "container"], default="section", help="문서 구조")
+    parser.add_argument("--nesting-depth", type=int, default=2, help="section/container 중첩 단계")
+    parser.add_argument("--css-id-density", type=float, default=0.1, help="CSS ID를 가진 위젯 비율 (0~1)")
+    parser.add_argument("--only", nargs="+", default=None, help="실행할 벤치마크 이름만 지정")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/<시각>.json)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="비교할 기준선 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="regression 판정 비율 (0.2 = 20%% 느려짐)")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """벤치마크 엔트리 포인트. regression이 있으면 1을 반환한다. 예: sys.exit(main())"""
+
+    args = build_parser().parse_args(argv)
+    config = GeneratorConfig(
+        seed=args.seed,
+        layout=args.layout,
+        nesting_depth=args.nesting_depth,
+        css_id_density=args.css_id_density,
+    )
+    report = run_benchmarks(
+        node_counts=args.nodes,
+        repeat=args.repeat,
+        patch_count=args.patches,
+        config=config,
+        only=args.only,
+    )
+
+    baseline_path = Path(args.baseline)
+    if baseline_path.exists():
+        baseline = read_json_file(baseline_path)
+        report["baseline"] = str(baseline_path)
+        report["comparison"] = compare_with_baseline(report, baseline, args.threshold)
+        if baseline.get("config") != report["config"]:
+            # 생성기 설정이 다르면 비교 자체가 의미 없을 수 있어 경고만 남긴다.
+            print("[경고] 기준선과 생성기 설정이 다릅니다.", file=sys.stderr)
+    elif not args.update_baseline:
+        # 기준선은 기계마다 달라 저장소에 넣지 않는다. 없으면 비교 없이 결과만 남긴다.
+        print(
+            f"[안내] 기준선이 없어 regression 비교를 건너뜁니다: {baseline_path} "
+            "(같은 옵션에 --update-baseline을 붙여 한 번 실행하면 만들어집니다)",
+            file=sys.stderr,
+        )
+
+    output_path = Path(args.output) if args.output else DEFAULT_RESULTS_DIR / f"{report['generated_at'][:19].replace(':', '')}.json"
+    write_json_file(output_path, report)
+    if args.update_baseline:
+        write_json_file(baseline_path, report)
+    print(f"결과 저장: {output_path}", file=sys.stderr)
+
+    regressions = [item for item in report.get("comparison", []) if item["regression"]]
+    for item in regressions:
+        print(
+            f"[regression] {item['name']} nodes={item['nodes']}: {item['baseline_ms']}ms → {item['current_ms']}ms (x{item['ratio']})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
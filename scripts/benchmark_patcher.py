@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+패처 복사 모드 벤치마크 (deepcopy vs copy-on-write)
+- benchmarks.generator(시드 고정 합성 문서/어댑터)로 두 모드의 시간/피크 메모리를 비교
+- 두 모드의 결과가 같은지도 함께 확인
+
+사용 (저장소 루트에서, PYTHONPATH=src;. 필요 — benchmarks 패키지도 읽는다):
+    set PYTHONPATH=src;.
+    python scripts/benchmark_patcher.py --nodes 20000 --patches 200 --repeat 3
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from benchmarks.generator import GeneratorConfig, generate_adapter, generate_elementor_document, generate_site_spec
+from site_factory.patcher import apply_patches_to_elementor
+
+
+def measure(document, adapter, site_spec, copy_on_write, repeat):
+    """최소 실행 시간과 피크 메모리 측정"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        apply_patches_to_elementor(document, adapter, site_spec, copy_on_write=copy_on_write)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    patched, _ = apply_patches_to_elementor(document, adapter, site_spec, copy_on_write=copy_on_write)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'best_ms': round(best * 1000, 2), 'peak_kb': round(peak / 1024, 1)}, patched
+
+
+def main():
+    parser = argparse.ArgumentParser(description='패처 deepcopy / copy-on-write 비교')
+    parser.add_argument('--nodes', type=int, nargs='+', default=[1000, 10000, 50000], help='문서 요소 수')
+    parser.add_argument('--patches', type=int, default=200, help='패치 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--seed', type=int, default=7, help='생성기 시드 (benchmarks.run과 같은 기본값)')
+    args = parser.parse_args()
+
+    site_spec = generate_site_spec(seed=args.seed)
+    rows = []
+
+    for node_count in args.nodes:
+        document = generate_elementor_document(GeneratorConfig(node_count=node_count, seed=args.seed))
+        adapter = generate_adapter(document, args.patches)
+
+        deep, deep_result = measure(document, adapter, site_spec, False, args.repeat)
+        cow, cow_result = measure(document, adapter, site_spec, True, args.repeat)
+
+        rows.append({
+            'nodes': node_count,
+            'patches': len(adapter['pages'][0]['patches']),
+            'deepcopy': deep,
+            'copy_on_write': cow,
+            'speedup': round(deep['best_ms'] / cow['best_ms'], 1) if cow['best_ms'] else None,
+            'same_output': json.dumps(deep_result, sort_keys=True) == json.dumps(cow_result, sort_keys=True),
+        })
+
+    print(json.dumps(rows, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,7 @@
 """
 CSS ID 기반 어댑터 자동 생성
 
-사용:
+사용 (PYTHONPATH=src 필요):
     python scripts/generate_cssid_adapter.py \
       data/elementor-home-cssid.json \
       data/adapters/t1_home_cssid.json \
@@ -15,58 +15,7 @@ import json
 import sys
 import argparse
 
-
-def extract_css_ids(elementor_data, parent_path=""):
-    """CSS ID가 있는 위젯 추출"""
-    css_id_map = []
-    
-    for element in elementor_data:
-        element_id = element.get('id')
-        widget_type = element.get('widgetType') or element.get('elType')
-        settings = element.get('settings', {})
-        css_id = settings.get('_element_id')
-        
-        if css_id:
-            # 위젯 타입별 기본 경로
-            path_map = {
-                'heading': 'settings.title',
-                'text-editor': 'settings.editor',
-                'button': 'settings.text',
-                'image': 'settings.image.url',
-                'icon-list': 'settings.icon_list',
-                'highlighted-text': 'settings.content',
-                'uicore-counter': 'settings',  # Counter는 복합 필드
-                'uicore-icon-box': 'settings',  # Icon Box도 복합 필드
-            }
-            
-            op_map = {
-                'heading': 'set_text',
-                'text-editor': 'set_html',
-                'button': 'set_text',
-                'image': 'set_image',
-                'icon-list': 'set_icon_list',
-                'highlighted-text': 'set_highlighted_text',
-                'uicore-counter': 'set_counter',
-                'uicore-icon-box': 'set_iconbox',
-            }
-
-            # 한글: 컨테이너는 직접 주입 대상이 아니므로 제외한다.
-            if widget_type == 'container':
-                continue
-            
-            css_id_map.append({
-                'css_id': css_id,
-                'element_id': element_id,
-                'widget_type': widget_type,
-                'path': path_map.get(widget_type, 'settings'),
-                'op': op_map.get(widget_type, 'set_text')
-            })
-        
-        # 자식 요소 재귀
-        if 'elements' in element:
-            css_id_map.extend(extract_css_ids(element['elements'], parent_path))
-    
-    return css_id_map
+from site_factory.cssid_adapter import build_cssid_adapter, collect_css_id_map
 
 
 def generate_adapter(elementor_json_path, output_path, template_id, page_slug):
@@ -75,28 +24,10 @@ def generate_adapter(elementor_json_path, output_path, template_id, page_slug):
     with open(elementor_json_path, 'r', encoding='utf-8') as f:
         elementor_data = json.load(f)
     
-    css_id_map = extract_css_ids(elementor_data)
-    
-    patches = []
-    for item in css_id_map:
-        patch = {
-            'key': item['css_id'],
-            'element_id': item['element_id'],
-            'path': item['path'],
-            'op': item['op'],
-            'widget_type': item['widget_type']
-        }
-        patches.append(patch)
-    
-    adapter = {
-        'template_id': template_id,
-        'pages': [
-            {
-                'post_slug': page_slug,
-                'patches': patches
-            }
-        ]
-    }
+    # 추출 로직은 site_factory.cssid_adapter (공통 순회 엔진 방문자)에 있다
+    css_id_map = collect_css_id_map(elementor_data)
+    adapter = build_cssid_adapter(css_id_map, template_id, page_slug)
+    patches = adapter['pages'][0]['patches']
     
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(adapter, f, ensure_ascii=False, indent=2)
@@ -3,13 +3,16 @@
 """
 Elementor 구조를 보기 좋게 출력
 
-사용:
+사용 (PYTHONPATH=src 필요):
     python scripts/print_structure.py data/elementor-home.json
 """
 
 import json
 import sys
 
+from site_factory.element_index import get_root_element_list
+from site_factory.traversal import walk_elements
+
 
 def print_widget(widget, indent=0):
     """위젯 정보 출력"""
@@ -40,8 +43,10 @@ def print_widget(widget, indent=0):
 
 
 def traverse(elements, indent=0):
-    """재귀적으로 구조 탐색"""
-    for element in elements:
+    """공통 순회 엔진으로 구조 탐색 (깊이 = 들여쓰기)"""
+    for visit in walk_elements(elements):
+        element = visit.element
+        depth = indent + visit.depth
         el_type = element.get('elType')
         
         if el_type == 'section':
@@ -49,14 +54,9 @@ def traverse(elements, indent=0):
             print(f"🔷 SECTION │ ID: {element.get('id')}")
             print("─" * 60)
         elif el_type == 'container':
-            print(f"{'  ' * indent}📦 Container │ ID: {element.get('id')}")
+            print(f"{'  ' * depth}📦 Container │ ID: {element.get('id')}")
         elif element.get('widgetType'):
-            print_widget(element, indent)
-        
-        # 자식 요소
-        children = element.get('elements', [])
-        if children:
-            traverse(children, indent + 1)
+            print_widget(element, depth)
 
 
 if __name__ == '__main__':
@@ -71,7 +71,7 @@ if __name__ == '__main__':
     print("📄 ELEMENTOR 구조")
     print("=" * 60)
     
-    traverse(data)
+    traverse(get_root_element_list(data))
     
     print("\n" + "=" * 60)
     print("✅ 완료")
@@ -0,0 +1,266 @@
+# v0.3 - ADAPTER_FILE_NAME을 contracts에서 가져와 데몬 모듈을 읽지 않음 (2026-10-17)
+# 기능: 패치 적용 전에 요소/경로/op/site_spec 키 불일치를 한 번에 찾는다 (예: lint_adapters(input_pattern="data/adapters", ...))
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batch_scanner import discover_input_files
+from .contracts import ADAPTER_FILE_NAME, collect_adapter_errors
+from .element_index import ElementIndex
+from .patcher import OP_WIDGET_TYPES, SUPPORTED_OPS, CompiledPatch, compile_adapter
+from .utils.dict_utils import compile_path, has_compiled_value, probe_compiled_target
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import ensure_directory, read_json_file, write_json_file
+
+LINT_REPORT_NAME = "lint_report.json"
+# 컴파일 전에 타입을 확인하는 패치 필드. 타입이 틀린 패치는 contract 오류로만 보고하고 컴파일하지 않는다.
+_PATCH_TEXT_FIELDS = ("key", "path", "op", "element_id", "css_id")
+
+
+@dataclass
+class LintIssue:
+    """검사에서 찾은 문제 하나. 예: LintIssue(adapter="t1_home.json", page="home", patch_index=3, code="element_missing", ...)
+
+    severity가 error면 패치 때 실패하는 문제, warning이면 적용은 되지만 의도와 다를 수 있는 문제다.
+    """
+
+    adapter: str
+    page: Optional[str]
+    patch_index: Optional[int]
+    code: str
+    severity: str
+    message: str
+    key: Optional[str] = None
+    element_id: Optional[str] = None
+
+
+class _PageLoader:
+    """Elementor 페이지를 한 번만 읽고 인덱싱해 여러 어댑터가 공유한다. 예: loader.get(Path("templates/t1/home.json"))"""
+
+    def __init__(self) -> None:
+        self.pages: Dict[Path, Tuple[Any, ElementIndex]] = {}
+        self.errors: Dict[Path, str] = {}
+
+    def get(self, path: Path) -> Optional[Tuple[Any, ElementIndex]]:
+        """(문서, 인덱스)를 반환한다. 읽을 수 없으면 None이고 이유는 errors에 남는다. 예: loader.get(path)"""
+
+        key = path.resolve()
+        if key not in self.pages and key not in self.errors:
+            try:
+                elementor_data = read_json_file(path)
+            except FriendlyError as error:
+                self.errors[key] = error.user_message
+            else:
+                self.pages[key] = (elementor_data, ElementIndex.build(elementor_data))
+        return self.pages.get(key)
+
+    def error(self, path: Path) -> Optional[str]:
+        return self.errors.get(path.resolve())
+
+    @property
+    def element_count(self) -> int:
+        return sum(len(index) for _, index in self.pages.values())
+
+
+def lint_adapters(
+    *,
+    input_pattern: str,
+    elementor_path: Path,
+    output_dir: Path,
+    site_spec: Optional[Dict[str, Any]] = None,
+    strict_path: bool = True,
+) -> Dict[str, Any]:
+    """어댑터들을 Elementor 문서와 교차 검사하고 lint_report.json을 저장한다. 예: lint_adapters(input_pattern="data/adapters", elementor_path=Path("templates"), output_dir=Path("output"))
+
+    elementor_path가 파일이면 모든 어댑터 페이지를 그 문서로 검사한다.
+    디렉터리면 serve와 같은 templates/<template_id>/<post_slug>.json 구조로 찾는다(post_slug가 없으면 그 템플릿의 모든 페이지).
+    페이지마다 요소 인덱스를 한 번만 만들어 재사용하므로 전체 비용은 요소 수 + 패치 수에 비례한다.
+    site_spec을 주면 각 패치의 key가 그 안에 있는지도 확인한다.
+    error가 하나라도 있으면 리포트를 저장한 뒤 FriendlyError로 실패한다.
+    """
+
+    adapter_paths = [path for path in discover_input_files(input_pattern) if path.suffix == ".json"]
+    if not adapter_paths:
+        raise FriendlyError(user_message=f"검사할 어댑터가 없습니다: {input_pattern}")
+
+    started = perf_counter()
+    loader = _PageLoader()
+    issues: List[LintIssue] = []
+    patch_count = 0
+    for adapter_path in adapter_paths:
+        patch_count += _lint_adapter_file(adapter_path, elementor_path, loader, site_spec, strict_path, issues)
+    elapsed_seconds = perf_counter() - started
+
+    error_count = sum(1 for issue in issues if issue.severity == "error")
+    summary = {
+        "adapters": len(adapter_paths),
+        "pages": len(loader.pages),
+        "elements": loader.element_count,
+        "patches": patch_count,
+        "errors": error_count,
+        "warnings": len(issues) - error_count,
+        "elapsed_ms": round(elapsed_seconds * 1000, 3),
+    }
+    report = {
+        "input": input_pattern,
+        "elementor": str(elementor_path),
+        "strict_path": strict_path,
+        "checked_keys": site_spec is not None,
+        "summary": summary,
+        "issues": [asdict(issue) for issue in issues],
+    }
+    report_path = ensure_directory(output_dir) / LINT_REPORT_NAME
+    write_json_file(report_path, report)
+
+    if error_count:
+        raise FriendlyError(
+            user_message=f"어댑터 검사에서 오류 {error_count}건을 찾았습니다: {report_path}",
+            detail="\n".join(_format_issue(issue) for issue in issues if issue.severity == "error"),
+        )
+
+    return {"lint_report_path": str(report_path), **summary}
+
+
+def _lint_adapter_file(
+    adapter_path: Path,
+    elementor_path: Path,
+    loader: _PageLoader,
+    site_spec: Optional[Dict[str, Any]],
+    strict_path: bool,
+    issues: List[LintIssue],
+) -> int:
+    """어댑터 파일 하나를 검사하고 검사한 패치 수를 반환한다. 예: _lint_adapter_file(path, Path("templates"), loader, None, True, issues)"""
+
+    name = str(adapter_path)
+    try:
+        adapter = read_json_file(adapter_path)
+    except FriendlyError as error:
+        issues.append(LintIssue(name, None, None, "adapter_unreadable", "error", error.user_message))
+        return 0
+
+    for error in collect_adapter_errors(adapter):
+        issues.append(LintIssue(name, None, None, "contract", "error", f"{error['path'] or '(root)'}: {error['message']}"))
+    pages = adapter.get("pages") if isinstance(adapter, dict) else None
+    if not isinstance(pages, list):
+        return 0
+
+    patch_count = 0
+    for page in pages:
+        if not isinstance(page, dict) or not isinstance(page.get("patches"), list):
+            continue
+        post_slug = page.get("post_slug")
+        page_paths = _resolve_page_paths(elementor_path, adapter.get("template_id"), post_slug)
+        if not page_paths:
+            issues.append(
+                LintIssue(name, post_slug, None, "page_missing", "error", f"Elementor 페이지를 찾을 수 없습니다: {elementor_path}")
+            )
+            continue
+
+        # 계약 오류로 이미 보고한 패치(객체가 아니거나 필드 타입이 틀린 것)는 빼고, 원래 번호로 이슈를 남긴다.
+        compilable = [(index, patch) for index, patch in enumerate(page["patches"]) if _is_compilable(patch)]
+        for page_path in page_paths:
+            loaded = loader.get(page_path)
+            if loaded is None:
+                issues.append(LintIssue(name, post_slug, None, "page_unreadable", "error", loader.error(page_path) or ""))
+                continue
+            elementor_data, element_index = loaded
+            plan = compile_adapter(
+                {"template_id": adapter.get("template_id"), "pages": [{**page, "patches": [patch for _, patch in compilable]}]},
+                elementor_data,
+                strict_path=strict_path,
+                element_index=element_index,
+            )
+            page_name = post_slug or page_path.stem
+            for (patch_index, _), compiled in zip(compilable, plan.patches):
+                patch_count += 1
+                if compiled.is_valid:
+                    _lint_patch(name, page_name, patch_index, compiled, site_spec, issues)
+
+    return patch_count
+
+
+def _is_compilable(patch: Any) -> bool:
+    """컴파일해도 되는 패치인지. 예: _is_compilable({"key": "brand.name", "element_id": "a1", "path": "settings.title", "op": "set_text"})"""
+
+    return isinstance(patch, dict) and all(
+        patch.get(field_name) is None or isinstance(patch.get(field_name), str) for field_name in _PATCH_TEXT_FIELDS
+    )
+
+
+def _lint_patch(
+    adapter: str,
+    page: Optional[str],
+    patch_index: int,
+    compiled: CompiledPatch,
+    site_spec: Optional[Dict[str, Any]],
+    issues: List[LintIssue],
+) -> None:
+    """컴파일된 패치 하나를 검사한다. 예: _lint_patch("t1_home.json", "home", 0, plan.patches[0], site_spec, issues)"""
+
+    def report(code: str, severity: str, message: str) -> None:
+        issues.append(
+            LintIssue(adapter, page, patch_index, code, severity, message, compiled.key_path, compiled.element_id)
+        )
+
+    if compiled.op not in SUPPORTED_OPS:
+        report("unknown_op", "error", f"알 수 없는 op입니다(경로 세팅으로 적용됨): {compiled.op}")
+
+    if compiled.op != "delete" and site_spec is not None:
+        if not has_compiled_value(site_spec, compile_path(compiled.key_path)):
+            report("key_missing", "error", f"site_spec에 키가 없습니다: {compiled.key_path}")
+
+    if not compiled.targets:
+        report("element_missing", "error", f"요소를 찾을 수 없습니다: {compiled.element_id or compiled.css_id}")
+        return
+    if len(compiled.targets) > 1:
+        report("element_ambiguous", "warning", f"일치하는 요소가 {len(compiled.targets)}개라 첫 번째에만 적용됩니다.")
+
+    element = compiled.targets[0].element
+    widget_type = element.get("widgetType") or element.get("widget_type")
+    expected_types = OP_WIDGET_TYPES.get(compiled.op)
+    if expected_types and widget_type and widget_type not in expected_types:
+        report(
+            "op_widget_mismatch",
+            "error",
+            f"{compiled.op}는 {', '.join(expected_types)} 위젯용인데 대상은 {widget_type}입니다.",
+        )
+
+    if compiled.op == "delete":
+        return
+    if not compiled.writes_target_path:
+        # 구조 전용 핸들러는 path 대신 settings를 직접 고친다.
+        if not isinstance(element.get("settings"), dict):
+            report("path_unresolved", "error", "요소에 settings가 없습니다.")
+        return
+
+    status = probe_compiled_target(element, compiled.target_keys)
+    if status == "unresolved":
+        report("path_unresolved", "error", f"strict_path로 설정할 수 없는 경로입니다: {compiled.target_path}")
+    elif status == "new_key":
+        report("path_new_key", "warning", f"마지막 키가 요소에 없어 새로 만들어집니다: {compiled.target_path}")
+
+
+def _resolve_page_paths(elementor_path: Path, template_id: Any, post_slug: Optional[str]) -> List[Path]:
+    """어댑터 페이지에 해당하는 Elementor 파일 목록. 예: _resolve_page_paths(Path("templates"), "t1", "home")"""
+
+    if elementor_path.is_file():
+        return [elementor_path]
+    if not elementor_path.is_dir() or not isinstance(template_id, str):
+        return []
+
+    template_dir = elementor_path / template_id
+    if post_slug:
+        page_path = template_dir / f"{post_slug}.json"
+        return [page_path] if page_path.is_file() else []
+    return sorted(path for path in template_dir.glob("*.json") if path.name != ADAPTER_FILE_NAME)
+
+
+def _format_issue(issue: LintIssue) -> str:
+    location = issue.adapter if issue.page is None else f"{issue.adapter} [{issue.page}]"
+    if issue.patch_index is not None:
+        location = f"{location} patches[{issue.patch_index}]"
+    return f"{location} {issue.code}: {issue.message}"
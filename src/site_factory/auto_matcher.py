@@ -15,11 +15,14 @@
 from typing import Dict, List, Any
 import logging
 
+from .traversal import ElementVisit, ElementVisitor, run_visitors
+from .utils.dict_utils import compile_path, get_compiled_value
+
 logger = logging.getLogger(__name__)
 
 
-class AutoMatcher:
-    """Widget Type별 자동 매칭"""
+class AutoMatcher(ElementVisitor):
+    """Widget Type별 자동 매칭 (공통 순회 엔진 방문자)"""
     
     # Widget Type → site_spec 경로 매핑
     WIDGET_MAPPING = {
@@ -59,65 +62,69 @@ class AutoMatcher:
         self.elementor_data = elementor_data
         self.site_spec = site_spec
         self.counters = {}  # widget_type별 카운터
+        self.patches = []
+        self.unresolved = 0
+        # site_spec 배열 경로는 한 번만 컴파일해 루프에서 재파싱하지 않는다
+        self.array_paths = {
+            widget_type: compile_path(mapping['site_spec_array'])
+            for widget_type, mapping in self.WIDGET_MAPPING.items()
+        }
     
     def generate_patches(self) -> List[Dict]:
         """자동으로 패치 생성"""
-        patches = []
+        self.patches = []
+        self.unresolved = 0
+        run_visitors(self.elementor_data, [self])
+        return self.patches
+    
+    def visit(self, visit: ElementVisit) -> bool:
+        """요소 하나를 매칭 (run_visitors에서 호출)"""
+        element = visit.element
+        widget_type = element.get('widgetType')
+        element_id = element.get('id')
         
-        for element in self._traverse_elements(self.elementor_data):
-            widget_type = element.get('widgetType')
-            element_id = element.get('id')
-            
-            if not widget_type or not element_id:
-                continue
-            
-            # 매핑 규칙 확인
-            mapping = self.WIDGET_MAPPING.get(widget_type)
-            if not mapping:
-                continue
-            
-            # 카운터 증가
-            if widget_type not in self.counters:
-                self.counters[widget_type] = 0
-            else:
-                self.counters[widget_type] += 1
-            
-            index = self.counters[widget_type]
-            
-            # site_spec 경로 생성
-            site_spec_key = f"{mapping['site_spec_array']}[{index}]"
-            
-            # 패치 생성
-            patch = {
-                'key': site_spec_key,
-                'element_id': element_id,
-                'path': mapping['target_path'],
-                'op': mapping['op'],
-                'auto_matched': True,
-                'widget_type': widget_type,
-                'index': index
-            }
-            
-            patches.append(patch)
-            logger.debug(f"자동 매칭: {widget_type}[{index}] → {element_id}")
+        if not widget_type or not element_id:
+            return False
         
-        logger.info(f"총 {len(patches)}개 패치 자동 생성")
-        logger.info(f"통계: {self.counters}")
+        # 매핑 규칙 확인
+        mapping = self.WIDGET_MAPPING.get(widget_type)
+        if not mapping:
+            return False
         
-        return patches
-    
-    def _traverse_elements(self, elements: List[Dict]) -> List[Dict]:
-        """
-        Elementor JSON을 순회하며 모든 위젯 추출
+        # 카운터 증가
+        if widget_type not in self.counters:
+            self.counters[widget_type] = 0
+        else:
+            self.counters[widget_type] += 1
         
-        중첩된 구조(컨테이너, 섹션 등)도 재귀적으로 탐색
-        """
-        for element in elements:
-            yield element
-            
-            # 자식 요소가 있으면 재귀
-            if 'elements' in element:
-                yield from self._traverse_elements(element['elements'])
+        index = self.counters[widget_type]
+        
+        # site_spec 경로 생성
+        site_spec_key = f"{mapping['site_spec_array']}[{index}]"
+        if get_compiled_value(self.site_spec, self.array_paths[widget_type] + (index,)) is None:
+            self.unresolved += 1
+        
+        # 패치 생성
+        patch = {
+            'key': site_spec_key,
+            'element_id': element_id,
+            'path': mapping['target_path'],
+            'op': mapping['op'],
+            'auto_matched': True,
+            'widget_type': widget_type,
+            'index': index
+        }
+        
+        self.patches.append(patch)
+        logger.debug(f"자동 매칭: {widget_type}[{index}] → {element_id}")
+        return False
+    
+    def finish(self) -> None:
+        """순회 종료 후 통계 로그"""
+        logger.info(f"총 {len(self.patches)}개 패치 자동 생성")
+        logger.info(f"통계: {self.counters}")
+        if self.unresolved:
+            logger.info(f"site_spec에 값이 없는 패치: {self.unresolved}개")
 
 
 def generate_auto_adapter(
@@ -141,6 +148,15 @@ def generate_auto_adapter(
     matcher = AutoMatcher(elementor_json, site_spec)
     patches = matcher.generate_patches()
     
+    return build_auto_adapter(patches, page_slug, template_id)
+
+
+def build_auto_adapter(patches: List[Dict], page_slug: str, template_id: str) -> Dict:
+    """
+    자동 매칭 패치 목록으로 어댑터 구성
+    
+    (run_visitors로 다른 방문자와 함께 순회한 경우에도 사용)
+    """
     return {
         'template_id': template_id,
         'auto_generated': True,
@@ -0,0 +1,304 @@
+# v0.4 - 공개된 pipeline.build_run_report 사용 (2026-10-17)
+# 기능: JSONL 작업 목록을 프로세스 풀로 실행하고 집계 리포트 저장 (예: run_pipeline_batch(jobs_path=Path("jobs.jsonl"), ...))
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional
+
+from .batch_scanner import resolve_worker_count
+from .contracts import validate_adapter, validate_site_spec
+from .json_delta import DELTA_FILE_NAME, build_delta_document
+from .patch_results import PATCH_RESULTS_FILE_NAME, PatchResultWriter
+from .patcher import AdapterPlan, compile_adapter
+from .pipeline import build_run_report, default_dependencies
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import ensure_directory, file_sha256, read_json_file, write_json_file
+from .utils.time_utils import get_iso_timestamp
+from .utils.trace_utils import StageTimer
+
+BATCH_REPORT_NAME = "batch_report.json"
+# 워커 하나가 동시에 들고 있는 템플릿 플랜 수
+PLAN_CACHE_SIZE = 8
+
+
+def run_pipeline_batch(
+    *,
+    config_path: Path,
+    jobs_path: Path,
+    output_dir: Path,
+    adapter_path: Optional[Path] = None,
+    elementor_path: Optional[Path] = None,
+    workers: Optional[int] = None,
+    compact_json: bool = False,
+    delta_only: bool = False,
+    logger=None,
+) -> Dict[str, Any]:
+    """JSONL 작업을 병렬로 실행한다. 예: run_pipeline_batch(config_path=..., jobs_path=Path("jobs.jsonl"), output_dir=Path("output/batch"))
+
+    작업 한 줄 예: {"site_spec": "specs/a.json", "template_id": "t1", "output_dir": "output/a"}
+    adapter/elementor를 작업에 적지 않으면 인자로 받은 기본 경로를 쓴다.
+    사이트마다 템플릿 기준 델타(elementor_delta.json)를 저장하고, delta_only면 patched_elementor.json은 쓰지 않는다.
+    각 워커는 (adapter, elementor) 조합마다 템플릿을 한 번만 읽고 컴파일해 재사용한다.
+    """
+
+    config = read_json_file(config_path)
+    output_root = ensure_directory(output_dir)
+    jobs = list(_read_jobs(jobs_path, output_root, adapter_path, elementor_path, compact_json))
+    for job in jobs:
+        job["delta_only"] = delta_only
+    if not jobs:
+        raise FriendlyError(user_message=f"실행할 작업이 없습니다: {jobs_path}")
+
+    worker_count = resolve_worker_count(workers, len(jobs))
+    if logger:
+        logger.info("일괄 실행: 작업 %s개, 워커 %s개", len(jobs), worker_count)
+
+    started = perf_counter()
+    if worker_count == 1:
+        results = [_run_job(job, config) for job in jobs]
+    else:
+        results = _run_bounded(jobs, config, worker_count)
+    elapsed_seconds = perf_counter() - started
+
+    report = _build_batch_report(
+        jobs_path=jobs_path,
+        worker_count=worker_count,
+        results=results,
+        elapsed_seconds=elapsed_seconds,
+    )
+    report_path = output_root / BATCH_REPORT_NAME
+    write_json_file(report_path, report)
+
+    return {"batch_report_path": str(report_path), **report["summary"]}
+
+
+def _read_jobs(
+    jobs_path: Path,
+    output_root: Path,
+    default_adapter: Optional[Path],
+    default_elementor: Optional[Path],
+    compact_json: bool,
+) -> Iterator[Dict[str, Any]]:
+    """JSONL 작업 파일을 읽어 실행 가능한 작업으로 만든다. 예: list(_read_jobs(Path("jobs.jsonl"), ...))
+
+    잘못된 줄은 건너뛰지 않고 실패 작업으로 남겨 리포트에 보이게 한다.
+    """
+
+    try:
+        lines = jobs_path.read_text(encoding="utf-8").splitlines()
+    except OSError as error:
+        raise FriendlyError(
+            user_message=f"작업 파일을 읽을 수 없습니다: {jobs_path}",
+            detail=str(error),
+        ) from error
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        job: Dict[str, Any] = {"line": line_number, "job_id": f"job-{line_number}", "compact_json": compact_json}
+        try:
+            entry = json.loads(line)
+            if not isinstance(entry, dict):
+                raise ValueError("작업은 JSON 객체여야 합니다.")
+        except ValueError as error:
+            job["error"] = f"작업 줄을 해석할 수 없습니다: {error}"
+            yield job
+            continue
+
+        job_id = entry.get("job_id")
+        if not job_id:
+            job_id = f"{entry['template_id']}-{line_number}" if entry.get("template_id") else job["job_id"]
+        adapter = entry.get("adapter") or default_adapter
+        elementor = entry.get("elementor") or default_elementor
+        job.update(
+            {
+                "job_id": str(job_id),
+                "template_id": entry.get("template_id"),
+                "site_spec": entry.get("site_spec"),
+                "adapter": str(adapter) if adapter else None,
+                "elementor": str(elementor) if elementor else None,
+                "output_dir": str(entry.get("output_dir") or output_root / str(job_id)),
+            }
+        )
+        missing = [name for name in ("site_spec", "adapter", "elementor") if not job[name]]
+        if missing:
+            job["error"] = f"작업에 경로가 없습니다: {', '.join(missing)}"
+        yield job
+
+
+def _run_bounded(jobs: List[Dict[str, Any]], config: Dict[str, Any], worker_count: int) -> List[Dict[str, Any]]:
+    """제출 중인 작업 수를 제한하며 프로세스 풀로 실행한다. 예: _run_bounded(jobs, config, 4)"""
+
+    # 작업이 수만 개여도 대기 큐가 커지지 않도록 워커 수의 2배까지만 미리 제출한다.
+    window = worker_count * 2
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    pending: Dict[Future, int] = {}
+    next_index = 0
+
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        while next_index < len(jobs) or pending:
+            while next_index < len(jobs) and len(pending) < window:
+                pending[executor.submit(_run_job, jobs[next_index], config)] = next_index
+                next_index += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    results[index] = future.result()
+                except Exception as error:
+                    # 워커 프로세스가 죽은 경우 등: 해당 작업만 실패로 기록한다.
+                    results[index] = _failure_record(jobs[index], "워커 실행 실패", str(error), 0.0)
+
+    return [result for result in results if result is not None]
+
+
+def _run_job(job: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """워커에서 사이트 하나를 만든다. 예: _run_job(job, config)"""
+
+    started = perf_counter()
+    if job.get("error"):
+        return _failure_record(job, job["error"], None, 0.0)
+
+    try:
+        plan = _load_plan(job["adapter"], job["elementor"])
+        timer = StageTimer()
+        with timer.span("read_site_spec"):
+            site_spec = read_json_file(job["site_spec"])
+        with timer.span("validate"):
+            validate_site_spec(site_spec)
+
+        patch_stats: Dict[str, Any] = {}
+        elementor_delta: List[Dict[str, Any]] = []
+        output_root = ensure_directory(job["output_dir"])
+        # 한글: 결과는 리스트에 모으지 않고 만들어지는 대로 JSONL에 쓰며 상태별 개수를 같이 센다.
+        with timer.span("patch") as span, PatchResultWriter(output_root / PATCH_RESULTS_FILE_NAME) as results_writer:
+            patched_elementor, _ = plan.apply(
+                site_spec,
+                copy_on_write=True,
+                stats=patch_stats,
+                delta=elementor_delta,
+                sink=results_writer,
+            )
+            span["element_count"] = patch_stats["element_count"]
+            span["patch_count"] = results_writer.summary.counts["total_patches"]
+
+        compact = job.get("compact_json", False)
+        with timer.span("write_outputs"):
+            if not job.get("delta_only"):
+                write_json_file(output_root / "patched_elementor.json", patched_elementor, compact=compact)
+            delta_document = build_delta_document(elementor_delta, job["elementor"], _template_sha256(job["elementor"]))
+            write_json_file(output_root / DELTA_FILE_NAME, delta_document, compact=compact)
+
+        run_report = build_run_report(
+            config=config,
+            site_spec_path=Path(job["site_spec"]),
+            adapter_path=Path(job["adapter"]),
+            elementor_path=Path(job["elementor"]),
+            output_dir=output_root,
+            patch_summary=results_writer.summary.to_dict(),
+            patch_stats=patch_stats,
+            timings=timer.to_report(),
+            deps=default_dependencies(),
+            delta_only=bool(job.get("delta_only")),
+        )
+        write_json_file(output_root / "run_report.json", run_report)
+    except FriendlyError as error:
+        return _failure_record(job, error.user_message, error.detail, perf_counter() - started)
+    except Exception as error:
+        return _failure_record(job, "예상치 못한 오류", str(error), perf_counter() - started)
+
+    return {
+        "job_id": job["job_id"],
+        "line": job["line"],
+        "template_id": job.get("template_id"),
+        "status": "ok",
+        "output_dir": str(output_root),
+        "summary": run_report["summary"],
+        "elapsed_ms": round((perf_counter() - started) * 1000, 3),
+    }
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _load_plan(adapter_path: str, elementor_path: str) -> AdapterPlan:
+    """워커 프로세스 안에서 템플릿 플랜을 한 번만 만든다. 예: _load_plan("adapter.json", "elementor.json")
+
+    플랜은 copy-on-write로만 적용하므로 여러 사이트가 같은 원본 트리를 안전하게 공유한다.
+    """
+
+    adapter = read_json_file(adapter_path)
+    validate_adapter(adapter)
+    return compile_adapter(adapter, read_json_file(elementor_path))
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _template_sha256(elementor_path: str) -> str:
+    """델타 기준 템플릿 해시를 워커마다 한 번만 계산한다. 예: _template_sha256("elementor.json")"""
+
+    return file_sha256(elementor_path)
+
+
+def _failure_record(
+    job: Dict[str, Any],
+    message: str,
+    detail: Optional[str],
+    elapsed_seconds: float,
+) -> Dict[str, Any]:
+    """실패 작업 레코드. 예: _failure_record(job, "site_spec 필수 키 누락", None, 0.1)"""
+
+    return {
+        "job_id": job["job_id"],
+        "line": job["line"],
+        "template_id": job.get("template_id"),
+        "status": "error",
+        "message": message,
+        "detail": detail,
+        "elapsed_ms": round(elapsed_seconds * 1000, 3),
+    }
+
+
+def _build_batch_report(
+    *,
+    jobs_path: Path,
+    worker_count: int,
+    results: List[Dict[str, Any]],
+    elapsed_seconds: float,
+) -> Dict[str, Any]:
+    """집계 리포트를 만든다. 예: _build_batch_report(jobs_path=..., worker_count=4, results=results, elapsed_seconds=3.2)"""
+
+    succeeded = [result for result in results if result["status"] == "ok"]
+    latencies = sorted(result["elapsed_ms"] for result in succeeded)
+
+    return {
+        "generated_at": get_iso_timestamp(),
+        "jobs_file": str(jobs_path),
+        "workers": worker_count,
+        "summary": {
+            "jobs": len(results),
+            "succeeded": len(succeeded),
+            "failed": len(results) - len(succeeded),
+            "elapsed_ms": round(elapsed_seconds * 1000, 3),
+            "sites_per_second": round(len(succeeded) / elapsed_seconds, 3) if elapsed_seconds > 0 else None,
+            "latency_ms": {
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "max": latencies[-1] if latencies else None,
+            },
+        },
+        "failures": [result for result in results if result["status"] != "ok"],
+        "jobs": results,
+    }
+
+
+def _percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """정렬된 값의 백분위수(nearest-rank). 예: _percentile([1, 2, 3, 4], 50) → 2"""
+
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
@@ -0,0 +1,239 @@
+# v0.5 - (템플릿 ID, 페이지 슬러그) 중복을 오류로 보고, 입력 안의 output_dir는 다시 스캔하지 않음 (2026-10-17)
+# 기능: 디렉터리/글롭의 Elementor JSON을 프로세스 풀로 스캔 (예: scan_elementor_batch(input_pattern="templates", ...))
+
+from __future__ import annotations
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .scan_cache import DEFAULT_SCAN_CACHE_MAX_BYTES, ScanCache
+from .scanner import scan_elementor_json
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import ensure_directory, write_json_file
+from .utils.time_utils import get_iso_timestamp
+
+LIBRARY_MANIFEST_NAME = "library_manifest.json"
+
+
+def scan_elementor_batch(
+    *,
+    input_pattern: str,
+    output_dir: Path,
+    template_id: str = "unknown",
+    max_candidates: int = 300,
+    max_depth: int = 12,
+    workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+    cache_max_bytes: int = DEFAULT_SCAN_CACHE_MAX_BYTES,
+    stream: bool = False,
+) -> Dict[str, Any]:
+    """여러 Elementor JSON을 병렬로 스캔한다. 예: scan_elementor_batch(input_pattern="templates/**/*.json", output_dir=Path("output"))
+
+    디렉터리를 주면 하위의 *.json을 모두 찾는다. 템플릿 ID는 상위 폴더 이름(t1/home.json → t1),
+    페이지 슬러그는 파일 이름에서 가져온다. 결과는 입력 경로 순서대로 정렬된다.
+    cache_dir를 주면 워커들이 같은 스캔 캐시를 공유해 바뀌지 않은 페이지는 다시 스캔하지 않는다.
+    output_dir가 입력 디렉터리 안에 있어도 그 아래 결과 파일은 다시 스캔하지 않는다.
+    (템플릿 ID, 페이지 슬러그)가 겹치는 파일(예: t1/home.json과 t1/v2/home.json)은 처음 파일만 스캔하고 나머지는 오류로 남긴다.
+    """
+
+    input_files = discover_input_files(input_pattern, exclude_dir=output_dir)
+    if not input_files:
+        raise FriendlyError(user_message=f"스캔할 Elementor JSON이 없습니다: {input_pattern}")
+
+    output_root = ensure_directory(output_dir)
+    input_root = Path(input_pattern) if Path(input_pattern).is_dir() else None
+    jobs = [
+        _build_job(
+            input_path=input_path,
+            input_root=input_root,
+            output_root=output_root,
+            default_template_id=template_id,
+            max_candidates=max_candidates,
+            max_depth=max_depth,
+        )
+        for input_path in input_files
+    ]
+    for job in jobs:
+        job["cache_dir"] = str(cache_dir) if cache_dir else None
+        job["cache_max_bytes"] = cache_max_bytes
+        job["stream"] = stream
+
+    jobs, duplicates = _split_duplicate_jobs(jobs)
+
+    worker_count = resolve_worker_count(workers, len(jobs))
+    started = perf_counter()
+    if worker_count == 1:
+        results = [_scan_job(job) for job in jobs]
+    else:
+        # executor.map은 입력 순서를 유지하므로 결과 순서가 항상 같다.
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            results = list(executor.map(_scan_job, jobs))
+    if duplicates:
+        order = {str(input_path): position for position, input_path in enumerate(input_files)}
+        results = sorted(results + duplicates, key=lambda result: order[result["source_file"]])
+    elapsed_ms = round((perf_counter() - started) * 1000, 3)
+
+    library_manifest = {
+        "generated_at": get_iso_timestamp(),
+        "input": input_pattern,
+        "workers": worker_count,
+        "summary": {
+            "file_count": len(results),
+            "scanned": sum(1 for result in results if result["status"] == "ok"),
+            "errors": sum(1 for result in results if result["status"] == "error"),
+            "candidate_count": sum(result.get("candidate_count", 0) for result in results),
+            "cache_hits": sum(1 for result in results if result.get("cache") == "hit"),
+            "cache_misses": sum(1 for result in results if result.get("cache") == "miss"),
+            "elapsed_ms": elapsed_ms,
+            "scan_ms_total": round(sum(result["elapsed_ms"] for result in results), 3),
+        },
+        "files": results,
+    }
+    library_manifest_path = output_root / LIBRARY_MANIFEST_NAME
+    write_json_file(library_manifest_path, library_manifest)
+
+    return {
+        "library_manifest_path": str(library_manifest_path),
+        **library_manifest["summary"],
+        "workers": worker_count,
+    }
+
+
+def discover_input_files(input_pattern: str, exclude_dir: Optional[Path] = None) -> List[Path]:
+    """디렉터리 또는 글롭에서 JSON 파일 목록을 정렬해 반환한다. exclude_dir 아래 파일은 뺀다. 예: discover_input_files("templates", exclude_dir=Path("templates/output"))"""
+
+    pattern_path = Path(input_pattern)
+    if pattern_path.is_dir():
+        candidates = pattern_path.rglob("*.json")
+    elif pattern_path.is_file():
+        candidates = [pattern_path]
+    else:
+        candidates = (Path(item) for item in glob.glob(input_pattern, recursive=True))
+
+    files = (path for path in candidates if path.is_file())
+    if exclude_dir is not None:
+        excluded = Path(exclude_dir).resolve()
+        files = (path for path in files if excluded not in path.resolve().parents)
+    return sorted(files)
+
+
+def resolve_worker_count(workers: Optional[int], job_count: int) -> int:
+    """워커 수를 결정한다. 예: resolve_worker_count(None, 180)"""
+
+    requested = workers if workers and workers > 0 else (os.cpu_count() or 1)
+    return max(1, min(requested, job_count))
+
+
+def page_identity(
+    input_path: Path,
+    input_root: Optional[Path],
+    default_template_id: str = "unknown",
+) -> Tuple[str, str]:
+    """입력 파일의 (템플릿 ID, 페이지 슬러그). 예: page_identity(Path("templates/t1/home.json"), Path("templates")) → ("t1", "home")"""
+
+    # 디렉터리 입력이면 첫 번째 하위 폴더, 글롭 입력이면 상위 폴더 이름을 템플릿 ID로 쓴다.
+    template_id = default_template_id
+    relative_parts = input_path.parent.relative_to(input_root).parts if input_root else ()
+    if relative_parts:
+        template_id = relative_parts[0]
+    elif input_root is None and default_template_id == "unknown" and input_path.parent.name:
+        template_id = input_path.parent.name
+    return template_id, input_path.stem
+
+
+def _build_job(
+    *,
+    input_path: Path,
+    input_root: Optional[Path],
+    output_root: Path,
+    default_template_id: str,
+    max_candidates: int,
+    max_depth: int,
+) -> Dict[str, Any]:
+    """파일 하나의 스캔 작업을 만든다. 예: _build_job(input_path=Path("t1/home.json"), ...)"""
+
+    template_id, page_slug = page_identity(input_path, input_root, default_template_id)
+    return {
+        "input_path": str(input_path),
+        "output_dir": str(output_root / template_id / page_slug),
+        "template_id": template_id,
+        "page_slug": page_slug,
+        "max_candidates": max_candidates,
+        "max_depth": max_depth,
+    }
+
+
+def _split_duplicate_jobs(jobs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """같은 (템플릿 ID, 페이지 슬러그)로 가는 작업을 나눈다. (스캔할 작업, 오류 기록). 예: _split_duplicate_jobs(jobs)
+
+    같은 output_dir에 manifest를 덮어쓰지 않도록 처음 작업만 남긴다.
+    """
+
+    owners: Dict[Tuple[str, str], str] = {}
+    unique_jobs: List[Dict[str, Any]] = []
+    duplicates: List[Dict[str, Any]] = []
+    for job in jobs:
+        identity = (job["template_id"], job["page_slug"])
+        owner = owners.setdefault(identity, job["input_path"])
+        if owner == job["input_path"]:
+            unique_jobs.append(job)
+            continue
+        duplicates.append(
+            {
+                "source_file": job["input_path"],
+                "template_id": job["template_id"],
+                "page_slug": job["page_slug"],
+                "status": "error",
+                "message": f"템플릿 ID/페이지 슬러그가 겹칩니다: {identity[0]}/{identity[1]}",
+                "detail": f"먼저 찾은 파일: {owner}",
+                "elapsed_ms": 0.0,
+            }
+        )
+    return unique_jobs, duplicates
+
+
+def _scan_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """워커 프로세스에서 파일 하나를 스캔한다. 예: _scan_job(job)"""
+
+    started = perf_counter()
+    record: Dict[str, Any] = {
+        "source_file": job["input_path"],
+        "template_id": job["template_id"],
+        "page_slug": job["page_slug"],
+    }
+
+    try:
+        cache = ScanCache(job["cache_dir"], job["cache_max_bytes"]) if job.get("cache_dir") else None
+        result = scan_elementor_json(
+            input_path=Path(job["input_path"]),
+            output_dir=Path(job["output_dir"]),
+            page_slug=job["page_slug"],
+            template_id=job["template_id"],
+            max_candidates=job["max_candidates"],
+            max_depth=job["max_depth"],
+            cache=cache,
+            stream=job.get("stream", False),
+        )
+        if cache is not None:
+            record["cache"] = result["cache"]["status"]
+        record.update(
+            {
+                "status": "ok",
+                "manifest_path": result["manifest_path"],
+                "adapter_skeleton_path": result["adapter_skeleton_path"],
+                "candidate_count": result["candidate_count"],
+                "stats": result["stats"],
+            }
+        )
+    except FriendlyError as error:
+        # 한 파일이 실패해도 나머지 라이브러리 스캔은 계속한다.
+        record.update({"status": "error", "message": error.user_message, "detail": error.detail})
+    except Exception as error:
+        record.update({"status": "error", "message": "예상치 못한 오류", "detail": str(error)})
+
+    record["elapsed_ms"] = round((perf_counter() - started) * 1000, 3)
+    return record
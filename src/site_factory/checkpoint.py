@@ -0,0 +1,117 @@
+# v0.2 - 단계 입력 지문(fingerprint) 추가 (2026-10-17)
+# 기능: 단계 입력 해시로 키를 만들어 단계 출력을 저장하고 재실행 때 재사용 (예: CheckpointStore(".cache/checkpoints"))
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import __version__
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import PathLike, ensure_directory, file_sha256, loads_json, write_json_file
+
+# 단계 출력 형식이 바뀌면 올려서 기존 체크포인트를 무효화한다.
+CHECKPOINT_FORMAT = 1
+# 산출물을 모두 쓴 뒤 마지막에 남기는 표식. 없으면 중간에 실패한 체크포인트로 본다.
+_COMPLETE_MARKER = "_complete.json"
+
+
+@dataclass
+class StageCheckpoint:
+    """단계 하나의 체크포인트 상태. 예: StageCheckpoint(name="patch", key="ab12...", status="reused")
+
+    status는 reused(저장된 출력 사용), computed(새로 계산), skipped(뒤 단계를 재사용해 필요 없음) 중 하나다.
+    """
+
+    name: str
+    key: str
+    status: str
+
+
+class CheckpointStore:
+    """내용 주소 기반 단계 체크포인트 저장소. 예: store = CheckpointStore(".cache/checkpoints")
+
+    키는 단계 이름 + 입력 해시(앞 단계 키 포함) + 파라미터 + 패키지 버전으로 만든다.
+    입력이 같으면 같은 키가 나오므로 재실행 시 첫 번째로 바뀐 단계부터 다시 계산하면 된다.
+    """
+
+    def __init__(self, root_dir: PathLike) -> None:
+        self.root_dir = ensure_directory(root_dir)
+        self.stages: List[StageCheckpoint] = []
+
+    def stage_key(self, stage: str, *inputs: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """단계 키를 만든다. 예: store.stage_key("elementor_injection", "site_spec=<앞 단계 키>", params={"strict_path": True})"""
+
+        payload = {
+            "stage": stage,
+            "inputs": list(inputs),
+            "params": params or {},
+            "format": CHECKPOINT_FORMAT,
+            "version": __version__,
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def fingerprint(self, value: Any) -> str:
+        """단계 입력 하나의 지문. 파일 경로면 파일 내용, 아니면 JSON 값의 해시. 예: store.fingerprint(Path("site_spec.json"))"""
+
+        if isinstance(value, Path) and value.is_file():
+            return f"file:{file_sha256(value)}"
+        encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        return f"value:{hashlib.sha256(encoded).hexdigest()}"
+
+    def has(self, stage: str, key: str) -> bool:
+        """완료된 체크포인트가 있는지 확인한다. 예: store.has("patch", key)"""
+
+        return (self._entry_dir(stage, key) / _COMPLETE_MARKER).is_file()
+
+    def load(self, stage: str, key: str, name: str) -> Optional[Any]:
+        """저장된 산출물 하나를 읽는다. 없거나 손상되면 None. 예: store.load("patch", key, "patch_results")"""
+
+        try:
+            return loads_json((self._entry_dir(stage, key) / f"{name}.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def save(self, stage: str, key: str, artifacts: Dict[str, Any]) -> bool:
+        """단계 산출물을 저장한다. 실패해도 파이프라인은 계속한다. 예: store.save("patch", key, {"patch_results": results})"""
+
+        entry_dir = self._entry_dir(stage, key)
+        try:
+            for name, data in artifacts.items():
+                write_json_file(entry_dir / f"{name}.json", data, compact=True)
+            write_json_file(entry_dir / _COMPLETE_MARKER, {"stage": stage, "artifacts": sorted(artifacts)})
+        except FriendlyError:
+            # 체크포인트 저장 실패는 실행 결과에 영향을 주지 않는다. 다음 실행에서 다시 계산한다.
+            return False
+        return True
+
+    def discard(self, stage: str, key: str) -> None:
+        """손상된 체크포인트를 지운다. 예: store.discard("patch", key)"""
+
+        shutil.rmtree(self._entry_dir(stage, key), ignore_errors=True)
+
+    def record(self, stage: str, key: str, status: str) -> None:
+        """이번 실행에서 단계가 어떻게 처리됐는지 기록한다. 예: store.record("patch", key, "reused")"""
+
+        self.stages.append(StageCheckpoint(name=stage, key=key, status=status))
+
+    def to_report(self) -> Dict[str, Any]:
+        """run_report의 checkpoints 섹션을 만든다. 예: report["checkpoints"] = store.to_report()"""
+
+        computed = [stage.name for stage in self.stages if stage.status == "computed"]
+        return {
+            "dir": str(self.root_dir),
+            "reused": [stage.name for stage in self.stages if stage.status == "reused"],
+            "resumed_from": computed[0] if computed else None,
+            "stages": [asdict(stage) for stage in self.stages],
+        }
+
+    def _entry_dir(self, stage: str, key: str) -> Path:
+        """단계/키에 해당하는 디렉터리. 예: store._entry_dir("patch", key)"""
+
+        return self.root_dir / stage / key
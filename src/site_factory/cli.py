@@ -1,16 +1,29 @@
-# v0.2 - 스캐너 명령 추가 (2026-01-19)
+# v2.1 - --trace/--trace-memory 도움말을 실제 동작대로 정리 (2026-10-17)
 # 기능: 파이프라인/스캐너 실행을 위한 CLI 제공 (예: python -m site_factory.cli scan --input ...)
 
 import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from .adapter_lint import lint_adapters
+from .batch_pipeline import run_pipeline_batch
+from .batch_scanner import scan_elementor_batch
+from .contracts import validate_site_spec_file
+from .daemon import DEFAULT_DAEMON_HOST, DEFAULT_DAEMON_PORT, serve
+from .json_delta import apply_delta_file
+from .library_index import DEFAULT_LIBRARY_DB, DEFAULT_QUERY_LIMIT, adapter_from_library, index_library, query_library
+from .manifest_filter import filter_manifests, load_manifest_rules
 from .pipeline import default_dependencies, run_pipeline
-from .scanner import scan_elementor_json
+from .scan_cache import ScanCache
+from .scanner import analyze_elementor_json, scan_elementor_json
+from .section_rules import select_sections_batch
+from .template_diff import diff_template
 from .utils.error_utils import FriendlyError, build_user_friendly_message
+from .utils.io_utils import ensure_directory, read_json_file, write_json_file
 from .utils.log_utils import create_logger
+from .utils.trace_utils import StageTimer
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -22,7 +35,7 @@ def build_parser() -> argparse.ArgumentParser:
 
     parser.add_argument(
         "command",
-        choices=["run", "scan"],
+        choices=["run", "scan", "analyze", "scan-batch", "run-batch", "serve", "validate", "lint-adapter", "apply-delta", "filter-manifest", "index", "query", "diff-template", "auto-adapter", "select-sections"],
         help="실행할 명령",
     )
     parser.add_argument(
@@ -38,23 +51,33 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--adapter",
         default=None,
-        help="template_adapter.json 경로",
+        help="template_adapter.json 경로, diff-template는 id를 바꿀 어댑터 파일/디렉터리/글롭",
     )
     parser.add_argument(
         "--elementor",
         default=None,
-        help="Elementor JSON 경로",
+        help="Elementor JSON 경로 (lint-adapter는 파일 또는 templates/<template_id>/<post_slug>.json 디렉터리, diff-template는 새 판 템플릿)",
     )
     parser.add_argument(
         "--output-dir",
         default="output",
-        help="결과 저장 디렉터리",
+        help="결과 저장 디렉터리 (serve는 요청의 output_dir를 이 디렉터리 아래로만 저장)",
     )
     parser.add_argument(
         "--use-mock",
         action="store_true",
         help="Mock 데이터로 실행",
     )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="patched_elementor.json/elementor_delta.json을 들여쓰기 없이 저장 (run/run-batch 명령용, patch_results.jsonl은 항상 한 줄 한 레코드)",
+    )
+    parser.add_argument(
+        "--delta-only",
+        action="store_true",
+        help="patched_elementor.json 없이 템플릿 기준 델타(elementor_delta.json)만 저장 (run/run-batch 명령용)",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -64,17 +87,17 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--input",
         default=None,
-        help="Elementor JSON 입력 파일 경로 (scan 명령용)",
+        help="Elementor JSON 입력 파일 경로 (scan/analyze 명령용), scan-batch는 디렉터리 또는 글롭, run-batch는 작업 JSONL, serve는 템플릿 디렉터리, validate는 site_spec JSON/JSONL, lint-adapter는 어댑터 디렉터리 또는 글롭, apply-delta는 elementor_delta.json, diff-template는 이전 판 템플릿 JSON, filter-manifest는 manifest/후보 JSONL, index는 템플릿 디렉터리 또는 글롭, auto-adapter는 새 템플릿 페이지 JSON, select-sections는 템플릿 디렉터리 또는 글롭",
     )
     parser.add_argument(
         "--page-slug",
-        default="home",
-        help="페이지 슬러그 (scan 명령용)",
+        default=None,
+        help="페이지 슬러그 (scan 명령용, 기본: home), query는 결과를 이 페이지로 제한, auto-adapter는 어댑터 post_slug (기본: 파일 이름)",
     )
     parser.add_argument(
         "--template-id",
-        default="unknown",
-        help="템플릿 ID (scan 명령용)",
+        default=None,
+        help="템플릿 ID (scan 명령용, 기본: unknown), query는 결과를 이 템플릿으로 제한, auto-adapter는 어댑터 template_id (기본: 상위 폴더 이름)",
     )
     parser.add_argument(
         "--max-candidates",
@@ -88,11 +111,110 @@ def build_parser() -> argparse.ArgumentParser:
         type=int,
         help="Elementor 트리 최대 탐색 깊이 (scan 명령용)",
     )
+    parser.add_argument(
+        "--workers",
+        default=None,
+        type=int,
+        help="병렬 워커 수 (scan-batch/run-batch/select-sections 명령용, 기본: CPU 수), serve는 동시 처리 요청 수",
+    )
+    parser.add_argument(
+        "--scan-cache-dir",
+        default=None,
+        help="스캔 캐시 디렉터리 (scan/scan-batch 명령용, 지정 시 캐시 사용)",
+    )
+    parser.add_argument(
+        "--scan-cache-max-mb",
+        default=256,
+        type=int,
+        help="스캔 캐시 최대 용량(MB), 초과 시 오래된 항목부터 삭제",
+    )
+    parser.add_argument(
+        "--stream-json",
+        action="store_true",
+        help="큰 Elementor JSON을 전체 로드 없이 스트리밍으로 스캔 (scan/scan-batch 명령용)",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        default=None,
+        help="단계 체크포인트 디렉터리 (run 명령용, 지정 시 입력이 그대로인 단계는 재사용)",
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_DAEMON_HOST,
+        help="데몬 주소 (serve 명령용)",
+    )
+    parser.add_argument(
+        "--port",
+        default=DEFAULT_DAEMON_PORT,
+        type=int,
+        help="데몬 포트 (serve 명령용)",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="TCP 대신 사용할 Unix 소켓 경로 (serve 명령용)",
+    )
+    parser.add_argument(
+        "--rules",
+        default=None,
+        help="manifest 필터 규칙 JSON (filter-manifest 명령용, 없으면 기본 규칙), select-sections는 섹션 선택 규칙 JSON",
+    )
+    parser.add_argument(
+        "--db",
+        default=str(DEFAULT_LIBRARY_DB),
+        help="라이브러리 인덱스 SQLite 경로 (index/query/auto-adapter 명령용)",
+    )
+    parser.add_argument(
+        "--widget-type",
+        default=None,
+        help="위젯 타입으로 찾기 (query 명령용, 예: uicore-icon-box)",
+    )
+    parser.add_argument(
+        "--css-id",
+        default=None,
+        help="CSS ID로 찾기 (query 명령용)",
+    )
+    parser.add_argument(
+        "--has-css-id",
+        action="store_true",
+        help="CSS ID가 있는 요소만 (query 명령용)",
+    )
+    parser.add_argument(
+        "--element-id",
+        default=None,
+        help="Elementor 요소 id로 찾기 (query 명령용)",
+    )
+    parser.add_argument(
+        "--field-type",
+        default=None,
+        help="후보 field_type으로 찾기 (query 명령용, text/image/link)",
+    )
+    parser.add_argument(
+        "--text",
+        default=None,
+        help="후보 미리보기 텍스트 검색 (query 명령용, FTS)",
+    )
+    parser.add_argument(
+        "--limit",
+        default=DEFAULT_QUERY_LIMIT,
+        type=int,
+        help="최대 결과 수 (query 명령용)",
+    )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        help="run/scan의 단계별 소요 시간(timings)을 chrome://tracing/Perfetto에서 여는 Chrome trace JSON 파일로 저장할 경로",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="run/scan의 단계별 tracemalloc 최대 메모리도 timings/--trace에 기록 (느려짐)",
+    )
 
     return parser
 
 
-def run_command(args: argparse.Namespace) -> Dict[str, Any]:
+def run_command(args: argparse.Namespace, timer: Optional[StageTimer] = None) -> Dict[str, Any]:
     """명령을 실행한다. 예: run_command(args)"""
 
     logger = create_logger("site_factory", level_text=args.log_level)
@@ -108,6 +230,10 @@ def run_command(args: argparse.Namespace) -> Dict[str, Any]:
             use_mock=args.use_mock,
             logger=logger,
             dependencies=deps,
+            compact_json=args.compact_json,
+            delta_only=args.delta_only,
+            timer=timer,
+            checkpoint_dir=Path(args.checkpoint_dir) if args.checkpoint_dir else None,
         )
 
     if args.command == "scan":
@@ -116,8 +242,153 @@ def run_command(args: argparse.Namespace) -> Dict[str, Any]:
         return scan_elementor_json(
             input_path=Path(args.input),
             output_dir=Path(args.output_dir),
+            page_slug=args.page_slug or "home",
+            template_id=args.template_id or "unknown",
+            max_candidates=args.max_candidates,
+            max_depth=args.max_depth,
+            cache=(
+                ScanCache(args.scan_cache_dir, args.scan_cache_max_mb * 1024 * 1024)
+                if args.scan_cache_dir
+                else None
+            ),
+            stream=args.stream_json,
+            timer=timer,
+        )
+
+    if args.command == "scan-batch":
+        if not args.input:
+            raise FriendlyError(user_message="scan-batch 명령에는 --input(디렉터리 또는 글롭)이 필요합니다.")
+        return scan_elementor_batch(
+            input_pattern=args.input,
+            output_dir=Path(args.output_dir),
+            template_id=args.template_id or "unknown",
+            max_candidates=args.max_candidates,
+            max_depth=args.max_depth,
+            workers=args.workers,
+            cache_dir=Path(args.scan_cache_dir) if args.scan_cache_dir else None,
+            cache_max_bytes=args.scan_cache_max_mb * 1024 * 1024,
+            stream=args.stream_json,
+        )
+
+    if args.command == "run-batch":
+        if not args.input:
+            raise FriendlyError(user_message="run-batch 명령에는 --input(작업 JSONL)이 필요합니다.")
+        return run_pipeline_batch(
+            config_path=Path(args.config),
+            jobs_path=Path(args.input),
+            output_dir=Path(args.output_dir),
+            adapter_path=Path(args.adapter) if args.adapter else None,
+            elementor_path=Path(args.elementor) if args.elementor else None,
+            workers=args.workers,
+            compact_json=args.compact_json,
+            delta_only=args.delta_only,
+            logger=logger,
+        )
+
+    if args.command == "serve":
+        if not args.input:
+            raise FriendlyError(user_message="serve 명령에는 --input(템플릿 디렉터리)이 필요합니다.")
+        return serve(
+            templates_dir=Path(args.input),
+            host=args.host,
+            port=args.port,
+            socket_path=Path(args.socket) if args.socket else None,
+            workers=args.workers,
+            output_root=Path(args.output_dir),
+            logger=logger,
+        )
+
+    if args.command == "validate":
+        if not args.input:
+            raise FriendlyError(user_message="validate 명령에는 --input(site_spec JSON 또는 JSONL)이 필요합니다.")
+        return validate_site_spec_file(input_path=Path(args.input), output_dir=Path(args.output_dir))
+
+    if args.command == "lint-adapter":
+        if not args.input or not args.elementor:
+            raise FriendlyError(user_message="lint-adapter 명령에는 --input(어댑터)과 --elementor(파일 또는 템플릿 디렉터리)가 필요합니다.")
+        return lint_adapters(
+            input_pattern=args.input,
+            elementor_path=Path(args.elementor),
+            output_dir=Path(args.output_dir),
+            site_spec=read_json_file(args.site_spec) if args.site_spec else None,
+        )
+
+    if args.command == "apply-delta":
+        if not args.input or not args.elementor:
+            raise FriendlyError(user_message="apply-delta 명령에는 --input(델타 파일)과 --elementor(기준 템플릿)가 필요합니다.")
+        output_root = ensure_directory(args.output_dir)
+        patched_path = output_root / "patched_elementor.json"
+        write_json_file(patched_path, apply_delta_file(args.input, args.elementor), compact=args.compact_json)
+        return {"patched_elementor": str(patched_path)}
+
+    if args.command == "filter-manifest":
+        if not args.input:
+            raise FriendlyError(user_message="filter-manifest 명령에는 --input(manifest.json, 후보 JSONL, 디렉터리 또는 글롭)이 필요합니다.")
+        return filter_manifests(
+            input_pattern=args.input,
+            output_dir=Path(args.output_dir),
+            rules=load_manifest_rules(args.rules),
+        )
+
+    if args.command == "index":
+        if not args.input:
+            raise FriendlyError(user_message="index 명령에는 --input(템플릿 디렉터리 또는 글롭)이 필요합니다.")
+        return index_library(input_pattern=args.input, db_path=Path(args.db))
+
+    if args.command == "query":
+        return query_library(
+            Path(args.db),
+            widget_type=args.widget_type,
+            css_id=args.css_id,
+            has_css_id=args.has_css_id,
+            element_id=args.element_id,
+            template_id=args.template_id,
             page_slug=args.page_slug,
+            field_type=args.field_type,
+            text=args.text,
+            limit=args.limit,
+        )
+
+    if args.command == "select-sections":
+        if not args.input or not args.rules:
+            raise FriendlyError(user_message="select-sections 명령에는 --input(템플릿 디렉터리 또는 글롭)과 --rules(섹션 선택 규칙 JSON)가 필요합니다.")
+        return select_sections_batch(
+            input_pattern=args.input,
+            rules_path=Path(args.rules),
+            output_dir=Path(args.output_dir),
+            workers=args.workers,
+        )
+
+    if args.command == "auto-adapter":
+        if not args.input:
+            raise FriendlyError(user_message="auto-adapter 명령에는 --input(새 템플릿 페이지 JSON)이 필요합니다.")
+        return adapter_from_library(
+            input_path=Path(args.input),
+            db_path=Path(args.db),
+            output_dir=Path(args.output_dir),
             template_id=args.template_id,
+            page_slug=args.page_slug,
+        )
+
+    if args.command == "diff-template":
+        if not args.input or not args.elementor:
+            raise FriendlyError(user_message="diff-template 명령에는 --input(이전 판 템플릿)과 --elementor(새 판 템플릿)가 필요합니다.")
+        return diff_template(
+            old_path=Path(args.input),
+            new_path=Path(args.elementor),
+            output_dir=Path(args.output_dir),
+            adapter_pattern=args.adapter,
+        )
+
+    if args.command == "analyze":
+        if not args.input:
+            raise FriendlyError(user_message="analyze 명령에는 --input이 필요합니다.")
+        return analyze_elementor_json(
+            input_path=Path(args.input),
+            output_dir=Path(args.output_dir),
+            page_slug=args.page_slug or "home",
+            template_id=args.template_id or "unknown",
+            site_spec=read_json_file(args.site_spec) if args.site_spec else None,
             max_candidates=args.max_candidates,
             max_depth=args.max_depth,
         )
@@ -131,10 +402,13 @@ def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
 
+    timer = StageTimer(track_memory=args.trace_memory)
     try:
-        result = run_command(args)
+        result = run_command(args, timer)
         # 결과 요약을 콘솔에 표시한다.
         print(json.dumps(result, ensure_ascii=False, indent=2))
+        if args.trace:
+            write_json_file(args.trace, timer.to_chrome_trace())
         return 0
     except FriendlyError as error:
         print(f"[오류] {error.user_message}", file=sys.stderr)
@@ -144,6 +418,8 @@ def main() -> int:
     except Exception as error:
         print(f"[오류] {build_user_friendly_message(error)}", file=sys.stderr)
         return 1
+    finally:
+        timer.close()
 
 
 if __name__ == "__main__":
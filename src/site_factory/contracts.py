@@ -1,11 +1,20 @@
-# v0.1 - 계약(스키마) 검증 추가 (2026-01-16)
-# 기능: site_spec / adapter 필수 키 검증 (예: validate_site_spec(site_spec))
+# v0.5 - 템플릿 폴더의 어댑터 파일 이름(ADAPTER_FILE_NAME)을 데몬에서 옮겨 옴 (2026-10-17)
+# 기능: site_spec / adapter 필수 키·타입·길이·형식 검증 (예: validate_site_spec(site_spec), validate_site_specs(specs))
 
-from typing import Any, Dict, List
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .utils.dict_utils import has_nested_value
 from .utils.error_utils import FriendlyError
+from .utils.io_utils import ensure_directory, loads_json, read_bytes_file, write_json_file
 
+VALIDATION_REPORT_NAME = "validation_report.json"
+# templates/<template_id>/ 폴더 안에서 어댑터로 읽는 파일 이름. 나머지 *.json은 페이지(파일 이름 = page_slug)다.
+ADAPTER_FILE_NAME = "adapter.json"
 
 REQUIRED_SITE_SPEC_KEYS: List[str] = [
     "brand.name",
@@ -26,18 +35,149 @@ REQUIRED_SITE_SPEC_KEYS: List[str] = [
     "seo.organization.url",
 ]
 
+# 값 형식 검사용 정규식. LLM이 자주 틀리는 부분(스킴 없는 URL, 색상 이름)만 잡을 만큼 느슨하게 둔다.
+_FORMAT_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    "url": re.compile(r"https?://[^\s/?#]+[^\s]*", re.IGNORECASE),
+    # 버튼 링크는 같은 페이지 앵커(#, #contact)나 사이트 안 경로(/pricing)도 쓴다.
+    "link": re.compile(r"https?://[^\s/?#]+[^\s]*|#[^\s]*|/[^\s]*", re.IGNORECASE),
+    "email": re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+"),
+    "color": re.compile(
+        r"#(?:[0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})|rgba?\(\s*[\d.%\s,/]+\)",
+        re.IGNORECASE,
+    ),
+}
+_FORMAT_LABELS = {"url": "http(s) URL", "link": "링크(http(s) URL, #앵커, /경로)", "email": "이메일", "color": "색상(#hex 또는 rgb())"}
+_KIND_TYPES: Dict[str, Tuple[type, ...]] = {
+    "str": (str,),
+    "list": (list,),
+    "dict": (dict,),
+}
+_KIND_LABELS = {"str": "문자열", "list": "리스트", "dict": "객체"}
 
-def validate_site_spec(site_spec: Dict[str, Any]) -> Dict[str, Any]:
-    """site_spec 필수 키를 검증한다. 예: validate_site_spec(site_spec)"""
 
-    missing_keys = [
-        key for key in REQUIRED_SITE_SPEC_KEYS if not has_nested_value(site_spec, key)
-    ]
+@dataclass(frozen=True)
+class FieldRule:
+    """필드 하나의 규칙. 예: FieldRule(max_length=70), FieldRule(kind="list", items=FieldRule(format="url"))
+
+    필수 여부는 REQUIRED_SITE_SPEC_KEYS로 정한다. 필수 문자열은 공백만 있으면 비어 있는 것으로 본다.
+    """
+
+    kind: str = "str"
+    max_length: Optional[int] = None
+    format: Optional[str] = None
+    items: Optional["FieldRule"] = None
+
+
+# 필수 키와 함께 자주 쓰는 선택 키의 타입/길이/형식 규칙. 길이는 Elementor 레이아웃과 검색 결과 표시에 맞춘 상한이다.
+SITE_SPEC_FIELD_RULES: Dict[str, FieldRule] = {
+    "brand.name": FieldRule(max_length=80),
+    "brand.tagline": FieldRule(max_length=200),
+    "brand.contact.email": FieldRule(max_length=254, format="email"),
+    "brand.contact.phone": FieldRule(max_length=40),
+    "brand.contact.address": FieldRule(max_length=300),
+    "design.colors.primary": FieldRule(max_length=40, format="color"),
+    "design.colors.secondary": FieldRule(max_length=40, format="color"),
+    "design.colors.accent": FieldRule(max_length=40, format="color"),
+    "design.colors.background": FieldRule(max_length=40, format="color"),
+    "design.colors.text": FieldRule(max_length=40, format="color"),
+    "design.fonts.heading": FieldRule(max_length=100),
+    "design.fonts.body": FieldRule(max_length=100),
+    "pages.home.hero.h1": FieldRule(max_length=200),
+    "pages.home.hero.sub": FieldRule(max_length=500),
+    "pages.home.hero.cta_text": FieldRule(max_length=60),
+    "pages.home.hero.cta_url": FieldRule(max_length=2048, format="link"),
+    "pages.home.hero.image_alt": FieldRule(max_length=300),
+    "seo.home.title": FieldRule(max_length=120),
+    "seo.home.description": FieldRule(max_length=320),
+    "seo.organization.name": FieldRule(max_length=120),
+    "seo.organization.url": FieldRule(max_length=2048, format="url"),
+    "seo.organization.logo": FieldRule(max_length=2048, format="url"),
+    "seo.organization.sameAs": FieldRule(kind="list", items=FieldRule(max_length=2048, format="url")),
+}
+
+
+@dataclass
+class ContractError(FriendlyError):
+    """검증 실패. errors에 모든 위반이 경로와 함께 들어 있다. 예: except ContractError as error: error.errors"""
+
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class _SchemaNode:
+    """컴파일된 스키마 트리의 노드. 예: _SITE_SPEC_SCHEMA.children"""
+
+    __slots__ = ("path", "rule", "required", "children", "required_paths")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.rule: Optional[FieldRule] = None
+        self.required = False
+        self.children: Dict[str, _SchemaNode] = {}
+        # 이 노드 아래(자신 포함) 필수 키. 중간 객체가 통째로 없을 때 한 번에 누락으로 보고한다.
+        self.required_paths: Tuple[str, ...] = ()
+
+
+def compile_schema(
+    required_keys: Iterable[str],
+    field_rules: Optional[Dict[str, FieldRule]] = None,
+) -> _SchemaNode:
+    """점 경로 규칙을 중첩 트리로 컴파일한다. 예: compile_schema(REQUIRED_SITE_SPEC_KEYS, SITE_SPEC_FIELD_RULES)"""
+
+    root = _SchemaNode("")
+    required_keys = list(required_keys)
+    rules = dict(field_rules or {})
+    for key in required_keys:
+        rules.setdefault(key, FieldRule())
+
+    for key, rule in rules.items():
+        node = root
+        for name in key.split("."):
+            child = node.children.get(name)
+            if child is None:
+                child = _SchemaNode(f"{node.path}.{name}" if node.path else name)
+                node.children[name] = child
+            node = child
+        node.rule = rule
+        node.required = key in required_keys
+
+    _collect_required_paths(root)
+    return root
+
 
-    if missing_keys:
-        missing_text = ", ".join(missing_keys)
-        raise FriendlyError(
-            user_message=f"site_spec 필수 키가 누락되었습니다: {missing_text}"
+def _collect_required_paths(node: _SchemaNode) -> Tuple[str, ...]:
+    """노드마다 아래쪽 필수 키 목록을 채운다. 예: _collect_required_paths(root)"""
+
+    paths: List[str] = [node.path] if node.required else []
+    for child in node.children.values():
+        paths.extend(_collect_required_paths(child))
+    node.required_paths = tuple(paths)
+    return node.required_paths
+
+
+# 스키마는 모듈 로드 시 한 번만 컴파일한다.
+_SITE_SPEC_SCHEMA = compile_schema(REQUIRED_SITE_SPEC_KEYS, SITE_SPEC_FIELD_RULES)
+
+
+def collect_site_spec_errors(site_spec: Any) -> List[Dict[str, Any]]:
+    """site_spec을 한 번 순회하며 모든 위반을 모은다. 예: collect_site_spec_errors(site_spec) -> [{"path", "code", "message"}]"""
+
+    errors: List[Dict[str, Any]] = []
+    if not isinstance(site_spec, dict):
+        errors.append(_type_error("", "dict", site_spec))
+        return errors
+    _visit_node(_SITE_SPEC_SCHEMA, site_spec, errors)
+    return errors
+
+
+def validate_site_spec(site_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """site_spec 필수 키/타입/길이/형식을 검증한다. 실패 시 모든 위반을 담아 ContractError. 예: validate_site_spec(site_spec)"""
+
+    errors = collect_site_spec_errors(site_spec)
+    if errors:
+        raise ContractError(
+            user_message=_site_spec_error_message(errors),
+            detail=_format_errors(errors),
+            errors=errors,
         )
 
     return {
@@ -47,36 +187,231 @@ def validate_site_spec(site_spec: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def validate_adapter(adapter: Dict[str, Any]) -> Dict[str, Any]:
-    """template_adapter 기본 구조를 검증한다. 예: validate_adapter(adapter)"""
+def validate_site_specs(specs: Iterable[Any]) -> Dict[str, Any]:
+    """여러 site_spec을 예외 없이 검증한다(일괄 모드). 예: validate_site_specs(specs)["invalid"]
+
+    results에는 실패한 항목만 {"index", "errors"}로 남겨, 수천 개를 돌려도 결과가 커지지 않게 한다.
+    """
+
+    total = 0
+    failures: List[Dict[str, Any]] = []
+    for index, site_spec in enumerate(specs):
+        total += 1
+        errors = collect_site_spec_errors(site_spec)
+        if errors:
+            failures.append({"index": index, "errors": errors})
 
-    error_messages: List[str] = []
+    return {
+        "total": total,
+        "valid": total - len(failures),
+        "invalid": len(failures),
+        "results": failures,
+    }
 
-    if not isinstance(adapter.get("template_id"), str):
-        error_messages.append("adapter.template_id가 필요합니다.")
+
+def validate_site_spec_file(input_path: Path, output_dir: Path) -> Dict[str, Any]:
+    """site_spec JSON/JSONL 파일을 일괄 검증하고 validation_report.json을 저장한다. 예: validate_site_spec_file(Path("specs.jsonl"), Path("output"))
+
+    .jsonl은 한 줄에 site_spec 하나, .json은 site_spec 하나 또는 site_spec 리스트다.
+    해석할 수 없는 줄은 code "json" 위반으로 남기고 나머지는 계속 검증한다.
+    """
+
+    started = perf_counter()
+    raw = read_bytes_file(input_path)
+    failures: List[Dict[str, Any]] = []
+    total = 0
+
+    if input_path.suffix.lower() == ".jsonl":
+        for line_number, line in enumerate(raw.splitlines(), start=1):
+            if not line.strip():
+                continue
+            total += 1
+            try:
+                errors = collect_site_spec_errors(loads_json(line))
+            except ValueError as error:
+                errors = [{"path": "", "code": "json", "message": f"JSON을 해석할 수 없습니다: {error}"}]
+            if errors:
+                failures.append({"line": line_number, "errors": errors})
+    else:
+        try:
+            data = loads_json(raw)
+        except ValueError as error:
+            raise FriendlyError(
+                user_message=f"site_spec 파일을 해석할 수 없습니다: {input_path}",
+                detail=str(error),
+            ) from error
+        summary = validate_site_specs(data if isinstance(data, list) else [data])
+        total = summary["total"]
+        failures = summary["results"]
+
+    elapsed_seconds = perf_counter() - started
+    report = {
+        "input": str(input_path),
+        "summary": {
+            "total": total,
+            "valid": total - len(failures),
+            "invalid": len(failures),
+            "elapsed_ms": round(elapsed_seconds * 1000, 3),
+            "specs_per_second": round(total / elapsed_seconds, 1) if elapsed_seconds > 0 else None,
+        },
+        "failures": failures,
+    }
+    report_path = ensure_directory(output_dir) / VALIDATION_REPORT_NAME
+    write_json_file(report_path, report)
+
+    return {"validation_report_path": str(report_path), **report["summary"]}
+
+
+def collect_adapter_errors(adapter: Any) -> List[Dict[str, Any]]:
+    """template_adapter의 구조/타입 위반을 모두 모은다. 예: collect_adapter_errors(adapter)"""
+
+    errors: List[Dict[str, Any]] = []
+    if not isinstance(adapter, dict):
+        errors.append(_type_error("", "dict", adapter))
+        return errors
+
+    template_id = adapter.get("template_id")
+    if not isinstance(template_id, str) or not template_id.strip():
+        errors.append(_error("template_id", "missing", "비어 있지 않은 문자열이 필요합니다."))
 
     pages = adapter.get("pages")
     if not isinstance(pages, list) or not pages:
-        error_messages.append("adapter.pages는 비어있지 않은 리스트여야 합니다.")
+        errors.append(_error("pages", "type", "비어 있지 않은 리스트여야 합니다."))
+        return errors
+
+    for page_index, page in enumerate(pages):
+        page_path = f"pages[{page_index}]"
+        if not isinstance(page, dict):
+            errors.append(_type_error(page_path, "dict", page))
+            continue
+        post_slug = page.get("post_slug")
+        if post_slug is not None and not isinstance(post_slug, str):
+            errors.append(_type_error(f"{page_path}.post_slug", "str", post_slug))
+
+        patches = page.get("patches")
+        if not isinstance(patches, list):
+            errors.append(_type_error(f"{page_path}.patches", "list", patches))
+            continue
 
-    if isinstance(pages, list):
-        for page_index, page in enumerate(pages):
-            patches = page.get("patches")
-            if not isinstance(patches, list):
-                error_messages.append(f"pages[{page_index}].patches는 리스트여야 합니다.")
+        for patch_index, patch in enumerate(patches):
+            patch_path = f"{page_path}.patches[{patch_index}]"
+            if not isinstance(patch, dict):
+                errors.append(_type_error(patch_path, "dict", patch))
                 continue
+            for field_name in _ADAPTER_PATCH_FIELDS:
+                _check_patch_string(patch_path, field_name, patch.get(field_name), errors)
+            # 대상 요소는 element_id나 css_id 중 하나로 지정한다(패처는 css_id만 있는 패치도 적용한다).
+            target_fields = [name for name in _ADAPTER_TARGET_FIELDS if patch.get(name) is not None]
+            if not target_fields:
+                errors.append(_error(f"{patch_path}.element_id", "missing", "element_id 또는 css_id가 필요합니다."))
+            for field_name in target_fields:
+                _check_patch_string(patch_path, field_name, patch[field_name], errors)
 
-            for patch_index, patch in enumerate(patches):
-                for field_name in ("key", "element_id", "path", "op"):
-                    if field_name not in patch:
-                        error_messages.append(
-                            f"patches[{patch_index}]에 '{field_name}'가 필요합니다."
-                        )
+    return errors
 
-    if error_messages:
-        raise FriendlyError(user_message="; ".join(error_messages))
+
+def validate_adapter(adapter: Dict[str, Any]) -> Dict[str, Any]:
+    """template_adapter 구조를 검증한다. 실패 시 모든 위반을 담아 ContractError. 예: validate_adapter(adapter)"""
+
+    errors = collect_adapter_errors(adapter)
+    if errors:
+        raise ContractError(
+            user_message=f"adapter 검증에 실패했습니다: {_format_errors(errors)}",
+            detail=_format_errors(errors),
+            errors=errors,
+        )
 
     return {
         "status": "ok",
-        "page_count": len(pages) if isinstance(pages, list) else 0,
+        "page_count": len(adapter["pages"]),
     }
+
+
+_ADAPTER_PATCH_FIELDS = ("key", "path", "op")
+_ADAPTER_TARGET_FIELDS = ("element_id", "css_id")
+_MISSING = object()
+
+
+def _check_patch_string(patch_path: str, field_name: str, value: Any, errors: List[Dict[str, Any]]) -> None:
+    """패치의 문자열 필드 하나를 검사한다. 예: _check_patch_string("pages[0].patches[1]", "op", "set_text", errors)"""
+
+    if value is None:
+        errors.append(_error(f"{patch_path}.{field_name}", "missing", "필수 키가 없습니다."))
+    elif not isinstance(value, str):
+        errors.append(_type_error(f"{patch_path}.{field_name}", "str", value))
+    elif not value.strip():
+        errors.append(_error(f"{patch_path}.{field_name}", "empty", "빈 문자열입니다."))
+
+
+def _visit_node(node: _SchemaNode, mapping: Dict[str, Any], errors: List[Dict[str, Any]]) -> None:
+    """스키마에 있는 키만 따라 내려가며 검사한다. 예: _visit_node(_SITE_SPEC_SCHEMA, site_spec, errors)"""
+
+    for name, child in node.children.items():
+        value = mapping.get(name, _MISSING)
+        if value is _MISSING or value is None:
+            for path in child.required_paths:
+                errors.append(_error(path, "missing", "필수 키가 없습니다."))
+            continue
+
+        if child.rule is not None:
+            _check_value(child.path, child.rule, child.required, value, errors)
+        elif child.children:
+            if isinstance(value, dict):
+                _visit_node(child, value, errors)
+            else:
+                errors.append(_type_error(child.path, "dict", value))
+
+
+def _check_value(
+    path: str,
+    rule: FieldRule,
+    required: bool,
+    value: Any,
+    errors: List[Dict[str, Any]],
+) -> None:
+    """값 하나를 규칙으로 검사한다. 예: _check_value("seo.organization.url", rule, True, "https://...", errors)"""
+
+    if not isinstance(value, _KIND_TYPES[rule.kind]) or isinstance(value, bool):
+        errors.append(_type_error(path, rule.kind, value))
+        return
+
+    if rule.kind == "list":
+        if rule.items is not None:
+            for index, item in enumerate(value):
+                _check_value(f"{path}[{index}]", rule.items, True, item, errors)
+        return
+    if rule.kind != "str":
+        return
+
+    if required and not value.strip():
+        errors.append(_error(path, "empty", "빈 문자열입니다."))
+        return
+    if rule.max_length is not None and len(value) > rule.max_length:
+        errors.append(_error(path, "max_length", f"최대 {rule.max_length}자를 넘었습니다 (현재 {len(value)}자)."))
+    if rule.format is not None and value and not _FORMAT_PATTERNS[rule.format].fullmatch(value.strip()):
+        errors.append(_error(path, "format", f"{_FORMAT_LABELS[rule.format]} 형식이 아닙니다."))
+
+
+def _error(path: str, code: str, message: str) -> Dict[str, Any]:
+    return {"path": path, "code": code, "message": message}
+
+
+def _type_error(path: str, kind: str, value: Any) -> Dict[str, Any]:
+    return _error(path, "type", f"{_KIND_LABELS[kind]} 타입이어야 합니다 (현재 {type(value).__name__}).")
+
+
+def _site_spec_error_message(errors: List[Dict[str, Any]]) -> str:
+    """누락 키는 기존 문구 그대로, 나머지 위반은 경로와 함께 붙인다. 예: _site_spec_error_message(errors)"""
+
+    missing = [error["path"] for error in errors if error["code"] == "missing"]
+    invalid = [error for error in errors if error["code"] != "missing"]
+    parts = []
+    if missing:
+        parts.append(f"site_spec 필수 키가 누락되었습니다: {', '.join(missing)}")
+    if invalid:
+        parts.append(f"site_spec 값이 올바르지 않습니다: {_format_errors(invalid)}")
+    return " / ".join(parts)
+
+
+def _format_errors(errors: List[Dict[str, Any]]) -> str:
+    return " ".join(f"{error['path'] or '(root)'}: {error['message']}" for error in errors)
@@ -0,0 +1,105 @@
+# v0.1 - CSS ID 어댑터 생성 로직을 패키지로 이동 (2026-10-17)
+# 기능: CSS ID(_element_id)가 지정된 위젯으로 어댑터를 만든다 (예: build_cssid_adapter(css_id_map, "t1", "home"))
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from .element_index import get_root_element_list
+from .traversal import ElementVisit, ElementVisitor, run_visitors
+
+# 위젯 타입별 기본 경로
+CSSID_PATH_MAP: Dict[str, str] = {
+    "heading": "settings.title",
+    "text-editor": "settings.editor",
+    "button": "settings.text",
+    "image": "settings.image.url",
+    "icon-list": "settings.icon_list",
+    "highlighted-text": "settings.content",
+    "uicore-counter": "settings",  # Counter는 복합 필드
+    "uicore-icon-box": "settings",  # Icon Box도 복합 필드
+}
+
+# 위젯 타입별 op
+CSSID_OP_MAP: Dict[str, str] = {
+    "heading": "set_text",
+    "text-editor": "set_html",
+    "button": "set_text",
+    "image": "set_image",
+    "icon-list": "set_icon_list",
+    "highlighted-text": "set_highlighted_text",
+    "uicore-counter": "set_counter",
+    "uicore-icon-box": "set_iconbox",
+}
+
+
+class CssIdCollector(ElementVisitor):
+    """순회 방문자: CSS ID가 있는 위젯을 모은다. 예: run_visitors(elements, [CssIdCollector()])"""
+
+    def __init__(self) -> None:
+        self.css_id_map: List[Dict[str, Any]] = []
+
+    def visit(self, visit: ElementVisit) -> bool:
+        """요소 하나를 확인한다. 예: collector.visit(visit)"""
+
+        element = visit.element
+        settings = element.get("settings")
+        if not isinstance(settings, dict):
+            return False
+
+        css_id = settings.get("_element_id")
+        if not css_id:
+            return False
+
+        widget_type = element.get("widgetType") or element.get("elType")
+        # 컨테이너는 직접 주입 대상이 아니므로 제외한다.
+        if widget_type == "container":
+            return False
+
+        self.css_id_map.append(
+            {
+                "css_id": css_id,
+                "element_id": element.get("id"),
+                "widget_type": widget_type,
+                "path": CSSID_PATH_MAP.get(widget_type, "settings"),
+                "op": CSSID_OP_MAP.get(widget_type, "set_text"),
+            }
+        )
+        return False
+
+
+def collect_css_id_map(elementor_data: Any) -> List[Dict[str, Any]]:
+    """CSS ID가 있는 위젯 목록을 반환한다. 예: collect_css_id_map(elementor_data)"""
+
+    collector = CssIdCollector()
+    run_visitors(get_root_element_list(elementor_data), [collector])
+    return collector.css_id_map
+
+
+def build_cssid_adapter(
+    css_id_map: List[Dict[str, Any]],
+    template_id: str,
+    page_slug: str,
+) -> Dict[str, Any]:
+    """CSS ID 목록으로 어댑터를 만든다. 예: build_cssid_adapter(css_id_map, "t1", "home")"""
+
+    patches = [
+        {
+            "key": item["css_id"],
+            "element_id": item["element_id"],
+            "path": item["path"],
+            "op": item["op"],
+            "widget_type": item["widget_type"],
+        }
+        for item in css_id_map
+    ]
+
+    return {
+        "template_id": template_id,
+        "pages": [
+            {
+                "post_slug": page_slug,
+                "patches": patches,
+            }
+        ],
+    }
@@ -0,0 +1,688 @@
+# v0.6 - ADAPTER_FILE_NAME은 contracts에서 가져옴 (2026-10-17)
+# 기능: 템플릿/어댑터를 미리 읽고 인덱싱해 두고 HTTP(TCP 또는 Unix 소켓)로 scan/patch/generate_site/update_site 처리 (예: serve(templates_dir=Path("templates")))
+
+from __future__ import annotations
+
+import gc
+import os
+import socket
+import socketserver
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from time import monotonic, perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from . import __version__
+from .contracts import ADAPTER_FILE_NAME, validate_adapter, validate_site_spec
+from .patch_results import PATCH_RESULTS_FILE_NAME, PatchResultWriter, PatchSummary, iter_patch_results
+from .patcher import AdapterPlan, compile_adapter
+from .pipeline import summarize_patch_results
+from .scanner import analyze_elementor_page
+from .spec_diff import diff_site_spec
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import dumps_json, ensure_directory, file_signature, loads_json, read_json_file, write_json_file
+from .utils.time_utils import get_iso_timestamp
+
+DEFAULT_DAEMON_HOST = "127.0.0.1"
+DEFAULT_DAEMON_PORT = 8765
+MAX_REQUEST_BYTES = 32 * 1024 * 1024
+# 요청이 들어올 때 템플릿 파일 변경을 확인하는 최소 간격(초)
+DEFAULT_RELOAD_INTERVAL = 1.0
+# generate_site/update_site 요청의 output_dir는 이 디렉터리 기준 상대 경로만 받는다.
+DEFAULT_OUTPUT_ROOT = Path("output")
+
+
+@dataclass
+class DaemonRequestError(FriendlyError):
+    """HTTP 상태 코드를 가진 요청 오류. 예: raise DaemonRequestError("템플릿이 없습니다", status=404)"""
+
+    status: int = 400
+
+
+@dataclass
+class TemplatePage:
+    """미리 읽고 컴파일해 둔 템플릿 페이지. 예: library.get_page("t1", "home").plan"""
+
+    page_slug: str
+    path: Path
+    elementor_data: Any
+    plan: AdapterPlan
+
+
+@dataclass
+class TemplateEntry:
+    """템플릿 하나(어댑터 + 페이지들). 예: library.templates["t1"]"""
+
+    template_id: str
+    directory: Path
+    pages: Dict[str, TemplatePage]
+    signatures: Dict[str, Optional[List[int]]]
+    has_adapter: bool
+    loaded_at: str = field(default_factory=get_iso_timestamp)
+
+
+class TemplateLibrary:
+    """템플릿 디렉터리 전체를 메모리에 올려 둔다. 예: library = TemplateLibrary(Path("templates")); library.load_all()
+
+    templates/<template_id>/<page_slug>.json 이 Elementor 페이지, templates/<template_id>/adapter.json 이 어댑터다.
+    각 페이지는 어댑터 중 post_slug가 같은(또는 post_slug가 없는) 패치만으로 플랜을 컴파일해 요소 인덱스까지 만들어 둔다.
+    output_root는 요청이 결과를 저장할 수 있는 유일한 디렉터리다.
+    """
+
+    def __init__(self, root_dir: Path, logger=None, output_root: Path = DEFAULT_OUTPUT_ROOT) -> None:
+        self.root_dir = Path(root_dir)
+        self.logger = logger
+        self.output_root = Path(output_root)
+        self.templates: Dict[str, TemplateEntry] = {}
+        self.errors: Dict[str, str] = {}
+        # 읽기에 실패한 템플릿의 파일 서명. 파일이 그대로면 요청마다 다시 시도하지 않는다.
+        self._failed_signatures: Dict[str, Dict[str, Optional[List[int]]]] = {}
+
+    def load_all(self) -> None:
+        """모든 템플릿을 읽는다. 실패한 템플릿은 errors에 남기고 나머지는 계속 읽는다. 예: library.load_all()"""
+
+        if not self.root_dir.is_dir():
+            raise FriendlyError(user_message=f"템플릿 디렉터리를 찾을 수 없습니다: {self.root_dir}")
+        for directory in self._template_dirs():
+            self._load_into(directory)
+
+    def refresh(self) -> List[str]:
+        """파일이 바뀐/추가된/삭제된 템플릿만 다시 읽는다. 예: reloaded = library.refresh()"""
+
+        changed: List[str] = []
+        directories = {directory.name: directory for directory in self._template_dirs()}
+        for template_id in list(self.templates) + list(self.errors):
+            if template_id not in directories:
+                self.templates.pop(template_id, None)
+                self.errors.pop(template_id, None)
+                changed.append(template_id)
+
+        for template_id, directory in directories.items():
+            entry = self.templates.get(template_id)
+            signatures = _directory_signatures(directory)
+            if entry is not None and entry.signatures == signatures:
+                continue
+            if entry is None and self._failed_signatures.get(template_id) == signatures:
+                continue
+            self._load_into(directory)
+            changed.append(template_id)
+        return changed
+
+    def get_page(self, template_id: str, page_slug: str) -> TemplatePage:
+        """페이지를 찾는다. 없으면 404 오류. 예: library.get_page("t1", "home")"""
+
+        page = self.get_template(template_id).pages.get(page_slug)
+        if page is None:
+            _raise_not_found(f"템플릿 '{template_id}'에 페이지 '{page_slug}'가 없습니다.")
+        return page
+
+    def get_template(self, template_id: str) -> TemplateEntry:
+        """템플릿을 찾는다. 없으면 404 오류. 예: library.get_template("t1")"""
+
+        entry = self.templates.get(template_id)
+        if entry is None:
+            detail = self.errors.get(template_id)
+            _raise_not_found(f"템플릿을 찾을 수 없습니다: {template_id}", detail)
+        return entry
+
+    def summary(self) -> Dict[str, Any]:
+        """템플릿/페이지 목록과 요소 수. 예: library.summary()"""
+
+        return {
+            "templates": {
+                template_id: {
+                    "loaded_at": entry.loaded_at,
+                    "has_adapter": entry.has_adapter,
+                    "pages": {
+                        slug: {
+                            "element_count": len(page.plan.element_index.entries),
+                            "patch_count": len(page.plan.patches),
+                        }
+                        for slug, page in entry.pages.items()
+                    },
+                }
+                for template_id, entry in sorted(self.templates.items())
+            },
+            "errors": dict(self.errors),
+        }
+
+    @property
+    def page_count(self) -> int:
+        """읽어 둔 페이지 수. 예: library.page_count"""
+
+        return sum(len(entry.pages) for entry in self.templates.values())
+
+    def _template_dirs(self) -> List[Path]:
+        """템플릿 폴더 목록. 예: self._template_dirs()"""
+
+        try:
+            return sorted(path for path in self.root_dir.iterdir() if path.is_dir() and not path.name.startswith("."))
+        except OSError:
+            return []
+
+    def _load_into(self, directory: Path) -> None:
+        """템플릿 하나를 읽어 교체한다. 실패하면 이전 항목을 지우고 errors에 남긴다. 예: self._load_into(Path("templates/t1"))"""
+
+        template_id = directory.name
+        signatures = _directory_signatures(directory)
+        started = perf_counter()
+        try:
+            entry = _load_template(directory, signatures)
+        except FriendlyError as error:
+            self.templates.pop(template_id, None)
+            self.errors[template_id] = error.user_message
+            self._failed_signatures[template_id] = signatures
+            if self.logger:
+                self.logger.warning("템플릿을 읽지 못했습니다: %s (%s)", template_id, error.user_message)
+            return
+
+        # 요청 처리 중인 쪽은 이전 항목을 계속 쓰고, 다음 요청부터 새 항목을 본다.
+        self.templates[template_id] = entry
+        self.errors.pop(template_id, None)
+        self._failed_signatures.pop(template_id, None)
+        if self.logger:
+            self.logger.info(
+                "템플릿 로드: %s (페이지 %s개, %sms)",
+                template_id,
+                len(entry.pages),
+                round((perf_counter() - started) * 1000, 1),
+            )
+
+
+def serve(
+    *,
+    templates_dir: Path,
+    host: str = DEFAULT_DAEMON_HOST,
+    port: int = DEFAULT_DAEMON_PORT,
+    socket_path: Optional[Path] = None,
+    workers: Optional[int] = None,
+    reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+    output_root: Path = DEFAULT_OUTPUT_ROOT,
+    logger=None,
+) -> Dict[str, Any]:
+    """템플릿을 미리 읽고 요청을 처리한다. Ctrl+C로 멈춘다. 예: serve(templates_dir=Path("templates"), port=8765, output_root=Path("output"))
+
+    fork가 되는 OS에서는 요청마다 미리 읽어 둔 부모 프로세스를 fork해 처리하므로 템플릿 메모리를 copy-on-write로 공유한다.
+    템플릿 파일이 바뀌면 다음 요청 전에 부모에서 다시 읽어, 이후 fork되는 워커는 새 템플릿을 본다.
+    generate_site/update_site의 output_dir는 output_root 아래 상대 경로로만 저장된다.
+    """
+
+    started = perf_counter()
+    library = TemplateLibrary(templates_dir, logger=logger, output_root=ensure_directory(output_root))
+    library.load_all()
+    if not library.templates:
+        raise FriendlyError(
+            user_message=f"읽을 수 있는 템플릿이 없습니다: {templates_dir}",
+            detail="; ".join(f"{name}: {message}" for name, message in library.errors.items()) or None,
+        )
+    _freeze_heap()
+
+    server = _create_server(host=host, port=port, socket_path=socket_path)
+    server.library = library
+    server.logger = logger
+    server.reload_interval = reload_interval
+    server.next_reload_check = monotonic() + reload_interval
+    if workers and hasattr(server, "max_children"):
+        server.max_children = workers
+
+    address = str(socket_path) if socket_path else f"http://{host}:{server.server_address[1]}"
+    if logger:
+        logger.info(
+            "데몬 시작: %s (템플릿 %s개, 페이지 %s개, 준비 %sms, %s, 출력 루트 %s)",
+            address,
+            len(library.templates),
+            library.page_count,
+            round((perf_counter() - started) * 1000, 1),
+            "fork 워커" if _FORKING else "스레드 워커",
+            library.output_root,
+        )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path:
+            _remove_socket(socket_path)
+
+    return {
+        "address": address,
+        "templates": len(library.templates),
+        "pages": library.page_count,
+        "requests": server.request_count,
+    }
+
+
+def handle_request(
+    library: TemplateLibrary,
+    method: str,
+    path: str,
+    payload: Optional[Dict[str, Any]],
+) -> Tuple[int, Dict[str, Any]]:
+    """요청 하나를 처리해 (상태 코드, 응답)을 돌려준다. 예: handle_request(library, "POST", "/v1/patch", {...})
+
+    응답은 openapi.yaml의 /v1/ai/generate_site처럼 {"msg", "status", "data"} 형태다.
+    """
+
+    route = _ROUTES.get((method, path.rstrip("/") or "/"))
+    try:
+        if route is None:
+            raise DaemonRequestError(user_message=f"지원하지 않는 요청입니다: {method} {path}", status=404)
+        data = route(library, payload or {})
+    except DaemonRequestError as error:
+        return error.status, _error_body(error.status, error.user_message, error.detail)
+    except FriendlyError as error:
+        return 400, _error_body(400, error.user_message, error.detail)
+    except Exception as error:
+        return 500, _error_body(500, "예상치 못한 오류가 발생했습니다.", str(error))
+
+    return 200, {"msg": "Success", "status": 200, "data": data}
+
+
+def _health(library: TemplateLibrary, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """GET /v1/health. 예: _health(library, {})"""
+
+    return {
+        "version": __version__,
+        "pid": os.getpid(),
+        "templates": len(library.templates),
+        "pages": library.page_count,
+        "errors": dict(library.errors),
+    }
+
+
+def _list_templates(library: TemplateLibrary, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """GET /v1/templates. 예: _list_templates(library, {})"""
+
+    return library.summary()
+
+
+def _scan(library: TemplateLibrary, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """POST /v1/scan: 미리 읽어 둔 페이지에서 후보/어댑터/섹션을 뽑는다. 예: {"template_id": "t1", "page_slug": "home"}"""
+
+    template_id = _require_text(payload, "template_id")
+    page_slug = _require_text(payload, "page_slug")
+    page = library.get_page(template_id, page_slug)
+    analysis = analyze_elementor_page(
+        elementor_data=page.elementor_data,
+        page_slug=page_slug,
+        template_id=template_id,
+        site_spec=payload.get("site_spec"),
+        max_candidates=_optional_count(payload, "max_candidates", 300),
+        max_depth=_optional_count(payload, "max_depth", 12),
+    )
+    analysis.pop("options")
+    return {"template_id": template_id, "page_slug": page_slug, **analysis}
+
+
+def _patch(library: TemplateLibrary, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """POST /v1/patch: 페이지 하나에 site_spec을 적용한다. 예: {"template_id": "t1", "page_slug": "home", "site_spec": {...}}"""
+
+    template_id = _require_text(payload, "template_id")
+    page_slug = _require_text(payload, "page_slug")
+    site_spec = _require_site_spec(payload)
+    page = library.get_page(template_id, page_slug)
+
+    patch_stats: Dict[str, Any] = {}
+    patched_elementor, patch_results = page.plan.apply(site_spec, copy_on_write=True, stats=patch_stats)
+    return {
+        "template_id": template_id,
+        "page_slug": page_slug,
+        "summary": summarize_patch_results(patch_results),
+        "element_index": patch_stats,
+        "patch_results": patch_results,
+        "patched_elementor": patched_elementor,
+    }
+
+
+def _generate_site(library: TemplateLibrary, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """POST /v1/generate_site: 템플릿의 모든 페이지에 site_spec을 적용한다. 예: {"template_id": "t1", "site_spec": {...}, "output_dir": "example"}
+
+    output_dir(출력 루트 기준 상대 경로)가 있으면 페이지마다 <출력 루트>/<output_dir>/<page_slug>/patched_elementor.json, patch_results.jsonl을 저장하고,
+    없으면 include_documents가 true일 때만 패치된 문서를 응답에 넣는다. 결과는 적용하면서 바로 쓰고 세므로 모아 두지 않는다.
+    """
+
+    started = perf_counter()
+    template_id = _require_text(payload, "template_id")
+    site_spec = _require_site_spec(payload)
+    entry = library.get_template(template_id)
+    output_dir = _resolve_output_dir(library, payload["output_dir"]) if payload.get("output_dir") else None
+    compact_json = bool(payload.get("compact_json", False))
+
+    pages: Dict[str, Any] = {}
+    for page_slug, page in entry.pages.items():
+        if output_dir:
+            page_root = ensure_directory(output_dir / page_slug)
+            with PatchResultWriter(page_root / PATCH_RESULTS_FILE_NAME) as writer:
+                patched_elementor, _ = page.plan.apply(site_spec, copy_on_write=True, sink=writer)
+            write_json_file(page_root / "patched_elementor.json", patched_elementor, compact=compact_json)
+            pages[page_slug] = {"summary": writer.summary.to_dict(), "output_dir": str(page_root)}
+        elif payload.get("include_documents"):
+            patched_elementor, patch_results = page.plan.apply(site_spec, copy_on_write=True)
+            pages[page_slug] = {
+                "summary": summarize_patch_results(patch_results),
+                "patched_elementor": patched_elementor,
+                "patch_results": patch_results,
+            }
+        else:
+            summary = PatchSummary()
+            page.plan.apply(site_spec, copy_on_write=True, sink=summary)
+            pages[page_slug] = {"summary": summary.to_dict()}
+
+    return {
+        "template_id": template_id,
+        "output_dir": str(output_dir) if output_dir else None,
+        "pages": pages,
+        "elapsed_ms": round((perf_counter() - started) * 1000, 3),
+    }
+
+
+def _update_site(library: TemplateLibrary, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """POST /v1/update_site: 바뀐 site_spec 키를 읽는 패치만 다시 적용한다. 예: {"template_id": "t1", "previous_site_spec": {...}, "site_spec": {...}, "output_dir": "example"}
+
+    generate_site가 output_dir에 저장한 patched_elementor.json을 이전 결과로 쓴다.
+    바뀐 키는 previous_site_spec과의 diff로 구하거나 changed_keys로 직접 받는다.
+    영향받는 패치가 없는 페이지는 파일을 읽지도 않고, 실제로 내용이 바뀐 페이지만 다시 저장한다.
+    """
+
+    started = perf_counter()
+    template_id = _require_text(payload, "template_id")
+    site_spec = _require_site_spec(payload)
+    output_dir = _resolve_output_dir(library, _require_text(payload, "output_dir"))
+    entry = library.get_template(template_id)
+    compact_json = bool(payload.get("compact_json", False))
+
+    changed_keys = payload.get("changed_keys")
+    if changed_keys is None:
+        previous_spec = payload.get("previous_site_spec")
+        if not isinstance(previous_spec, dict):
+            raise DaemonRequestError(user_message="'previous_site_spec'(객체) 또는 'changed_keys'(리스트)가 필요합니다.")
+        changed_keys = diff_site_spec(previous_spec, site_spec)
+    elif not isinstance(changed_keys, list) or not all(isinstance(key, str) for key in changed_keys):
+        raise DaemonRequestError(user_message="'changed_keys'는 문자열 리스트여야 합니다.")
+
+    pages: Dict[str, Any] = {}
+    for page_slug, page in entry.pages.items():
+        if not page.plan.affected_patches(changed_keys):
+            pages[page_slug] = {"changed": False, "mode": "unchanged"}
+            continue
+
+        page_root = output_dir / page_slug
+        previous_path = page_root / "patched_elementor.json"
+        if not previous_path.is_file():
+            _raise_not_found(f"이전 결과가 없습니다. generate_site를 먼저 실행해주세요: {previous_path}")
+        page_stats: Dict[str, Any] = {}
+        result = page.plan.apply_incremental(
+            read_json_file(previous_path),
+            site_spec,
+            changed_keys,
+            stats=page_stats,
+        )
+        if result.changed:
+            write_json_file(previous_path, result.patched_data, compact=compact_json)
+            _merge_patch_results(page_root / PATCH_RESULTS_FILE_NAME, result.patch_results)
+        pages[page_slug] = {"changed": result.changed, "mode": result.mode, "stats": page_stats}
+
+    return {
+        "template_id": template_id,
+        "output_dir": str(output_dir),
+        "changed_keys": changed_keys,
+        "changed_pages": [page_slug for page_slug, page in pages.items() if page["changed"]],
+        "pages": pages,
+        "elapsed_ms": round((perf_counter() - started) * 1000, 3),
+    }
+
+
+def _merge_patch_results(path: Path, patch_results: Dict[int, Dict[str, Any]]) -> None:
+    """다시 적용한 패치 결과만 patch_results.jsonl에 덮어쓴다. 줄 번호 = 플랜의 패치 번호. 예: _merge_patch_results(path, {3: {...}})"""
+
+    if not path.is_file():
+        return
+    with PatchResultWriter(path) as writer:
+        for patch_index, record in enumerate(iter_patch_results(path)):
+            writer(patch_results.get(patch_index, record))
+
+
+_ROUTES: Dict[Tuple[str, str], Callable[[TemplateLibrary, Dict[str, Any]], Dict[str, Any]]] = {
+    ("GET", "/v1/health"): _health,
+    ("GET", "/v1/templates"): _list_templates,
+    ("POST", "/v1/scan"): _scan,
+    ("POST", "/v1/patch"): _patch,
+    ("POST", "/v1/generate_site"): _generate_site,
+    ("POST", "/v1/update_site"): _update_site,
+}
+
+
+def _require_text(payload: Dict[str, Any], name: str) -> str:
+    """필수 문자열 필드. 예: _require_text(payload, "template_id")"""
+
+    value = payload.get(name)
+    if not isinstance(value, str) or not value:
+        raise DaemonRequestError(user_message=f"'{name}' 필드(문자열)가 필요합니다.")
+    return value
+
+
+def _optional_count(payload: Dict[str, Any], name: str, default: int) -> int:
+    """선택 정수 필드(0 이상). 없으면 default. 예: _optional_count(payload, "max_depth", 12)"""
+
+    if name not in payload:
+        return default
+    value = payload[name]
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise DaemonRequestError(user_message=f"'{name}' 필드는 0 이상의 정수여야 합니다.", detail=repr(value))
+    return value
+
+
+def _resolve_output_dir(library: TemplateLibrary, value: Any) -> Path:
+    """요청의 output_dir를 출력 루트 아래 경로로 바꾼다. 절대 경로와 '..'는 거부한다. 예: _resolve_output_dir(library, "site-a")"""
+
+    if not isinstance(value, str):
+        raise DaemonRequestError(user_message="'output_dir' 필드는 문자열이어야 합니다.")
+    relative = Path(value)
+    parts = value.replace("\\", "/").split("/")
+    if relative.is_absolute() or relative.anchor or value.startswith(("/", "\\")) or ".." in parts:
+        raise DaemonRequestError(
+            user_message="'output_dir'는 출력 루트 기준 상대 경로여야 합니다(절대 경로와 '..' 불가).",
+            detail=value,
+        )
+
+    root = library.output_root.resolve()
+    resolved = (root / relative).resolve()
+    # 루트 안의 심볼릭 링크가 밖을 가리키는 경우도 막는다.
+    if resolved != root and root not in resolved.parents:
+        raise DaemonRequestError(user_message="'output_dir'가 출력 루트 밖을 가리킵니다.", detail=value)
+    return resolved
+
+
+def _require_site_spec(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """site_spec 필드를 검증한다. 예: _require_site_spec(payload)"""
+
+    site_spec = payload.get("site_spec")
+    if not isinstance(site_spec, dict):
+        raise DaemonRequestError(user_message="'site_spec' 필드(객체)가 필요합니다.")
+    validate_site_spec(site_spec)
+    return site_spec
+
+
+def _raise_not_found(message: str, detail: Optional[str] = None) -> None:
+    """404 오류를 던진다. 예: _raise_not_found("템플릿을 찾을 수 없습니다: t9")"""
+
+    raise DaemonRequestError(user_message=message, detail=detail, status=404)
+
+
+def _error_body(status: int, message: str, detail: Optional[str]) -> Dict[str, Any]:
+    """오류 응답. 예: _error_body(404, "템플릿을 찾을 수 없습니다", None)"""
+
+    return {"msg": message, "status": status, "detail": detail}
+
+
+def _load_template(directory: Path, signatures: Dict[str, Optional[List[int]]]) -> TemplateEntry:
+    """템플릿 폴더를 읽고 페이지별 플랜을 컴파일한다. 예: _load_template(Path("templates/t1"), signatures)"""
+
+    adapter_path = directory / ADAPTER_FILE_NAME
+    adapter: Dict[str, Any] = {"template_id": directory.name, "pages": []}
+    if adapter_path.is_file():
+        adapter = read_json_file(adapter_path)
+        validate_adapter(adapter)
+
+    pages: Dict[str, TemplatePage] = {}
+    for page_path in sorted(directory.glob("*.json")):
+        if page_path.name == ADAPTER_FILE_NAME:
+            continue
+        elementor_data = read_json_file(page_path)
+        page_slug = page_path.stem
+        page_adapter = {
+            **adapter,
+            "pages": [page for page in adapter.get("pages", []) if page.get("post_slug") in (None, page_slug)],
+        }
+        pages[page_slug] = TemplatePage(
+            page_slug=page_slug,
+            path=page_path,
+            elementor_data=elementor_data,
+            plan=compile_adapter(page_adapter, elementor_data),
+        )
+
+    if not pages:
+        raise FriendlyError(user_message=f"템플릿에 페이지 JSON이 없습니다: {directory}")
+
+    return TemplateEntry(
+        template_id=directory.name,
+        directory=directory,
+        pages=pages,
+        signatures=signatures,
+        has_adapter=adapter_path.is_file(),
+    )
+
+
+def _directory_signatures(directory: Path) -> Dict[str, Optional[List[int]]]:
+    """폴더 안 JSON 파일들의 크기/수정 시각. 예: _directory_signatures(Path("templates/t1"))"""
+
+    return {path.name: file_signature(path) for path in sorted(directory.glob("*.json"))}
+
+
+def _freeze_heap() -> None:
+    """읽어 둔 템플릿 객체를 순환 GC 대상에서 뺀다. 예: _freeze_heap()
+
+    fork된 워커에서 GC가 오래된 객체의 헤더를 건드리면 copy-on-write 페이지가 복사되므로 미리 얼려 둔다.
+    """
+
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+
+
+def _remove_socket(socket_path: Path) -> None:
+    """Unix 소켓 파일을 지운다. 예: _remove_socket(Path("/tmp/site-factory.sock"))"""
+
+    try:
+        Path(socket_path).unlink()
+    except OSError:
+        pass
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """JSON 요청을 handle_request로 넘긴다. 예: 서버가 요청마다 생성"""
+
+    server_version = f"SiteFactoryDaemon/{__version__}"
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        """본문을 읽고 응답을 쓴다. 예: self._dispatch("POST")"""
+
+        payload: Optional[Dict[str, Any]] = None
+        status, body = 200, {}
+        if method == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_REQUEST_BYTES:
+                status, body = 413, _error_body(413, "요청 본문이 너무 큽니다.", f"최대 {MAX_REQUEST_BYTES} bytes")
+            else:
+                try:
+                    payload = loads_json(self.rfile.read(length)) if length else {}
+                    if not isinstance(payload, dict):
+                        raise ValueError("JSON 객체가 아닙니다.")
+                except ValueError as error:
+                    status, body = 400, _error_body(400, "요청 본문을 JSON으로 해석할 수 없습니다.", str(error))
+
+        if status == 200:
+            status, body = handle_request(self.server.library, method, urlparse(self.path).path, payload)
+
+        raw = dumps_json(body, compact=True)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def address_string(self) -> str:
+        # Unix 소켓은 client_address가 빈 문자열이다.
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger = getattr(self.server, "logger", None)
+        if logger:
+            logger.debug("%s %s", self.address_string(), format % args)
+
+
+_FORKING = hasattr(socketserver, "ForkingMixIn") and hasattr(os, "fork")
+_WorkerMixIn: Any = socketserver.ForkingMixIn if _FORKING else socketserver.ThreadingMixIn
+
+
+class _LibraryServerMixIn:
+    """요청을 넘기기 전에 부모 프로세스에서 템플릿 변경을 확인한다. 예: 서버 클래스에 섞어 쓴다"""
+
+    library: TemplateLibrary
+    logger: Any = None
+    reload_interval: float = DEFAULT_RELOAD_INTERVAL
+    next_reload_check: float = 0.0
+    request_count: int = 0
+    daemon_threads = True
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self.request_count += 1
+        now = monotonic()
+        if now >= self.next_reload_check:
+            changed = self.library.refresh()
+            if changed:
+                _freeze_heap()
+                if self.logger:
+                    self.logger.info("템플릿 다시 읽음: %s", ", ".join(changed))
+            self.next_reload_check = now + self.reload_interval
+        super().process_request(request, client_address)
+
+
+class _TcpDaemonServer(_LibraryServerMixIn, _WorkerMixIn, HTTPServer):
+    allow_reuse_address = True
+
+
+if hasattr(socket, "AF_UNIX"):
+
+    class _UnixDaemonServer(_LibraryServerMixIn, _WorkerMixIn, socketserver.UnixStreamServer):
+        pass
+
+
+def _create_server(*, host: str, port: int, socket_path: Optional[Path]) -> socketserver.BaseServer:
+    """TCP 또는 Unix 소켓 서버를 만든다. 예: _create_server(host="127.0.0.1", port=8765, socket_path=None)"""
+
+    try:
+        if socket_path:
+            if not hasattr(socket, "AF_UNIX"):
+                raise FriendlyError(user_message="이 OS에서는 Unix 소켓을 쓸 수 없습니다. --port를 사용해주세요.")
+            # 이전 실행이 남긴 소켓 파일이 있으면 bind가 실패한다.
+            _remove_socket(socket_path)
+            return _UnixDaemonServer(str(socket_path), _DaemonRequestHandler)
+        return _TcpDaemonServer((host, port), _DaemonRequestHandler)
+    except OSError as error:
+        raise FriendlyError(
+            user_message=f"데몬 주소에 연결할 수 없습니다: {socket_path or f'{host}:{port}'}",
+            detail=str(error),
+        ) from error
@@ -0,0 +1,118 @@
+# v0.2 - 공통 순회 엔진 사용 (2026-10-17)
+# 기능: Elementor 트리를 한 번만 순회해 id/CSS ID 조회 인덱스를 만든다 (예: ElementIndex.build(elementor_data))
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .traversal import ElementVisit, walk_elements
+
+CSS_ID_SETTING_KEYS: Tuple[str, ...] = ("_element_id", "_css_id", "css_id", "cssId", "cssid")
+
+
+# 인덱스 항목은 공통 순회 엔진의 방문 레코드를 그대로 사용한다.
+IndexedElement = ElementVisit
+
+
+class ElementIndex:
+    """id → 위치, CSS ID → 요소 인덱스. 예: index = ElementIndex.build(elementor_data)"""
+
+    def __init__(
+        self,
+        *,
+        root_elements: List[Any],
+        entries: List[IndexedElement],
+        by_id: Dict[str, List[IndexedElement]],
+        by_css_id: Dict[str, List[IndexedElement]],
+        build_seconds: float,
+    ) -> None:
+        self.root_elements = root_elements
+        self.entries = entries
+        self.by_id = by_id
+        self.by_css_id = by_css_id
+        self.build_seconds = build_seconds
+
+    @classmethod
+    def build(cls, elementor_data: Any) -> "ElementIndex":
+        """문서를 한 번 순회해 인덱스를 만든다. 예: ElementIndex.build(elementor_data)"""
+
+        started = perf_counter()
+        root_elements = get_root_element_list(elementor_data)
+        entries: List[IndexedElement] = []
+        by_id: Dict[str, List[IndexedElement]] = {}
+        by_css_id: Dict[str, List[IndexedElement]] = {}
+
+        for entry in walk_elements(root_elements):
+            entries.append(entry)
+
+            element = entry.element
+            element_id = element.get("id")
+            if isinstance(element_id, str):
+                by_id.setdefault(element_id, []).append(entry)
+            for css_id in extract_css_ids(element.get("settings")):
+                by_css_id.setdefault(css_id, []).append(entry)
+
+        return cls(
+            root_elements=root_elements,
+            entries=entries,
+            by_id=by_id,
+            by_css_id=by_css_id,
+            build_seconds=perf_counter() - started,
+        )
+
+    def candidates(
+        self,
+        element_id: Optional[str],
+        css_id: Optional[str],
+    ) -> List[IndexedElement]:
+        """id 또는 CSS ID가 일치하는 요소를 순회 순서대로 반환한다. 예: index.candidates("hero", None)"""
+
+        matches: List[IndexedElement] = []
+        if element_id:
+            matches.extend(self.by_id.get(element_id, []))
+        if css_id:
+            matches.extend(self.by_css_id.get(css_id, []))
+        if element_id and css_id:
+            # 한글: 같은 요소가 양쪽에 잡힐 수 있어 순서 기준으로 정리한다.
+            matches = sorted({entry.order: entry for entry in matches}.values(), key=_entry_order)
+        return matches
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def get_root_element_list(elementor_data: Any) -> List[Any]:
+    """Elementor 루트 elements 리스트 원본을 반환한다. 예: get_root_element_list(data)"""
+
+    if isinstance(elementor_data, list):
+        return elementor_data
+
+    if isinstance(elementor_data, dict):
+        elements = elementor_data.get("elements")
+        if isinstance(elements, list):
+            return elements
+
+    return []
+
+
+def extract_css_ids(settings: Any) -> List[str]:
+    """settings에 지정된 CSS ID 목록을 반환한다. 예: extract_css_ids({"_element_id": "hero_title"})"""
+
+    if not isinstance(settings, dict):
+        return []
+
+    css_ids: List[str] = []
+    for key in CSS_ID_SETTING_KEYS:
+        value = settings.get(key)
+        if isinstance(value, str):
+            normalized = value.strip()
+            if normalized and normalized not in css_ids:
+                css_ids.append(normalized)
+    return css_ids
+
+
+def _entry_order(entry: IndexedElement) -> int:
+    """정렬 키. 예: sorted(entries, key=_entry_order)"""
+
+    return entry.order
@@ -0,0 +1,192 @@
+# v0.1 - RFC 6902 JSON Patch 델타 생성/적용 추가 (2026-10-17)
+# 기능: 패치된 요소만 비교해 델타를 만들고, 템플릿 + 델타로 문서를 다시 만든다 (예: apply_delta(base, delta["operations"]))
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence, Set, Union
+
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import PathLike, file_sha256, read_json_file
+
+DELTA_FORMAT = "rfc6902"
+DELTA_FILE_NAME = "elementor_delta.json"
+
+JsonPatchOperation = Dict[str, Any]
+
+
+def escape_pointer_token(token: Union[str, int]) -> str:
+    """JSON Pointer 토큰 이스케이프. 예: escape_pointer_token("a/b") → "a~1b" """
+
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def element_pointer(index_path: Sequence[int], root_is_list: bool) -> str:
+    """요소 인덱스 경로 → JSON Pointer. 예: element_pointer((0, 2), root_is_list=False) → "/elements/0/elements/2" """
+
+    parts: List[str] = []
+    for depth, index in enumerate(index_path):
+        if depth or not root_is_list:
+            parts.append("elements")
+        parts.append(str(index))
+    return "/" + "/".join(parts)
+
+
+def build_delta_document(
+    operations: List[JsonPatchOperation],
+    base_path: PathLike,
+    base_sha256: str,
+) -> Dict[str, Any]:
+    """델타 파일 내용을 만든다. 기준 템플릿의 해시를 함께 남긴다. 예: build_delta_document(ops, "elementor.json", file_sha256("elementor.json"))"""
+
+    return {
+        "format": DELTA_FORMAT,
+        "base": {"path": str(base_path), "sha256": base_sha256},
+        "operations": operations,
+    }
+
+
+def apply_delta_file(delta_path: PathLike, base_path: PathLike) -> Any:
+    """델타 파일을 템플릿에 적용한다. 템플릿이 델타를 만들 때와 다르면 실패한다. 예: apply_delta_file("output/elementor_delta.json", "elementor.json")"""
+
+    delta = read_json_file(delta_path)
+    if delta.get("format") != DELTA_FORMAT or not isinstance(delta.get("operations"), list):
+        raise FriendlyError(user_message=f"델타 파일 형식이 아닙니다: {delta_path}")
+
+    expected = (delta.get("base") or {}).get("sha256")
+    if expected and file_sha256(base_path) != expected:
+        raise FriendlyError(
+            user_message=f"델타를 만든 템플릿과 내용이 다릅니다: {base_path}",
+            detail=f"기대한 sha256: {expected}",
+        )
+    return apply_delta(read_json_file(base_path), delta["operations"])
+
+
+def diff_json(base: Any, new: Any, pointer: str, operations: List[JsonPatchOperation], skip_keys: Sequence[str] = ()) -> None:
+    """두 값의 차이를 add/remove/replace 연산으로 모은다. 예: diff_json(old_settings, new_settings, "/elements/0/settings", ops)
+
+    dict는 키 단위, 길이가 같은 리스트는 항목 단위로 내려가고, 나머지는 값 전체를 replace한다.
+    skip_keys는 맨 위 dict에서만 비교하지 않을 키다(요소의 자식 elements처럼 따로 추적하는 값).
+    """
+
+    if isinstance(base, dict) and isinstance(new, dict):
+        for key, base_value in base.items():
+            if key in skip_keys:
+                continue
+            child = f"{pointer}/{escape_pointer_token(key)}"
+            if key not in new:
+                operations.append({"op": "remove", "path": child})
+            else:
+                diff_json(base_value, new[key], child, operations)
+        for key, new_value in new.items():
+            if key not in base and key not in skip_keys:
+                operations.append({"op": "add", "path": f"{pointer}/{escape_pointer_token(key)}", "value": new_value})
+        return
+
+    if isinstance(base, list) and isinstance(new, list) and len(base) == len(new):
+        for index, (base_item, new_item) in enumerate(zip(base, new)):
+            diff_json(base_item, new_item, f"{pointer}/{index}", operations)
+        return
+
+    if type(base) is not type(new) or base != new:
+        operations.append({"op": "replace", "path": pointer, "value": new})
+
+
+def apply_delta(base: Any, operations: Sequence[JsonPatchOperation]) -> Any:
+    """템플릿 문서에 델타를 적용한 새 문서를 만든다. 예: patched = apply_delta(template, delta["operations"])
+
+    RFC 6902의 add/remove/replace를 지원한다. 연산이 지나가는 경로의 컨테이너만 복사하고
+    나머지 하위 트리는 base와 공유하므로(copy-on-write) 비용은 델타 크기 × 깊이에 비례한다.
+    base는 바뀌지 않는다. 새 값은 델타의 객체를 그대로 쓰므로 결과를 고칠 거면 델타를 재사용하지 않는다.
+    """
+
+    holder = [base]
+    copied: Set[int] = set()
+    for operation in operations:
+        op = operation.get("op")
+        tokens = _parse_pointer(operation.get("path", ""))
+        if not tokens:
+            if op not in ("add", "replace"):
+                _raise_delta_error(operation, "루트에는 add/replace만 할 수 있습니다.")
+            holder[0] = operation.get("value")
+            continue
+
+        parent = _writable_container(holder, tokens[:-1], copied, operation)
+        last = tokens[-1]
+        try:
+            if isinstance(parent, dict):
+                if op == "remove":
+                    del parent[last]
+                elif op == "replace":
+                    if last not in parent:
+                        raise KeyError(last)
+                    parent[last] = operation["value"]
+                elif op == "add":
+                    parent[last] = operation["value"]
+                else:
+                    _raise_delta_error(operation, "지원하지 않는 연산입니다.")
+            elif isinstance(parent, list):
+                if op == "add":
+                    index = len(parent) if last == "-" else int(last)
+                    if not 0 <= index <= len(parent):
+                        raise IndexError(index)
+                    parent.insert(index, operation["value"])
+                elif op == "remove":
+                    parent.pop(int(last))
+                elif op == "replace":
+                    parent[int(last)] = operation["value"]
+                else:
+                    _raise_delta_error(operation, "지원하지 않는 연산입니다.")
+            else:
+                _raise_delta_error(operation, "경로가 객체나 리스트를 가리키지 않습니다.")
+        except (KeyError, IndexError, ValueError) as error:
+            _raise_delta_error(operation, f"경로를 찾을 수 없습니다 ({error}).")
+
+    return holder[0]
+
+
+def _writable_container(holder: List[Any], tokens: Sequence[str], copied: Set[int], operation: JsonPatchOperation) -> Any:
+    """경로의 컨테이너를 복사해 가며 내려간다. 한 번 복사한 컨테이너는 다시 복사하지 않는다. 예: _writable_container(holder, ["elements", "0"], copied, op)"""
+
+    current = holder[0]
+    if id(current) not in copied:
+        current = _shallow_copy(current)
+        holder[0] = current
+        copied.add(id(current))
+
+    for token in tokens:
+        try:
+            key: Union[str, int] = int(token) if isinstance(current, list) else token
+            child = current[key]
+        except (KeyError, IndexError, ValueError, TypeError):
+            _raise_delta_error(operation, f"경로를 찾을 수 없습니다: {token}")
+        if id(child) not in copied:
+            child = _shallow_copy(child)
+            current[key] = child
+            copied.add(id(child))
+        current = child
+    return current
+
+
+def _shallow_copy(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    """JSON Pointer → 토큰 목록. 예: _parse_pointer("/elements/0/settings/title") → ["elements", "0", "settings", "title"]"""
+
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise FriendlyError(user_message=f"JSON Pointer 형식이 아닙니다: {pointer}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _raise_delta_error(operation: JsonPatchOperation, reason: str) -> None:
+    raise FriendlyError(
+        user_message=f"델타를 적용할 수 없습니다: {operation.get('op')} {operation.get('path')}",
+        detail=reason,
+    )
@@ -0,0 +1,701 @@
+# v0.3 - scanner/contracts 공개 API만 사용 (데몬 모듈을 읽지 않음) (2026-10-17)
+# 기능: 모든 페이지의 요소와 스캐너 후보를 SQLite에 쌓고 파일 해시로 바뀐 파일만 다시 넣는다 (예: index_library(input_pattern="templates", db_path=Path(".cache/library.sqlite")))
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .batch_scanner import discover_input_files, page_identity
+from .contracts import ADAPTER_FILE_NAME
+from .element_index import extract_css_ids
+from .json_delta import element_pointer
+from .scanner import extract_candidates_from_settings, extract_elements_root
+from .section_scanner import SectionScanner
+from .traversal import walk_elements
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import (
+    PathLike,
+    dumps_json,
+    ensure_directory,
+    file_sha256,
+    file_signature,
+    read_json_file,
+    write_json_file,
+)
+from .utils.time_utils import get_iso_timestamp
+
+DEFAULT_LIBRARY_DB = Path(".cache/library.sqlite")
+DEFAULT_QUERY_LIMIT = 50
+AUTO_ADAPTER_FILE_NAME = "auto_adapter.json"
+AUTO_ADAPTER_REPORT_NAME = "auto_adapter_report.json"
+# 스키마가 바뀌면 올린다. 다른 버전의 DB는 지우고 다시 만든다.
+LIBRARY_INDEX_FORMAT = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    template_id TEXT NOT NULL,
+    page_slug TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER,
+    mtime_ns INTEGER,
+    adapter_signature TEXT,
+    element_count INTEGER NOT NULL,
+    candidate_count INTEGER NOT NULL,
+    indexed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS elements (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL,
+    element_id TEXT,
+    css_id TEXT,
+    el_type TEXT,
+    widget_type TEXT,
+    depth INTEGER NOT NULL,
+    section_index INTEGER NOT NULL,
+    section_id TEXT,
+    path TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL,
+    element_id TEXT,
+    css_id TEXT,
+    widget_type TEXT,
+    field_type TEXT,
+    depth INTEGER NOT NULL,
+    section_index INTEGER NOT NULL,
+    section_id TEXT,
+    element_path TEXT NOT NULL,
+    path TEXT NOT NULL,
+    preview TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS section_patches (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    section_index INTEGER NOT NULL,
+    section_id TEXT,
+    suggested_name TEXT,
+    widget_count INTEGER NOT NULL,
+    patches TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_template ON files (template_id, page_slug);
+CREATE INDEX IF NOT EXISTS elements_file ON elements (file_id, widget_type);
+CREATE INDEX IF NOT EXISTS elements_widget ON elements (widget_type, css_id);
+CREATE INDEX IF NOT EXISTS elements_css_id ON elements (css_id) WHERE css_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS elements_element_id ON elements (element_id);
+CREATE INDEX IF NOT EXISTS candidates_file ON candidates (file_id, field_type);
+CREATE INDEX IF NOT EXISTS candidates_widget ON candidates (widget_type, field_type);
+CREATE INDEX IF NOT EXISTS candidates_field ON candidates (field_type);
+CREATE INDEX IF NOT EXISTS candidates_element_id ON candidates (element_id);
+CREATE INDEX IF NOT EXISTS section_patches_fingerprint ON section_patches (fingerprint);
+CREATE INDEX IF NOT EXISTS section_patches_file ON section_patches (file_id);
+"""
+
+# preview 전문 검색. trigram은 부분 문자열(한글 포함) 검색이 되지만 SQLite 3.34 이상에서만 있다.
+_FTS_TOKENIZERS = ("trigram", "unicode61")
+_TRIGRAM_MIN_LENGTH = 3
+
+_ELEMENT_COLUMNS = ("element_id", "css_id", "el_type", "widget_type", "depth", "section_index", "section_id", "path")
+_CANDIDATE_COLUMNS = (
+    "element_id",
+    "css_id",
+    "widget_type",
+    "field_type",
+    "depth",
+    "section_index",
+    "section_id",
+    "element_path",
+    "path",
+    "preview",
+)
+_SECTION_PATCH_COLUMNS = ("fingerprint", "section_index", "section_id", "suggested_name", "widget_count", "patches")
+# 섹션 패치 묶음에서 위젯 위치(widget_index)로 대신하는 요소 지정 필드.
+_ELEMENT_TARGET_FIELDS = ("element_id", "css_id")
+
+
+class LibraryIndex:
+    """라이브러리 SQLite 인덱스 연결. 예: with LibraryIndex(".cache/library.sqlite") as index: index.query(widget_type="heading")"""
+
+    def __init__(self, db_path: PathLike = DEFAULT_LIBRARY_DB) -> None:
+        self.db_path = Path(db_path)
+        ensure_directory(self.db_path.parent)
+        try:
+            self.connection = sqlite3.connect(str(self.db_path))
+            self.connection.row_factory = sqlite3.Row
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self._prepare_schema()
+        except sqlite3.DatabaseError as error:
+            raise FriendlyError(user_message=f"라이브러리 인덱스를 열 수 없습니다: {self.db_path}", detail=str(error)) from error
+
+    def __enter__(self) -> "LibraryIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _prepare_schema(self) -> None:
+        """테이블/인덱스/FTS를 만든다. 형식이 다르면 비우고 다시 만든다. 예: index._prepare_schema()"""
+
+        connection = self.connection
+        has_meta = connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'meta'").fetchone()
+        version = connection.execute("SELECT value FROM meta WHERE key = 'format'").fetchone() if has_meta else None
+        if version is not None and version["value"] != str(LIBRARY_INDEX_FORMAT):
+            with connection:
+                for table in ("candidates_fts", "section_patches", "candidates", "elements", "files", "meta"):
+                    connection.execute(f"DROP TABLE IF EXISTS {table}")
+
+        with connection:
+            connection.executescript(_SCHEMA)
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('format', ?)", (str(LIBRARY_INDEX_FORMAT),))
+            self.fts_tokenizer = self._prepare_fts()
+
+    def _prepare_fts(self) -> Optional[str]:
+        """preview FTS5 테이블을 만든다. FTS5가 없는 SQLite면 None(텍스트 검색은 LIKE로 대신). 예: index._prepare_fts()"""
+
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'fts_tokenizer'").fetchone()
+        if row is not None:
+            return row["value"] or None
+        for tokenizer in _FTS_TOKENIZERS:
+            try:
+                self.connection.execute(f"CREATE VIRTUAL TABLE candidates_fts USING fts5(preview, tokenize='{tokenizer}')")
+            except sqlite3.OperationalError:
+                continue
+            break
+        else:
+            tokenizer = ""
+        self.connection.execute("INSERT INTO meta (key, value) VALUES ('fts_tokenizer', ?)", (tokenizer,))
+        return tokenizer or None
+
+    def file_state(self) -> Dict[str, sqlite3.Row]:
+        """인덱싱된 파일 경로 → (id, sha256, size, mtime_ns, adapter_signature). 예: index.file_state()["templates/t1/home.json"]["sha256"]"""
+
+        rows = self.connection.execute("SELECT id, path, sha256, size, mtime_ns, adapter_signature FROM files").fetchall()
+        return {row["path"]: row for row in rows}
+
+    def replace_file(
+        self,
+        *,
+        path: str,
+        template_id: str,
+        page_slug: str,
+        sha256: str,
+        signature: Optional[List[int]],
+        elements: List[Tuple[Any, ...]],
+        candidates: List[Tuple[Any, ...]],
+        section_patches: Iterable[Tuple[Any, ...]] = (),
+        adapter_signature: Optional[str] = None,
+    ) -> None:
+        """파일 하나의 행을 통째로 바꾼다(한 트랜잭션). 예: index.replace_file(path="templates/t1/home.json", ...)"""
+
+        size, mtime_ns = signature if signature else (None, None)
+        connection = self.connection
+        with connection:
+            self._delete_file_rows(path)
+            file_id = connection.execute(
+                "INSERT INTO files (path, template_id, page_slug, sha256, size, mtime_ns, adapter_signature,"
+                " element_count, candidate_count, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    path,
+                    template_id,
+                    page_slug,
+                    sha256,
+                    size,
+                    mtime_ns,
+                    adapter_signature,
+                    len(elements),
+                    len(candidates),
+                    get_iso_timestamp(),
+                ),
+            ).lastrowid
+            connection.executemany(
+                f"INSERT INTO elements (file_id, {', '.join(_ELEMENT_COLUMNS)}) VALUES (?{', ?' * len(_ELEMENT_COLUMNS)})",
+                ((file_id, *row) for row in elements),
+            )
+            connection.executemany(
+                f"INSERT INTO candidates (file_id, {', '.join(_CANDIDATE_COLUMNS)}) VALUES (?{', ?' * len(_CANDIDATE_COLUMNS)})",
+                ((file_id, *row) for row in candidates),
+            )
+            connection.executemany(
+                f"INSERT INTO section_patches (file_id, {', '.join(_SECTION_PATCH_COLUMNS)})"
+                f" VALUES (?{', ?' * len(_SECTION_PATCH_COLUMNS)})",
+                ((file_id, *row) for row in section_patches),
+            )
+            if self.fts_tokenizer:
+                connection.execute(
+                    "INSERT INTO candidates_fts (rowid, preview) SELECT id, preview FROM candidates WHERE file_id = ?",
+                    (file_id,),
+                )
+
+    def touch_file(self, path: str, signature: Optional[List[int]]) -> None:
+        """내용(해시)은 같고 수정 시각만 바뀐 파일의 서명을 갱신한다. 예: index.touch_file(path, [1024, 1700000000])"""
+
+        size, mtime_ns = signature if signature else (None, None)
+        with self.connection:
+            self.connection.execute("UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", (size, mtime_ns, path))
+
+    def remove_file(self, path: str) -> None:
+        """사라진 파일의 행을 지운다. 예: index.remove_file("templates/t1/old.json")"""
+
+        with self.connection:
+            self._delete_file_rows(path)
+
+    def _delete_file_rows(self, path: str) -> None:
+        connection = self.connection
+        row = connection.execute("SELECT id FROM files WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            return
+        if self.fts_tokenizer:
+            connection.execute(
+                "DELETE FROM candidates_fts WHERE rowid IN (SELECT id FROM candidates WHERE file_id = ?)", (row["id"],)
+            )
+        connection.execute("DELETE FROM candidates WHERE file_id = ?", (row["id"],))
+        connection.execute("DELETE FROM section_patches WHERE file_id = ?", (row["id"],))
+        connection.execute("DELETE FROM elements WHERE file_id = ?", (row["id"],))
+        connection.execute("DELETE FROM files WHERE id = ?", (row["id"],))
+
+    def query(
+        self,
+        *,
+        widget_type: Optional[str] = None,
+        css_id: Optional[str] = None,
+        has_css_id: bool = False,
+        element_id: Optional[str] = None,
+        template_id: Optional[str] = None,
+        page_slug: Optional[str] = None,
+        field_type: Optional[str] = None,
+        text: Optional[str] = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+    ) -> Dict[str, Any]:
+        """요소/후보를 찾는다. 예: index.query(widget_type="uicore-icon-box", has_css_id=True)
+
+        text나 field_type이 있으면 후보(candidates)를, 없으면 요소(elements)를 찾는다.
+        text는 preview 전문 검색(FTS5)이다. trigram 토크나이저면 3글자 이상 부분 문자열이 걸린다.
+        결과와 함께 전체 일치 수(count)와 템플릿별 일치 수(templates)를 돌려준다.
+        """
+
+        started = perf_counter()
+        table = "candidates" if text is not None or field_type is not None else "elements"
+        columns = _CANDIDATE_COLUMNS if table == "candidates" else _ELEMENT_COLUMNS
+        where: List[str] = []
+        params: List[Any] = []
+
+        def add(condition: str, value: Any) -> None:
+            where.append(condition)
+            params.append(value)
+
+        if widget_type is not None:
+            add("t.widget_type = ?", widget_type)
+        if css_id is not None:
+            add("t.css_id = ?", css_id)
+        elif has_css_id:
+            where.append("t.css_id IS NOT NULL")
+        if element_id is not None:
+            add("t.element_id = ?", element_id)
+        if template_id is not None or page_slug is not None:
+            # 한글: 파일 id 목록으로 먼저 좁혀 file_id 인덱스를 타게 한다.
+            file_conditions = [
+                condition
+                for condition, value in (("template_id = ?", template_id), ("page_slug = ?", page_slug))
+                if value is not None
+            ]
+            where.append(f"t.file_id IN (SELECT id FROM files WHERE {' AND '.join(file_conditions)})")
+            params.extend(value for value in (template_id, page_slug) if value is not None)
+        if field_type is not None:
+            add("t.field_type = ?", field_type)
+        text_mode = None
+        if text is not None:
+            text_mode = self._add_text_condition(text, where, params)
+
+        from_clause = f"{table} t JOIN files f ON f.id = t.file_id"
+        where_clause = f" WHERE {' AND '.join(where)}" if where else ""
+        try:
+            rows = self.connection.execute(
+                f"SELECT f.template_id, f.page_slug, f.path AS source_file, {', '.join('t.' + column for column in columns)}"
+                f" FROM {from_clause}{where_clause} ORDER BY t.id LIMIT ?",
+                (*params, max(0, limit)),
+            ).fetchall()
+            per_template = self.connection.execute(
+                f"SELECT f.template_id, COUNT(*) FROM {from_clause}{where_clause} GROUP BY f.template_id ORDER BY f.template_id",
+                params,
+            ).fetchall()
+        except sqlite3.DatabaseError as error:
+            raise FriendlyError(user_message="라이브러리 인덱스를 조회할 수 없습니다.", detail=str(error)) from error
+
+        return {
+            "table": table,
+            "text_search": text_mode,
+            "count": sum(row[1] for row in per_template),
+            "templates": {row[0]: row[1] for row in per_template},
+            "results": [dict(row) for row in rows],
+            "elapsed_ms": round((perf_counter() - started) * 1000, 3),
+        }
+
+    def _add_text_condition(self, text: str, where: List[str], params: List[Any]) -> str:
+        """preview 검색 조건을 붙이고 방식(fts/like)을 반환한다. 예: index._add_text_condition("Get Started", where, params)"""
+
+        usable = self.fts_tokenizer and (self.fts_tokenizer != "trigram" or len(text) >= _TRIGRAM_MIN_LENGTH)
+        if usable:
+            where.append("t.id IN (SELECT rowid FROM candidates_fts WHERE candidates_fts MATCH ?)")
+            params.append('"' + text.replace('"', '""') + '"')
+            return "fts"
+        where.append("t.preview LIKE ? ESCAPE '\\'")
+        params.append("%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+        return "like"
+
+    def section_patch_sets(self, fingerprints: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """섹션 지문 → 알려진 패치 묶음 목록(많이 쓰인 순). 예: index.section_patch_sets(["3f2a..."])["3f2a..."][0]["patches"]
+
+        여러 페이지가 똑같은 묶음을 쓰면 하나로 합치고 uses에 개수를, source에 처음 색인된 페이지를 남긴다.
+        """
+
+        unique = sorted(set(fingerprints))
+        if not unique:
+            return {}
+        try:
+            rows = self.connection.execute(
+                "SELECT g.fingerprint, g.patches, g.uses, f.template_id, f.page_slug, s.section_index, s.suggested_name"
+                " FROM (SELECT fingerprint, patches, COUNT(*) AS uses, MIN(id) AS first_id FROM section_patches"
+                f" WHERE fingerprint IN ({', '.join('?' * len(unique))}) GROUP BY fingerprint, patches) g"
+                " JOIN section_patches s ON s.id = g.first_id JOIN files f ON f.id = s.file_id"
+                " ORDER BY g.fingerprint, g.uses DESC, g.first_id",
+                unique,
+            ).fetchall()
+        except sqlite3.DatabaseError as error:
+            raise FriendlyError(user_message="라이브러리 인덱스를 조회할 수 없습니다.", detail=str(error)) from error
+
+        patch_sets: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            patch_sets.setdefault(row["fingerprint"], []).append(
+                {
+                    "patches": json.loads(row["patches"]),
+                    "uses": row["uses"],
+                    "source": {
+                        "template_id": row["template_id"],
+                        "page_slug": row["page_slug"],
+                        "section_index": row["section_index"],
+                        "suggested_name": row["suggested_name"],
+                    },
+                }
+            )
+        return patch_sets
+
+    def analyze(self) -> None:
+        """쿼리 플래너 통계를 갱신한다. 행이 크게 바뀐 뒤에 부른다. 예: index.analyze()"""
+
+        with self.connection:
+            self.connection.execute("ANALYZE")
+
+    def summary(self) -> Dict[str, Any]:
+        """인덱스 전체 규모. 예: index.summary()"""
+
+        connection = self.connection
+        return {
+            "templates": connection.execute("SELECT COUNT(DISTINCT template_id) FROM files").fetchone()[0],
+            "pages": connection.execute("SELECT COUNT(*) FROM files").fetchone()[0],
+            "elements": connection.execute("SELECT COUNT(*) FROM elements").fetchone()[0],
+            "candidates": connection.execute("SELECT COUNT(*) FROM candidates").fetchone()[0],
+            "section_patch_sets": connection.execute("SELECT COUNT(*) FROM section_patches").fetchone()[0],
+            "fts_tokenizer": self.fts_tokenizer,
+        }
+
+
+def index_library(
+    *,
+    input_pattern: str,
+    db_path: Path = DEFAULT_LIBRARY_DB,
+) -> Dict[str, Any]:
+    """템플릿 페이지들의 요소와 후보를 SQLite에 넣는다. 예: index_library(input_pattern="templates", db_path=Path(".cache/library.sqlite"))
+
+    템플릿 ID/페이지 슬러그는 scan-batch와 같은 규칙(디렉터리 입력이면 첫 하위 폴더, 파일 이름)으로 정하고 adapter.json은 건너뛴다.
+    페이지 옆에 adapter.json이 있으면 그 페이지의 패치를 섹션 지문별 묶음으로도 넣는다(auto-adapter가 찾아 씀).
+    크기/수정 시각이 그대로인 파일은 읽지 않고, 바뀐 파일도 sha256이 같으면 다시 넣지 않는다. adapter.json이 바뀌면 그 템플릿 페이지를 다시 넣는다.
+    디스크에서 사라진 파일의 행은 지운다. 입력 범위 밖이어도 파일이 남아 있으면 그대로 둔다.
+    읽을 수 없는 파일은 errors에 남기고 나머지는 계속한다.
+    """
+
+    input_files = [path for path in discover_input_files(input_pattern) if path.name != ADAPTER_FILE_NAME]
+    if not input_files:
+        raise FriendlyError(user_message=f"인덱싱할 Elementor JSON이 없습니다: {input_pattern}")
+
+    input_root = Path(input_pattern) if Path(input_pattern).is_dir() else None
+    started = perf_counter()
+    counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+    errors: List[Dict[str, Any]] = []
+    adapters: Dict[Path, Optional[Dict[str, Any]]] = {}
+    with LibraryIndex(db_path) as index:
+        known = index.file_state()
+        seen = set()
+        for input_path in input_files:
+            path_key = str(input_path)
+            seen.add(path_key)
+            signature = file_signature(input_path)
+            adapter_path = input_path.parent / ADAPTER_FILE_NAME
+            adapter_signature = _signature_text(file_signature(adapter_path))
+            previous = known.get(path_key)
+            adapter_unchanged = previous is not None and previous["adapter_signature"] == adapter_signature
+            if adapter_unchanged and signature and [previous["size"], previous["mtime_ns"]] == list(signature):
+                counts["unchanged"] += 1
+                continue
+
+            try:
+                sha256 = file_sha256(input_path)
+                if adapter_unchanged and previous["sha256"] == sha256:
+                    index.touch_file(path_key, signature)
+                    counts["unchanged"] += 1
+                    continue
+                template_id, page_slug = page_identity(input_path, input_root)
+                elementor_data = read_json_file(input_path)
+                elements, candidates = collect_index_rows(elementor_data)
+                if adapter_path not in adapters:
+                    adapters[adapter_path] = read_json_file(adapter_path) if adapter_signature else None
+                section_patches = collect_section_patch_rows(elementor_data, _adapter_page(adapters[adapter_path], page_slug))
+            except FriendlyError as error:
+                errors.append({"file": path_key, "error": error.user_message, "detail": error.detail})
+                continue
+            index.replace_file(
+                path=path_key,
+                template_id=template_id,
+                page_slug=page_slug,
+                sha256=sha256,
+                signature=signature,
+                elements=elements,
+                candidates=candidates,
+                section_patches=section_patches,
+                adapter_signature=adapter_signature,
+            )
+            counts["indexed"] += 1
+
+        for path_key in known:
+            if path_key not in seen and not Path(path_key).is_file():
+                index.remove_file(path_key)
+                counts["removed"] += 1
+
+        if counts["indexed"] or counts["removed"]:
+            index.analyze()
+        totals = index.summary()
+
+    return {
+        "db_path": str(db_path),
+        "file_count": len(input_files),
+        **counts,
+        "file_errors": len(errors),
+        **totals,
+        "elapsed_ms": round((perf_counter() - started) * 1000, 3),
+        "errors": errors,
+    }
+
+
+def query_library(db_path: Path = DEFAULT_LIBRARY_DB, **filters: Any) -> Dict[str, Any]:
+    """인덱스를 조회한다. 예: query_library(Path(".cache/library.sqlite"), widget_type="uicore-icon-box", has_css_id=True)"""
+
+    if not Path(db_path).is_file():
+        raise FriendlyError(user_message=f"라이브러리 인덱스가 없습니다. index 명령을 먼저 실행해주세요: {db_path}")
+    with LibraryIndex(db_path) as index:
+        return index.query(**filters)
+
+
+def adapter_from_library(
+    *,
+    input_path: Path,
+    db_path: Path = DEFAULT_LIBRARY_DB,
+    output_dir: Path,
+    template_id: Optional[str] = None,
+    page_slug: Optional[str] = None,
+) -> Dict[str, Any]:
+    """새 템플릿 페이지의 섹션을 지문으로 찾아 알려진 패치를 붙인 어댑터를 만든다. 예: adapter_from_library(input_path=Path("templates/t31/home.json"), output_dir=Path("output/auto"))
+
+    섹션마다 가장 많이 쓰인 패치 묶음을 고르고, 묶음의 widget_index를 새 섹션 위젯의 element_id로 바꾼다.
+    어댑터는 generate_adapter_from_selection과 같은 형태로 <output_dir>/auto_adapter.json에,
+    섹션별 일치 여부와 출처는 auto_adapter_report.json에 저장한다. 일치하지 않은 섹션은 직접 선택해야 한다.
+    """
+
+    if not Path(db_path).is_file():
+        raise FriendlyError(user_message=f"라이브러리 인덱스가 없습니다. index 명령을 먼저 실행해주세요: {db_path}")
+    started = perf_counter()
+    default_template_id, default_page_slug = page_identity(input_path, None)
+    template_id = template_id or default_template_id
+    page_slug = page_slug or default_page_slug
+    sections = SectionScanner(extract_elements_root(read_json_file(input_path))).scan()
+    with LibraryIndex(db_path) as index:
+        patch_sets = index.section_patch_sets(section["fingerprint"] for section in sections)
+
+    patches: List[Dict[str, Any]] = []
+    section_reports: List[Dict[str, Any]] = []
+    for section in sections:
+        report = {
+            "section_index": section["index"],
+            "element_id": section["element_id"],
+            "suggested_name": section["suggested_name"],
+            "fingerprint": section["fingerprint"],
+            "matched": False,
+        }
+        known = patch_sets.get(section["fingerprint"])
+        if known:
+            best = known[0]
+            widgets = section["widgets"]
+            for relative in best["patches"]:
+                patch = {key: value for key, value in relative.items() if key != "widget_index"}
+                patch = {"key": patch.pop("key", None), "element_id": widgets[relative["widget_index"]]["element_id"], **patch}
+                patches.append(patch)
+            report.update(matched=True, patch_count=len(best["patches"]), source=best["source"], alternatives=len(known) - 1)
+        section_reports.append(report)
+
+    adapter = {"template_id": template_id, "pages": [{"post_slug": page_slug, "patches": patches}]}
+    output_root = ensure_directory(output_dir)
+    adapter_path = output_root / AUTO_ADAPTER_FILE_NAME
+    report_path = output_root / AUTO_ADAPTER_REPORT_NAME
+    matched = sum(1 for report in section_reports if report["matched"])
+    summary = {
+        "adapter_path": str(adapter_path),
+        "report_path": str(report_path),
+        "template_id": template_id,
+        "page_slug": page_slug,
+        "sections": len(sections),
+        "matched_sections": matched,
+        "unmatched_sections": len(sections) - matched,
+        "patch_count": len(patches),
+        "elapsed_ms": round((perf_counter() - started) * 1000, 3),
+    }
+    write_json_file(adapter_path, adapter)
+    write_json_file(report_path, {**summary, "input": str(input_path), "sections": section_reports})
+    return summary
+
+
+def collect_section_patch_rows(elementor_data: Any, adapter_page: Optional[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+    """어댑터 페이지의 패치를 섹션 지문별 묶음 행으로 바꾼다. 예: collect_section_patch_rows(data, adapter["pages"][0])
+
+    패치의 element_id는 섹션 안 위젯 위치(widget_index)로 바꿔 저장하므로 id가 다른 같은 레이아웃 섹션에도 쓸 수 있다.
+    섹션 위젯이 아닌 요소를 가리키거나 element_id가 없는 패치는 넣지 않는다.
+    """
+
+    if not adapter_page or not isinstance(adapter_page.get("patches"), list):
+        return []
+    sections = SectionScanner(extract_elements_root(elementor_data)).scan()
+    positions: Dict[str, Tuple[int, int]] = {}
+    for section_position, section in enumerate(sections):
+        for widget in section["widgets"]:
+            if isinstance(widget["element_id"], str):
+                positions.setdefault(widget["element_id"], (section_position, widget["index"]))
+
+    grouped: Dict[int, List[Dict[str, Any]]] = {}
+    for patch in adapter_page["patches"]:
+        position = positions.get(patch.get("element_id")) if isinstance(patch, dict) else None
+        if position is None:
+            continue
+        section_position, widget_index = position
+        relative = {key: value for key, value in patch.items() if key not in _ELEMENT_TARGET_FIELDS}
+        grouped.setdefault(section_position, []).append({**relative, "widget_index": widget_index})
+
+    rows: List[Tuple[Any, ...]] = []
+    for section_position, patches in sorted(grouped.items()):
+        section = sections[section_position]
+        rows.append(
+            (
+                section["fingerprint"],
+                section["index"],
+                section["element_id"],
+                section["suggested_name"],
+                len(section["widgets"]),
+                dumps_json(patches, compact=True, sort_keys=True).decode("utf-8"),
+            )
+        )
+    return rows
+
+
+def _adapter_page(adapter: Optional[Dict[str, Any]], page_slug: str) -> Optional[Dict[str, Any]]:
+    """어댑터에서 post_slug가 같은 페이지. 예: _adapter_page(adapter, "home")"""
+
+    if not isinstance(adapter, dict):
+        return None
+    for page in adapter.get("pages", []):
+        if isinstance(page, dict) and page.get("post_slug") == page_slug:
+            return page
+    return None
+
+
+def _signature_text(signature: Optional[List[int]]) -> Optional[str]:
+    return f"{signature[0]}:{signature[1]}" if signature else None
+
+
+def collect_index_rows(elementor_data: Any) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+    """문서 한 번 순회로 요소 행과 후보 행을 만든다. 예: elements, candidates = collect_index_rows(read_json_file("home.json"))
+
+    후보는 scan과 같은 규칙(extract_candidates_from_settings)으로 뽑되 개수/깊이 제한 없이 모두 넣는다.
+    section은 그 요소가 속한 최상위 요소(루트 elements의 항목)다.
+    """
+
+    elements_root = extract_elements_root(elementor_data)
+    root_is_list = isinstance(elementor_data, list)
+    element_rows: List[Tuple[Any, ...]] = []
+    candidate_rows: List[Tuple[Any, ...]] = []
+    stats: Dict[str, Any] = {"skipped_text": 0}
+    section_id: Optional[str] = None
+    section_index = 0
+
+    for visit in walk_elements(elements_root):
+        element = visit.element
+        if visit.depth == 0:
+            section_index = visit.index
+            section_id = element.get("id")
+        settings = element.get("settings")
+        # 한글: CSS ID는 패치 매칭과 같은 키(_element_id 등)로 읽는다.
+        css_ids = extract_css_ids(settings)
+        css_id = css_ids[0] if css_ids else None
+        element_id = element.get("id")
+        widget_type = element.get("widgetType") or element.get("widget_type")
+        element_path = element_pointer(visit.index_path(), root_is_list)
+        element_rows.append(
+            (element_id, css_id, element.get("elType"), widget_type, visit.depth, section_index, section_id, element_path)
+        )
+        if not isinstance(settings, dict):
+            continue
+        for candidate in _unique_candidates(settings, element_id, widget_type, css_id, stats):
+            candidate_rows.append(
+                (
+                    element_id,
+                    css_id,
+                    widget_type,
+                    candidate["field_type"],
+                    visit.depth,
+                    section_index,
+                    section_id,
+                    element_path,
+                    candidate["path"],
+                    candidate["preview"],
+                )
+            )
+    return element_rows, candidate_rows
+
+
+def _unique_candidates(
+    settings: Dict[str, Any],
+    element_id: Any,
+    widget_type: Optional[str],
+    css_id: Optional[str],
+    stats: Dict[str, Any],
+) -> Iterator[Dict[str, Any]]:
+    """요소 하나의 후보를 경로 중복 없이 낸다. 예: _unique_candidates(settings, "a1", "heading", None, stats)"""
+
+    seen_paths = set()
+    for candidate in extract_candidates_from_settings(
+        settings=settings,
+        element_id=element_id,
+        widget_type=widget_type,
+        css_id=css_id,
+        stats=stats,
+    ):
+        if candidate["path"] not in seen_paths:
+            seen_paths.add(candidate["path"])
+            yield candidate
@@ -0,0 +1,332 @@
+# v0.2 - 결과 임시 파일을 프로세스/스레드별 이름으로 만듦 (2026-10-17)
+# 기능: 선언형 규칙을 정규식 하나 + 집합 조회로 컴파일해 후보를 한 번에 스트리밍 필터링한다 (예: filter_manifests(input_pattern="output/scan", output_dir=Path("output/filtered")))
+
+from __future__ import annotations
+
+import glob
+import re
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import PathLike, dumps_json, ensure_directory, loads_json, read_json_file, temp_path_for, write_json_file
+
+FILTERED_CANDIDATES_NAME = "filtered_candidates.jsonl"
+FILTER_REPORT_NAME = "filter_report.json"
+MANIFEST_FILE_NAME = "manifest.json"
+
+# 1단계(잡음 제거): CSS ID가 없는 text 후보 중 ID/숫자/색상/CSS 값처럼 보이는 것. 처음부터 매칭한다.
+NOISE_PATTERNS: Tuple[str, ...] = (
+    r"\d+\Z",  # 숫자만
+    r"[0-9a-f]{7}\Z",  # Elementor 요소 id (예: 32bd91f)
+    r"#",  # 색상 코드
+    r"(?=[^,]*,)[#0-9A-F, ]+\Z",  # 색상 목록
+    r"(?i:.*?(?:linear|ease|all|box|border|px|em|rem))",  # transition, easing 등 CSS 속성
+)
+
+# 2단계(핵심 콘텐츠): 위젯 기본값. re.IGNORECASE로 처음부터 매칭한다.
+EXCLUDE_PATTERNS: Tuple[str, ...] = (
+    r"^This is Tooltip$",
+    r"^my-header$",
+    r"left,right",
+    r"square\|circle",
+    r"🎃\|🎄\|💜",
+    r"^M\d+",  # SVG path
+    r"^(center|left|right|top|bottom)$",
+    r"^(yes|no)$",
+    r"^(full|contain|cover|auto)$",
+    r"^(fadeIn|fadeOut|zoom|slide)",  # 애니메이션
+    r"^(fast|slow|normal)$",
+    r"^(custom|default|classic)$",
+    r"^(solid|dashed|dotted)$",
+    r"^(row|column)$",
+    r"^(space-between|center|flex-)",
+    r"^(grow|none|initial|inherit)$",
+    r"^(uppercase|lowercase)$",
+)
+
+CORE_WIDGETS: FrozenSet[str] = frozenset(
+    {"heading", "text-editor", "button", "highlighted-text", "icon-list", "image"}
+)
+
+# 순서가 의미 있는 규칙(정규식 목록). 나머지 리스트 규칙은 집합이다.
+_PATTERN_RULES = frozenset({"noise_patterns", "exclude_patterns"})
+_HANGUL = re.compile(r"[가-힣]")
+_LATIN = re.compile(r"[a-zA-Z]")
+
+
+@dataclass(frozen=True)
+class ManifestRules:
+    """manifest 후보 필터 규칙. 예: ManifestRules(core_widgets=frozenset({"heading"}), min_words=3)
+
+    두 단계를 순서대로 적용한다(둘 다 통과해야 남는다).
+    - noise_filter: CSS ID가 있으면(css_id_priority) 통과, pass_field_types(image/link)도 통과,
+      text_field_types는 min_noise_length 미만이거나 noise_patterns에 걸리면 제외, 그 밖의 field_type은 제외.
+    - core_filter: core_widgets 밖의 위젯 제외, image는 통과, min_preview_length 미만이거나 exclude_patterns에 걸리면 제외,
+      한글이 있거나 영문이 섞인 min_words 단어 이상이면 통과.
+    """
+
+    noise_filter: bool = True
+    core_filter: bool = True
+    css_id_priority: bool = True
+    pass_field_types: FrozenSet[str] = frozenset({"image", "link"})
+    text_field_types: FrozenSet[str] = frozenset({"text"})
+    min_noise_length: int = 3
+    noise_patterns: Tuple[str, ...] = NOISE_PATTERNS
+    core_widgets: Optional[FrozenSet[str]] = CORE_WIDGETS
+    core_pass_field_types: FrozenSet[str] = frozenset({"image"})
+    min_preview_length: int = 2
+    exclude_patterns: Tuple[str, ...] = EXCLUDE_PATTERNS
+    min_words: int = 2
+
+    def compile(self) -> "CompiledManifestRules":
+        """규칙을 정규식/집합으로 컴파일한다. 예: compiled = ManifestRules().compile()"""
+
+        return CompiledManifestRules(self)
+
+
+# scripts/filter_manifest.py, scripts/extract_core_content.py가 각각 하던 단계만 켠 규칙
+NOISE_RULES = ManifestRules(core_filter=False)
+CORE_RULES = ManifestRules(noise_filter=False)
+DEFAULT_MANIFEST_RULES = ManifestRules()
+
+
+def _compile_alternation(patterns: Tuple[str, ...], flags: int = 0) -> Optional["re.Pattern[str]"]:
+    """패턴 목록 → 정규식 하나. 비어 있으면 None. 예: _compile_alternation((r"^(yes|no)$", r"^M\\d+"))"""
+
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+class CompiledManifestRules:
+    """컴파일된 규칙. 후보마다 정규식 match 한두 번 + 집합 조회만 한다. 예: reason = compiled.reject_reason(candidate)"""
+
+    def __init__(self, rules: ManifestRules) -> None:
+        self.rules = rules
+        try:
+            # 한글: 패턴 17개를 하나씩 re.match하던 것을 교대(|) 정규식 하나로 묶는다. match는 각 분기를 맨 앞에서만 시도한다.
+            self._noise = _compile_alternation(rules.noise_patterns, re.DOTALL)
+            self._exclude = _compile_alternation(rules.exclude_patterns, re.IGNORECASE)
+        except re.error as error:
+            raise FriendlyError(user_message="manifest 필터 규칙의 정규식이 올바르지 않습니다.", detail=str(error)) from error
+
+    def reject_reason(self, candidate: Dict[str, Any]) -> Optional[str]:
+        """남길 후보면 None, 아니면 제외 이유. 예: compiled.reject_reason({"field_type": "text", "preview": "32bd91f"}) → "noise" """
+
+        rules = self.rules
+        field_type = candidate.get("field_type")
+        preview = candidate.get("preview") or ""
+
+        if rules.noise_filter and not (rules.css_id_priority and candidate.get("css_id")):
+            if field_type in rules.text_field_types:
+                if len(preview) < rules.min_noise_length or (self._noise and self._noise.match(preview)):
+                    return "noise"
+            elif field_type not in rules.pass_field_types:
+                return "field_type"
+
+        if not rules.core_filter:
+            return None
+        widget_type = candidate.get("widget_type")
+        if widget_type and rules.core_widgets is not None and widget_type not in rules.core_widgets:
+            return "widget_type"
+        if field_type in rules.core_pass_field_types:
+            return None
+        if len(preview) < rules.min_preview_length:
+            return "empty"
+        if self._exclude and self._exclude.match(preview):
+            return "default_value"
+        if _HANGUL.search(preview):
+            return None
+        if len(preview.split()) >= rules.min_words and _LATIN.search(preview):
+            return None
+        return "low_signal"
+
+
+def load_manifest_rules(rules_path: Optional[PathLike] = None) -> ManifestRules:
+    """규칙 JSON을 읽는다. 없는 키는 기본값. 예: load_manifest_rules("rules/manifest_filter.json")
+
+    예: {"core_widgets": ["heading", "button"], "min_words": 3, "exclude_patterns": ["^Lorem"]}
+    core_widgets를 null로 주면 위젯 검사를 하지 않는다.
+    """
+
+    if rules_path is None:
+        return DEFAULT_MANIFEST_RULES
+
+    raw = read_json_file(rules_path)
+    if not isinstance(raw, dict):
+        raise FriendlyError(user_message=f"manifest 필터 규칙은 객체여야 합니다: {rules_path}")
+    unknown = sorted(set(raw) - {item.name for item in fields(ManifestRules)})
+    if unknown:
+        raise FriendlyError(user_message=f"알 수 없는 manifest 필터 규칙입니다: {', '.join(unknown)}")
+
+    values: Dict[str, Any] = {}
+    for name, value in raw.items():
+        default = getattr(DEFAULT_MANIFEST_RULES, name)
+        if name == "core_widgets" and value is None:
+            values[name] = None
+        elif name in _PATTERN_RULES or name == "core_widgets" or isinstance(default, frozenset):
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                raise FriendlyError(user_message=f"manifest 필터 규칙 '{name}'은 문자열 리스트여야 합니다.")
+            values[name] = tuple(value) if name in _PATTERN_RULES else frozenset(value)
+        elif isinstance(default, bool):
+            if not isinstance(value, bool):
+                raise FriendlyError(user_message=f"manifest 필터 규칙 '{name}'은 true/false여야 합니다.")
+            values[name] = value
+        else:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise FriendlyError(user_message=f"manifest 필터 규칙 '{name}'은 정수여야 합니다.")
+            values[name] = value
+    return replace(DEFAULT_MANIFEST_RULES, **values)
+
+
+def filter_candidates(
+    candidates: List[Dict[str, Any]],
+    rules: ManifestRules = DEFAULT_MANIFEST_RULES,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """메모리에 있는 후보 목록을 거른다. 예: kept, stats = filter_candidates(manifest["candidates"], CORE_RULES)"""
+
+    compiled = rules.compile()
+    stats = _FilterStats()
+    kept: List[Dict[str, Any]] = []
+    for candidate in candidates:
+        if stats.count(candidate, compiled.reject_reason(candidate)):
+            kept.append(candidate)
+    return kept, stats.to_dict()
+
+
+def filter_manifests(
+    *,
+    input_pattern: str,
+    output_dir: Path,
+    rules: ManifestRules = DEFAULT_MANIFEST_RULES,
+) -> Dict[str, Any]:
+    """manifest.json / 후보 JSONL을 한 번에 읽어 남길 후보만 JSONL로 저장한다. 예: filter_manifests(input_pattern="output/scan", output_dir=Path("output/filtered"))
+
+    디렉터리를 주면 하위의 manifest.json(scan/scan-batch 결과)과 *.jsonl(한 줄에 후보 하나)을 모두 읽는다.
+    입력 순서대로 한 번만 지나가며, 후보를 모아 두지 않고 바로 filtered_candidates.jsonl에 쓴다.
+    읽을 수 없는 파일은 filter_report.json의 errors에 남기고 나머지는 계속한다.
+    JSONL 입력에서 남긴 줄은 다시 직렬화하지 않고 원본 바이트를 그대로 쓴다.
+    manifest.json에서 온 후보에는 template_id/page_slug/source_file을 붙여 라이브러리 전체를 한 파일로 모은다.
+    """
+
+    input_files = discover_manifest_files(input_pattern)
+    if not input_files:
+        raise FriendlyError(user_message=f"필터링할 manifest가 없습니다: {input_pattern}")
+
+    compiled = rules.compile()
+    stats = _FilterStats()
+    errors: List[Dict[str, Any]] = []
+    output_root = ensure_directory(output_dir)
+    output_path = output_root / FILTERED_CANDIDATES_NAME
+    temp_path = temp_path_for(output_path)
+    started = perf_counter()
+    try:
+        with temp_path.open("wb") as handle:
+            for input_path in input_files:
+                try:
+                    for candidate, raw_line in _iter_candidates(input_path):
+                        if stats.count(candidate, compiled.reject_reason(candidate)):
+                            handle.write(raw_line if raw_line is not None else dumps_json(candidate, compact=True) + b"\n")
+                except FriendlyError as error:
+                    errors.append({"file": str(input_path), "error": error.user_message, "detail": error.detail})
+    except OSError as error:
+        temp_path.unlink(missing_ok=True)
+        raise FriendlyError(user_message=f"필터 결과를 저장할 수 없습니다: {output_path}", detail=str(error)) from error
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    temp_path.replace(output_path)
+    elapsed_seconds = perf_counter() - started
+
+    summary = {
+        "file_count": len(input_files),
+        "file_errors": len(errors),
+        **stats.to_dict(),
+        "elapsed_ms": round(elapsed_seconds * 1000, 3),
+        "candidates_per_second": round(stats.total / elapsed_seconds, 1) if elapsed_seconds > 0 else None,
+    }
+    report_path = output_root / FILTER_REPORT_NAME
+    write_json_file(report_path, {"input": input_pattern, "summary": summary, "errors": errors})
+    return {"filtered_candidates_path": str(output_path), "filter_report_path": str(report_path), **summary}
+
+
+def discover_manifest_files(input_pattern: str) -> List[Path]:
+    """디렉터리/파일/글롭에서 manifest.json과 *.jsonl을 찾는다. 예: discover_manifest_files("output/scan")"""
+
+    pattern_path = Path(input_pattern)
+    if pattern_path.is_dir():
+        found = [*pattern_path.rglob(MANIFEST_FILE_NAME), *pattern_path.rglob("*.jsonl")]
+    elif pattern_path.is_file():
+        found = [pattern_path]
+    else:
+        found = [Path(item) for item in glob.glob(input_pattern, recursive=True)]
+    return sorted(path for path in found if path.is_file())
+
+
+def _iter_candidates(input_path: Path) -> Iterator[Tuple[Dict[str, Any], Optional[bytes]]]:
+    """파일 하나의 후보를 (후보, 원본 줄)로 하나씩 낸다. manifest.json이면 원본 줄은 None. 예: _iter_candidates(Path("a.jsonl"))"""
+
+    if input_path.suffix != ".jsonl":
+        manifest = read_json_file(input_path)
+        candidates = manifest.get("candidates") if isinstance(manifest, dict) else None
+        if not isinstance(candidates, list):
+            raise FriendlyError(user_message=f"manifest에 candidates 리스트가 없습니다: {input_path}")
+        source = {
+            "template_id": manifest.get("template_id"),
+            "page_slug": manifest.get("page_slug"),
+            "source_file": manifest.get("source_file") or str(input_path),
+        }
+        for candidate in candidates:
+            if isinstance(candidate, dict):
+                yield {**candidate, **source}, None
+        return
+
+    try:
+        with input_path.open("rb") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    candidate = loads_json(line)
+                except ValueError as error:
+                    raise FriendlyError(
+                        user_message=f"후보 JSONL을 읽을 수 없습니다: {input_path}:{line_number}",
+                        detail=str(error),
+                    ) from error
+                if isinstance(candidate, dict):
+                    yield candidate, line if line.endswith(b"\n") else line + b"\n"
+    except OSError as error:
+        raise FriendlyError(user_message=f"후보 JSONL을 읽을 수 없습니다: {input_path}", detail=str(error)) from error
+
+
+class _FilterStats:
+    """남긴/제외한 후보 수. 예: stats.count(candidate, None)"""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.kept = 0
+        self.rejected: Dict[str, int] = {}
+        self.kept_by_widget: Dict[str, int] = {}
+
+    def count(self, candidate: Dict[str, Any], reason: Optional[str]) -> bool:
+        """결과를 세고 남길지 반환한다. 예: if stats.count(candidate, reason): ..."""
+
+        self.total += 1
+        if reason is not None:
+            self.rejected[reason] = self.rejected.get(reason, 0) + 1
+            return False
+        self.kept += 1
+        widget_type = candidate.get("widget_type") or "other"
+        self.kept_by_widget[widget_type] = self.kept_by_widget.get(widget_type, 0) + 1
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "candidate_count": self.total,
+            "kept": self.kept,
+            "rejected": dict(sorted(self.rejected.items())),
+            "kept_by_widget": dict(sorted(self.kept_by_widget.items())),
+        }
@@ -0,0 +1,104 @@
+# v0.2 - 임시 파일을 프로세스/스레드별 이름으로 만들어 같은 경로 동시 저장 충돌 방지 (2026-10-17)
+# 기능: 패치 결과를 만들어지는 대로 한 줄씩 저장하고 상태별 개수를 바로 센다 (예: with PatchResultWriter(path) as writer: plan.apply(spec, sink=writer))
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import PathLike, dumps_json, ensure_directory, loads_json, temp_path_for
+
+PATCH_RESULTS_FILE_NAME = "patch_results.jsonl"
+
+# 결과 레코드의 code → 사람이 읽는 설명. 레코드에는 code만 남기고 설명은 여기서 찾는다.
+PATCH_RESULT_MESSAGES: Dict[str, str] = {
+    "invalid_patch": "patch 필수 필드가 누락되었습니다.",
+    "element_not_found": "요소를 찾을 수 없습니다.",
+    "missing_value": "site_spec 값이 없어 건너뜁니다.",
+    "path_failed": "경로 설정에 실패했습니다.",
+}
+
+_STATUS_COUNTERS = {"applied": "applied", "skipped": "skipped", "error": "errors", "deleted": "deleted"}
+
+
+class PatchSummary:
+    """패치 결과를 상태별로 바로바로 센다. sink로도 쓸 수 있다. 예: summary = PatchSummary(); summary.add(record)"""
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {"total_patches": 0, "applied": 0, "skipped": 0, "errors": 0, "deleted": 0}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """결과 하나를 센다. 예: summary.add({"status": "applied", ...})"""
+
+        self.counts["total_patches"] += 1
+        counter = _STATUS_COUNTERS.get(record.get("status"))
+        if counter:
+            self.counts[counter] += 1
+
+    __call__ = add
+
+    def to_dict(self) -> Dict[str, int]:
+        """run_report의 summary 형태. 예: summary.to_dict() → {"total_patches": 3, "applied": 2, ...}"""
+
+        return dict(self.counts)
+
+
+class PatchResultWriter:
+    """패치 결과를 JSONL로 스트리밍 저장하는 sink. 예: with PatchResultWriter("output/patch_results.jsonl") as writer: writer(record)
+
+    결과를 리스트에 모으지 않으므로 메모리는 어댑터 크기와 무관하다. 쓰는 동안은 임시 파일에 쓰고
+    close()에서 교체하므로 중간에 실패해도 이전 파일이 깨지지 않는다. summary에 상태별 개수가 같이 쌓인다.
+    """
+
+    def __init__(self, path: PathLike, summary: Optional[PatchSummary] = None) -> None:
+        self.path = Path(path)
+        self.summary = summary or PatchSummary()
+        ensure_directory(self.path.parent)
+        # 같은 output_dir에 동시에 쓰는 작업끼리 임시 파일이 겹치지 않게 한다.
+        self._temp_path = temp_path_for(self.path)
+        try:
+            self._handle = self._temp_path.open("wb")
+        except OSError as error:
+            raise FriendlyError(user_message=f"결과 파일을 열 수 없습니다: {self.path}", detail=str(error)) from error
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        self._handle.write(dumps_json(record, compact=True))
+        self._handle.write(b"\n")
+        self.summary.add(record)
+
+    def close(self) -> None:
+        """파일을 닫고 최종 경로로 옮긴다. 예: writer.close()"""
+
+        if self._handle.closed:
+            return
+        self._handle.close()
+        os.replace(self._temp_path, self.path)
+
+    def discard(self) -> None:
+        """실패했을 때 임시 파일을 지운다. 예: writer.discard()"""
+
+        self._handle.close()
+        self._temp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "PatchResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def iter_patch_results(path: PathLike) -> Iterator[Dict[str, Any]]:
+    """JSONL 결과 파일을 한 줄씩 읽는다. 예: for record in iter_patch_results("output/patch_results.jsonl"): ..."""
+
+    try:
+        with Path(path).open("rb") as handle:
+            for line in handle:
+                if line.strip():
+                    yield loads_json(line)
+    except OSError as error:
+        raise FriendlyError(user_message=f"결과 파일을 읽을 수 없습니다: {path}", detail=str(error)) from error
@@ -1,10 +1,25 @@
-# v0.3 - 복합 위젯 op 처리/ CSS ID 매칭 개선 (2026-01-20)
+# v1.2 - 스캐너가 만드는 set_url/set_image_url op 등록, 지원 op 목록(SUPPORTED_OPS) 공개 (2026-10-17)
 # 기능: adapter patch를 Elementor JSON에 적용 (예: apply_patches_to_elementor(data, adapter, site_spec))
 
+from bisect import bisect_left, insort
 from copy import deepcopy
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-from .utils.dict_utils import get_nested_value, set_nested_value
+from .element_index import CSS_ID_SETTING_KEYS, ElementIndex, IndexedElement, extract_css_ids, get_root_element_list
+from .json_delta import JsonPatchOperation, diff_json, element_pointer
+from .spec_diff import KeyDependencyIndex
+from .utils.error_utils import FriendlyError
+from .utils.dict_utils import (
+    CompiledPath,
+    compile_path,
+    get_compiled_value,
+    set_compiled_value,
+)
+
+OpHandler = Callable[[Dict[str, Any], CompiledPath, Any, bool], bool]
+PatchResultSink = Callable[[Dict[str, Any]], None]
 
 
 def apply_patches_to_elementor(
@@ -12,191 +27,685 @@ def apply_patches_to_elementor(
     adapter: Dict[str, Any],
     site_spec: Dict[str, Any],
     strict_path: bool = True,
+    stats: Optional[Dict[str, Any]] = None,
+    copy_on_write: bool = False,
+    delta: Optional[List[JsonPatchOperation]] = None,
+    sink: Optional[PatchResultSink] = None,
 ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
-    """패치 목록을 적용한다. 예: patched, results = apply_patches_to_elementor(...)"""
-
-    patched_data = deepcopy(elementor_data)
-    patch_results: List[Dict[str, Any]] = []
+    """패치 목록을 적용한다. 예: patched, results = apply_patches_to_elementor(..., copy_on_write=True)
+
+    copy_on_write=True면 전체 deepcopy 대신 변경되는 요소까지의 경로만 복사하고
+    나머지 하위 트리는 원본과 공유한다. 원본 elementor_data는 어느 모드에서도 바뀌지 않는다.
+    delta 리스트를 넘기면 원본 → 결과 RFC 6902 연산을 채운다(json_delta.apply_delta로 복원).
+    sink를 넘기면 결과를 모으지 않고 만들어지는 대로 sink에 넘긴다(반환 results는 빈 리스트).
+    """
+
+    plan = compile_adapter(adapter, elementor_data, strict_path=strict_path)
+    return plan.apply(site_spec, copy_on_write=copy_on_write, stats=stats, delta=delta, sink=sink)
+
+
+@dataclass(frozen=True)
+class CompiledPatch:
+    """미리 해석된 단일 패치. 예: plan.patches[0].target_keys
+
+    page/patch_index는 어댑터 안 위치(pages[].post_slug, 그 페이지 patches의 순번)로, 결과 레코드가 패치를 가리킬 때 쓴다.
+    """
+
+    patch: Dict[str, Any]
+    op: Optional[str]
+    key_path: Optional[str]
+    key_keys: CompiledPath
+    target_path: Optional[str]
+    target_keys: CompiledPath
+    element_id: Optional[str]
+    css_id: Optional[str]
+    targets: Tuple[IndexedElement, ...]
+    handler: Optional[OpHandler]
+    is_valid: bool
+    page: Optional[str] = None
+    patch_index: int = 0
+
+    @property
+    def writes_target_path(self) -> bool:
+        """핸들러가 path에 값을 그대로 쓰는지. 구조 전용 핸들러는 settings를 직접 다룬다. 예: compiled.writes_target_path"""
+
+        return self.handler is _set_path_value
+
+
+@dataclass(frozen=True)
+class AdapterPlan:
+    """템플릿 하나에 대해 컴파일된 어댑터. 예: plan = compile_adapter(adapter, elementor_data)"""
+
+    template_id: Optional[str]
+    elementor_data: Any
+    element_index: ElementIndex
+    patches: Tuple[CompiledPatch, ...]
+    strict_path: bool
+    # 한글: 증분 적용용. site_spec 키 → 패치 번호, 패치 번호 → 전체 적용 때 실제로 쓰는 요소(없으면 None),
+    #       요소 순서 → 그 요소에 실제로 쓰는 패치 번호, 플랜이 지우는 요소.
+    dependencies: KeyDependencyIndex = field(default_factory=KeyDependencyIndex)
+    resolved_targets: Tuple[Optional[IndexedElement], ...] = ()
+    patches_by_element: Dict[int, Tuple[int, ...]] = field(default_factory=dict)
+    deleted_targets: Tuple[IndexedElement, ...] = ()
+    supports_incremental: bool = False
+
+    def apply(
+        self,
+        site_spec: Dict[str, Any],
+        *,
+        copy_on_write: bool = False,
+        stats: Optional[Dict[str, Any]] = None,
+        delta: Optional[List[JsonPatchOperation]] = None,
+        sink: Optional[PatchResultSink] = None,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """site_spec 하나에 플랜을 적용한다. 예: patched, results = plan.apply(site_spec, delta=ops)
+
+        delta 리스트를 넘기면 템플릿 → 결과 RFC 6902 연산을 채운다. 트리 전체를 비교하지 않고
+        이번 적용에서 쓴 요소와 삭제한 요소만 보므로 비용은 바뀐 요소 크기에 비례한다.
+        sink(예: patch_results.PatchResultWriter)를 넘기면 결과를 리스트에 모으지 않고 하나씩 넘기며,
+        반환되는 results는 빈 리스트다.
+        """
+
+        workspace = _PatchWorkspace(
+            self.elementor_data,
+            self.element_index,
+            copy_on_write=copy_on_write,
+        )
+        patch_results: List[Dict[str, Any]] = []
+        emit = patch_results.append if sink is None else sink
+        for compiled in self.patches:
+            emit(
+                _apply_compiled_patch(
+                    workspace=workspace,
+                    compiled=compiled,
+                    site_spec=site_spec,
+                    strict_path=self.strict_path,
+                )
+            )
 
-    for page in adapter.get("pages", []):
-        for patch in page.get("patches", []):
-            result = _apply_single_patch(
-                patched_data=patched_data,
-                patch=patch,
+        if stats is not None:
+            stats.update(workspace.build_stats())
+        if delta is not None:
+            delta.extend(workspace.build_delta())
+
+        return workspace.patched_data, patch_results
+
+    def apply_batch(
+        self,
+        site_specs: Iterable[Dict[str, Any]],
+        *,
+        copy_on_write: bool = True,
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """여러 site_spec에 플랜을 적용한다. 예: outputs = plan.apply_batch([spec_a, spec_b])
+
+        기본값(copy_on_write=True)에서는 결과 문서들이 바뀌지 않은 하위 트리를 원본과 공유하므로
+        결과를 제자리에서 수정하지 말고 그대로 저장/전송해야 한다.
+        """
+
+        return [self.apply(site_spec, copy_on_write=copy_on_write) for site_spec in site_specs]
+
+    def affected_patches(self, changed_keys: Iterable[str]) -> List[int]:
+        """바뀐 site_spec 키를 읽는 패치 번호. 예: plan.affected_patches(["brand.tagline"])"""
+
+        return self.dependencies.affected(changed_keys)
+
+    def apply_incremental(
+        self,
+        previous_patched: Any,
+        site_spec: Dict[str, Any],
+        changed_keys: Iterable[str],
+        *,
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> "IncrementalPatchResult":
+        """이전 결과 문서에 바뀐 키를 읽는 패치만 다시 적용한다. 예: plan.apply_incremental(previous, new_spec, diff_site_spec(old_spec, new_spec))
+
+        previous_patched는 같은 플랜의 apply 결과여야 한다. 영향받는 요소만 템플릿 상태로 되돌린 뒤
+        그 요소에 쓰는 패치를 원래 순서대로 다시 적용하므로 결과는 전체 apply와 같고, 비용은 수정 크기에 비례한다.
+        패치 대상은 컴파일 때 전체 apply와 같은 순서(삭제 포함)로 정해 두므로 같은 CSS ID를 가진 요소가 여럿이어도 엇갈리지 않는다.
+        나머지 트리는 previous_patched와 공유한다(copy-on-write). previous_patched 자체는 바뀌지 않는다.
+        요소 id/CSS ID를 바꾸는 패치가 있으면 위치를 믿을 수 없으므로 전체 apply로 돌아간다(mode="full").
+        """
+
+        affected = self.affected_patches(changed_keys)
+        if not affected:
+            return IncrementalPatchResult(previous_patched, {}, changed=False, mode="unchanged")
+        if not self.supports_incremental:
+            return self._apply_full(previous_patched, site_spec, affected, stats)
+
+        workspace = _PatchWorkspace(previous_patched, self.element_index, copy_on_write=True)
+        # 한글: 삭제는 site_spec 값을 읽지 않으므로 이전 문서에 이미 반영돼 있다. 위치 계산용으로만 등록한다.
+        for entry in self.deleted_targets:
+            workspace.mark_deleted(entry)
+
+        # 한글: 대상은 컴파일 때 플랜 순서(삭제 위치 포함)로 해석해 둔 것을 쓴다. 나중에 지워진 요소에 쓴 패치는
+        #       결과 문서에 흔적이 없으므로 되돌릴 요소도 없다.
+        reset_entries: Dict[int, IndexedElement] = {}
+        for patch_index in affected:
+            entry = self.resolved_targets[patch_index]
+            if entry is not None and self.patches[patch_index].op != "delete" and workspace.is_alive(entry):
+                reset_entries[entry.order] = entry
+
+        previous_elements = {order: workspace.live_element(entry) for order, entry in reset_entries.items()}
+        for entry in reset_entries.values():
+            workspace.reset_element(entry)
+
+        replay = set(affected)
+        for order in reset_entries:
+            replay.update(self.patches_by_element.get(order, ()))
+
+        patch_results: Dict[int, Dict[str, Any]] = {}
+        for patch_index in sorted(replay):
+            compiled = self.patches[patch_index]
+            if compiled.op == "delete":
+                continue
+            patch_results[patch_index] = _apply_compiled_patch(
+                workspace=workspace,
+                compiled=compiled,
                 site_spec=site_spec,
-                strict_path=strict_path,
+                strict_path=self.strict_path,
+                target=self.resolved_targets[patch_index],
             )
-            patch_results.append(result)
 
-    return patched_data, patch_results
+        if workspace.has_key_overrides:
+            return self._apply_full(previous_patched, site_spec, affected, stats)
+
+        changed_elements = sum(
+            1
+            for order, entry in reset_entries.items()
+            if workspace.live_element(entry) != previous_elements[order]
+        )
+        if stats is not None:
+            stats.update(workspace.build_stats())
+            stats.update(
+                {
+                    "affected_patches": len(affected),
+                    "replayed_patches": len(patch_results),
+                    "reset_elements": len(reset_entries),
+                    "changed_elements": changed_elements,
+                }
+            )
+
+        if not changed_elements:
+            return IncrementalPatchResult(previous_patched, patch_results, changed=False, mode="incremental")
+        return IncrementalPatchResult(workspace.patched_data, patch_results, changed=True, mode="incremental")
+
+    def _apply_full(
+        self,
+        previous_patched: Any,
+        site_spec: Dict[str, Any],
+        affected: List[int],
+        stats: Optional[Dict[str, Any]],
+    ) -> "IncrementalPatchResult":
+        """증분 적용이 불가능할 때 전체를 다시 적용한다. 예: self._apply_full(previous, site_spec, affected, stats)"""
+
+        patched_data, patch_results = self.apply(site_spec, copy_on_write=True, stats=stats)
+        if stats is not None:
+            stats["affected_patches"] = len(affected)
+        return IncrementalPatchResult(
+            patched_data,
+            dict(enumerate(patch_results)),
+            changed=patched_data != previous_patched,
+            mode="full",
+        )
+
+
+@dataclass(frozen=True)
+class IncrementalPatchResult:
+    """증분 적용 결과. 예: result.patched_data, result.changed
+
+    patch_results는 다시 적용한 패치만 {패치 번호: 결과}로 담는다(mode="full"이면 전체).
+    changed가 False면 patched_data는 이전 문서 그대로라 다시 저장할 필요가 없다.
+    """
+
+    patched_data: Any
+    patch_results: Dict[int, Dict[str, Any]]
+    changed: bool
+    mode: str
+
+
+def compile_adapter(
+    adapter: Dict[str, Any],
+    elementor_data: Any,
+    strict_path: bool = True,
+    element_index: Optional[ElementIndex] = None,
+) -> AdapterPlan:
+    """어댑터를 템플릿 기준으로 한 번만 해석한다. 예: plan = compile_adapter(adapter, elementor_data)
+
+    같은 문서에 여러 어댑터를 컴파일할 때는 element_index를 넘겨 인덱스를 다시 만들지 않는다.
+    """
+
+    # 한글: 요소 인덱스는 원본 기준으로 한 번만 만들고 모든 패치/site_spec이 재사용한다.
+    if element_index is None:
+        element_index = ElementIndex.build(elementor_data)
+    compiled_patches = [
+        _compile_patch(patch, element_index, page.get("post_slug"), patch_index)
+        for page in adapter.get("pages", [])
+        for patch_index, patch in enumerate(page.get("patches", []))
+    ]
+
+    supports_incremental = not any(_may_rekey(compiled) for compiled in compiled_patches)
+    resolved_targets: List[Optional[IndexedElement]] = []
+    patches_by_element: Dict[int, List[int]] = {}
+    deleted_targets: List[IndexedElement] = []
+    if supports_incremental:
+        resolved_targets = _resolve_targets(compiled_patches, elementor_data, element_index)
+        for patch_index, (compiled, entry) in enumerate(zip(compiled_patches, resolved_targets)):
+            if entry is None:
+                continue
+            if compiled.op == "delete":
+                deleted_targets.append(entry)
+            else:
+                patches_by_element.setdefault(entry.order, []).append(patch_index)
+
+    return AdapterPlan(
+        template_id=adapter.get("template_id"),
+        elementor_data=elementor_data,
+        element_index=element_index,
+        patches=tuple(compiled_patches),
+        strict_path=strict_path,
+        dependencies=KeyDependencyIndex.build(
+            (patch_index, compiled.key_keys)
+            for patch_index, compiled in enumerate(compiled_patches)
+            if compiled.is_valid and compiled.op != "delete"
+        ),
+        resolved_targets=tuple(resolved_targets),
+        patches_by_element={order: tuple(indexes) for order, indexes in patches_by_element.items()},
+        deleted_targets=tuple(deleted_targets),
+        supports_incremental=supports_incremental,
+    )
+
+
+def _resolve_targets(
+    compiled_patches: Sequence[CompiledPatch],
+    elementor_data: Any,
+    element_index: ElementIndex,
+) -> List[Optional[IndexedElement]]:
+    """전체 apply가 각 패치에 쓰는 요소를 플랜 순서대로 정한다. 예: _resolve_targets(patches, data, index)
+
+    요소 키를 바꾸는 패치가 없으면(supports_incremental) 대상은 site_spec 값과 무관하고 앞선 삭제에만 달려 있으므로
+    삭제를 제자리에서 반영하며 한 번 훑으면 된다. 문서는 바꾸지 않는다.
+    """
+
+    workspace = _PatchWorkspace(elementor_data, element_index, copy_on_write=True)
+    resolved: List[Optional[IndexedElement]] = []
+    for compiled in compiled_patches:
+        entry = workspace.find(compiled.element_id, compiled.css_id, compiled.targets) if compiled.is_valid else None
+        if entry is not None and compiled.op == "delete":
+            workspace.mark_deleted(entry)
+        resolved.append(entry)
+    return resolved
 
 
-def _apply_single_patch(
-    patched_data: Dict[str, Any],
+def _may_rekey(compiled: CompiledPatch) -> bool:
+    """패치가 요소 id/CSS ID나 settings 밖을 바꿀 수 있는지. 예: _may_rekey(plan.patches[0])
+
+    구조 전용 핸들러(set_iconbox 등)는 값에 따라 settings나 settings.content를 통째로 바꿀 수 있으므로 항상 그렇다고 본다.
+    """
+
+    if not compiled.is_valid or compiled.op == "delete":
+        return False
+    if not compiled.writes_target_path:
+        return True
+    keys = compiled.target_keys
+    return len(keys) < 2 or keys[0] != "settings" or keys[1] in CSS_ID_SETTING_KEYS
+
+
+def _compile_patch(
     patch: Dict[str, Any],
-    site_spec: Dict[str, Any],
-    strict_path: bool,
-) -> Dict[str, Any]:
-    """단일 패치를 적용한다. 예: _apply_single_patch(patched_data, patch, site_spec, True)"""
+    element_index: ElementIndex,
+    page: Optional[str] = None,
+    patch_index: int = 0,
+) -> CompiledPatch:
+    """패치 하나를 컴파일한다. 예: _compile_patch(patch, element_index, "home", 0)"""
 
     element_id = patch.get("element_id")
     css_id = patch.get("css_id")
     op = patch.get("op")
     key_path = patch.get("key")
     target_path = patch.get("path")
+    is_valid = bool(op and key_path and target_path and (element_id or css_id))
 
-    if not op or not key_path or not target_path or (not element_id and not css_id):
-        return {
-            "status": "error",
-            "message": "patch 필수 필드가 누락되었습니다.",
-            "patch": patch,
-        }
-
-    element_parent, element_index, element = _find_element(
-        patched_data=patched_data,
+    return CompiledPatch(
+        patch=patch,
+        op=op,
+        key_path=key_path,
+        key_keys=compile_path(key_path) if is_valid else (),
+        target_path=target_path,
+        target_keys=compile_path(target_path) if is_valid else (),
         element_id=element_id,
         css_id=css_id,
+        targets=tuple(element_index.candidates(element_id, css_id)) if is_valid else (),
+        handler=_OP_HANDLERS.get(op, _set_path_value) if is_valid else None,
+        is_valid=is_valid,
+        page=page,
+        patch_index=patch_index,
     )
-    if element is None:
-        return {
-            "status": "error",
-            "message": f"요소를 찾을 수 없습니다: {element_id or css_id}",
-            "patch": patch,
-        }
 
-    if op == "delete":
-        # 삭제는 요소 자체를 리스트에서 제거한다.
-        _remove_element_by_index(element_parent, element_index)
-        return {
-            "status": "deleted",
-            "message": "요소를 삭제했습니다.",
-            "patch": patch,
-        }
 
-    value = get_nested_value(site_spec, key_path)
-    if value is None:
-        return {
-            "status": "skipped",
-            "message": f"site_spec 값이 없어 건너뜁니다: {key_path}",
-            "patch": patch,
-        }
+class _PatchWorkspace:
+    """패치 대상 문서와 인덱스 상태를 묶는다. 예: _PatchWorkspace(elementor_data, ElementIndex.build(data))"""
+
+    def __init__(
+        self,
+        elementor_data: Any,
+        element_index: ElementIndex,
+        copy_on_write: bool = False,
+    ) -> None:
+        self.element_index = element_index
+        self.copy_on_write = copy_on_write
+        self._copy_memo: Dict[int, Any] = {}
+        self._element_copies: Dict[int, Dict[str, Any]] = {}
+        self._children_copies: Dict[int, List[Any]] = {}
+        if copy_on_write:
+            # 한글: 처음에는 원본을 그대로 가리키고 쓰기 시점에 경로만 복사한다.
+            self.patched_data = elementor_data
+        else:
+            # 한글: deepcopy memo로 원본 노드 → 복사본 노드를 바로 찾는다.
+            self.patched_data = deepcopy(elementor_data, self._copy_memo)
+        self._deleted_orders: Set[int] = set()
+        self._deleted_positions: Dict[int, List[int]] = {}
+        # 한글: 패치로 id/CSS ID가 바뀐 요소는 인덱스 대신 현재 값으로 매칭한다.
+        self._key_overrides: Dict[int, Tuple[Optional[str], List[str]]] = {}
+        self._gained_entries: List[IndexedElement] = []
+        # 한글: 델타용 적용 기록. 쓰기 위해 꺼낸 요소와 삭제한 요소만 남긴다.
+        self._root_is_list = isinstance(elementor_data, list)
+        self._touched: Dict[int, IndexedElement] = {}
+        self._deleted_entries: List[IndexedElement] = []
+        self.lookup_count = 0
+        self.lookup_seconds = 0.0
+
+    def find(
+        self,
+        element_id: Optional[str],
+        css_id: Optional[str],
+        candidates: Optional[Sequence[IndexedElement]] = None,
+    ) -> Optional[IndexedElement]:
+        """삭제되지 않은 첫 번째 일치 요소를 찾는다. 예: workspace.find("hero", None)"""
+
+        started = perf_counter()
+        found: Optional[IndexedElement] = None
+        if candidates is None:
+            candidates = self.element_index.candidates(element_id, css_id)
+        if self._key_overrides:
+            candidates = self._apply_key_overrides(candidates, element_id, css_id)
+        for entry in candidates:
+            if self._is_alive(entry):
+                found = entry
+                break
+        self.lookup_count += 1
+        self.lookup_seconds += perf_counter() - started
+        return found
+
+    def writable_element(self, entry: IndexedElement) -> Dict[str, Any]:
+        """수정 가능한 요소를 반환한다. 예: workspace.writable_element(entry)"""
+
+        self._touched[entry.order] = entry
+        if not self.copy_on_write:
+            return self._copy_memo[id(entry.element)]
+
+        copied = self._element_copies.get(entry.order)
+        if copied is None:
+            siblings = self._writable_children(entry.parent)
+            position = self._live_position(entry)
+            # 한글: 자식 elements는 공유하고 settings 등 요소 자체 값만 복사한다.
+            #       patch path는 요소 settings 아래를 가리킨다고 가정한다.
+            #       복사 원본은 현재 문서의 요소다(증분 적용이면 이전 결과, 아니면 템플릿).
+            copied = {
+                key: value if key == "elements" else deepcopy(value)
+                for key, value in siblings[position].items()
+            }
+            siblings[position] = copied
+            self._element_copies[entry.order] = copied
+        return copied
+
+    def live_element(self, entry: IndexedElement) -> Dict[str, Any]:
+        """현재 문서에서 요소를 읽기 전용으로 찾는다. 예: workspace.live_element(entry)
+
+        문서 구조가 인덱스와 맞지 않으면(다른 플랜의 결과 문서 등) FriendlyError를 낸다.
+        """
+
+        copied = self._element_copies.get(entry.order)
+        if copied is not None:
+            return copied
+        if entry.parent is None:
+            siblings = get_root_element_list(self.patched_data)
+        else:
+            siblings = self.live_element(entry.parent).get("elements")
+        position = self._live_position(entry)
+        if not isinstance(siblings, list) or not 0 <= position < len(siblings):
+            raise FriendlyError(
+                user_message="이전 결과 문서가 어댑터 플랜과 맞지 않아 요소를 찾을 수 없습니다.",
+                detail=f"path={element_pointer(entry.index_path(), self._root_is_list)}, position={position}",
+            )
+        return siblings[position]
 
-    # 한글: op별로 처리 방식이 다를 수 있어 분기한다.
-    success = _apply_patch_value(
-        element=element,
-        target_path=target_path,
-        value=value,
-        op=op,
-        strict_path=strict_path,
-    )
-    if not success:
-        return {
-            "status": "error",
-            "message": f"경로 설정 실패: {target_path}",
-            "patch": patch,
+    def reset_element(self, entry: IndexedElement) -> None:
+        """요소 값을 템플릿 상태로 되돌린다. 자식은 현재 문서 것을 유지한다. 예: workspace.reset_element(entry)"""
+
+        siblings = self._writable_children(entry.parent)
+        position = self._live_position(entry)
+        live = siblings[position]
+        copied = {
+            key: live.get("elements", value) if key == "elements" else deepcopy(value)
+            for key, value in entry.element.items()
         }
+        siblings[position] = copied
+        self._element_copies[entry.order] = copied
 
-    return {
-        "status": "applied",
-        "message": "패치가 적용되었습니다.",
-        "patch": patch,
-    }
+    def delete(self, entry: IndexedElement) -> None:
+        """요소를 부모 리스트에서 제거한다. 예: workspace.delete(entry)"""
 
+        parent_key = _parent_key(entry)
+        elements_parent = self._writable_children(entry.parent)
+        _remove_element_by_index(elements_parent, self._live_position(entry))
 
-def _apply_patch_value(
-    *,
-    element: Dict[str, Any],
-    target_path: str,
-    value: Any,
-    op: str,
-    strict_path: bool,
-) -> bool:
-    """op별로 값을 적용한다. 예: _apply_patch_value(element, "settings.title", "텍스트", "set_text", True)"""
+        # 한글: 뒤쪽 형제의 위치는 삭제된 앞쪽 개수만큼 당겨서 계산한다.
+        insort(self._deleted_positions.setdefault(parent_key, []), entry.index)
+        self._deleted_orders.add(entry.order)
+        self._deleted_entries.append(entry)
 
-    # 한글: 기본 텍스트/HTML/이미지 경로는 그대로 세팅한다.
-    if op in {"set_text", "set_html", "set_image"}:
-        return set_nested_value(element, target_path, value, strict=strict_path)
+    def build_delta(self) -> List[JsonPatchOperation]:
+        """적용 기록으로 원본 → 결과 RFC 6902 연산을 만든다. 예: workspace.build_delta()
 
-    # 한글: 강조 텍스트는 리스트 구조를 유지해야 한다.
-    if op == "set_highlighted_text":
-        return _set_highlighted_text(element, value, strict_path)
+        replace/add/remove를 원본 위치 기준으로 먼저 모두 내고, 요소 삭제는 뒤에서부터 내서
+        앞선 연산의 위치가 밀리지 않게 한다. 지워진 요소 안쪽의 변경은 내지 않는다.
+        """
 
-    # 한글: 아이콘 리스트는 배열 구조를 유지해야 한다.
-    if op == "set_icon_list":
-        return _set_icon_list(element, value, strict_path)
+        operations: List[JsonPatchOperation] = []
+        for order in sorted(self._touched):
+            entry = self._touched[order]
+            if not self._is_alive(entry):
+                continue
+            current = self._element_copies[order] if self.copy_on_write else self._copy_memo[id(entry.element)]
+            pointer = element_pointer(entry.index_path(), self._root_is_list)
+            diff_json(entry.element, current, pointer, operations, skip_keys=("elements",))
 
-    # 한글: UiCore Counter는 number/suffix/title만 부분 업데이트한다.
-    if op == "set_counter":
-        return _set_counter(element, value, strict_path)
+        removed = [entry for entry in self._deleted_entries if entry.parent is None or self._is_alive(entry.parent)]
+        for entry in sorted(removed, key=_entry_order_desc):
+            operations.append({"op": "remove", "path": element_pointer(entry.index_path(), self._root_is_list)})
+        return operations
 
-    # 한글: UiCore Icon Box는 기존 settings를 유지하며 필요한 필드만 업데이트한다.
-    if op == "set_iconbox":
-        return _set_icon_box(element, value, strict_path)
+    def is_alive(self, entry: IndexedElement) -> bool:
+        """요소와 조상이 이번 적용에서 지워지지 않았는지. 예: workspace.is_alive(entry)"""
 
-    # 한글: 기본 처리 (경로 그대로 세팅)
-    return set_nested_value(element, target_path, value, strict=strict_path)
+        return self._is_alive(entry)
 
+    def mark_deleted(self, entry: IndexedElement) -> None:
+        """이미 지워진 요소를 위치 계산에만 반영한다. 예: workspace.mark_deleted(entry)"""
 
-def _find_element(
-    *,
-    patched_data: Dict[str, Any],
-    element_id: Optional[str],
-    css_id: Optional[str],
-) -> Tuple[Optional[List[Dict[str, Any]]], Optional[int], Optional[Dict[str, Any]]]:
-    """중첩 포함 요소를 찾는다. 예: _find_element(patched_data=data, element_id="hero", css_id=None)"""
+        insort(self._deleted_positions.setdefault(_parent_key(entry), []), entry.index)
+        self._deleted_orders.add(entry.order)
 
-    elements_root = _get_elements_root(patched_data)
-    for parent, index, element in _walk_elements_with_parent(elements_root):
-        if element_id and element.get("id") == element_id:
-            return parent, index, element
-        if css_id and _matches_css_id(element.get("settings"), css_id):
-            return parent, index, element
+    @property
+    def has_key_overrides(self) -> bool:
+        return bool(self._key_overrides)
 
-    return None, None, None
+    def refresh_keys(self, entry: IndexedElement) -> None:
+        """패치 후 요소의 id/CSS ID 변경을 반영한다. 예: workspace.refresh_keys(entry)"""
 
+        element = self.writable_element(entry)
+        current_keys = _element_keys(element)
+        if current_keys == _element_keys(entry.element):
+            self._key_overrides.pop(entry.order, None)
+            return
 
-def _get_elements_root(patched_data: Any) -> List[Dict[str, Any]]:
-    """Elementor 루트 elements를 반환한다. 예: _get_elements_root(patched_data)"""
+        if entry.order not in self._key_overrides:
+            self._gained_entries.append(entry)
+        self._key_overrides[entry.order] = current_keys
 
-    if isinstance(patched_data, list):
-        return [item for item in patched_data if isinstance(item, dict)]
+    def build_stats(self) -> Dict[str, Any]:
+        """인덱스 생성/조회 시간을 반환한다. 예: workspace.build_stats()"""
 
-    if isinstance(patched_data, dict):
-        elements = patched_data.get("elements")
-        if isinstance(elements, list):
-            return [item for item in elements if isinstance(item, dict)]
+        return {
+            "element_count": len(self.element_index),
+            "index_build_ms": round(self.element_index.build_seconds * 1000, 3),
+            "lookup_count": self.lookup_count,
+            "lookup_ms": round(self.lookup_seconds * 1000, 3),
+        }
 
-    return []
+    def _writable_children(self, parent: Optional[IndexedElement]) -> List[Any]:
+        """수정 가능한 자식 리스트를 반환한다. 예: workspace._writable_children(entry.parent)"""
+
+        if not self.copy_on_write:
+            if parent is None:
+                return self._copy_memo[id(self.element_index.root_elements)]
+            return self.writable_element(parent)["elements"]
+
+        parent_key = -1 if parent is None else parent.order
+        copied = self._children_copies.get(parent_key)
+        if copied is None:
+            if parent is None:
+                copied = list(get_root_element_list(self.patched_data))
+                self._replace_root_elements(copied)
+            else:
+                owner = self.writable_element(parent)
+                copied = list(owner["elements"])
+                owner["elements"] = copied
+            self._children_copies[parent_key] = copied
+        return copied
+
+    def _replace_root_elements(self, root_elements: List[Any]) -> None:
+        """루트 elements 리스트를 복사본으로 교체한다. 예: workspace._replace_root_elements(copied)"""
+
+        if isinstance(self.patched_data, list):
+            self.patched_data = root_elements
+            return
+
+        self.patched_data = dict(self.patched_data)
+        self.patched_data["elements"] = root_elements
+
+    def _live_position(self, entry: IndexedElement) -> int:
+        """삭제를 반영한 현재 위치를 계산한다. 예: workspace._live_position(entry)"""
+
+        deleted = self._deleted_positions.get(_parent_key(entry))
+        if not deleted:
+            return entry.index
+        return entry.index - bisect_left(deleted, entry.index)
+
+    def _apply_key_overrides(
+        self,
+        candidates: Sequence[IndexedElement],
+        element_id: Optional[str],
+        css_id: Optional[str],
+    ) -> List[IndexedElement]:
+        """변경된 id/CSS ID를 후보 목록에 반영한다. 예: workspace._apply_key_overrides(candidates, "hero", None)"""
+
+        merged: Dict[int, IndexedElement] = {}
+        for entry in candidates:
+            if entry.order not in self._key_overrides:
+                merged[entry.order] = entry
+        for entry in self._gained_entries:
+            keys = self._key_overrides.get(entry.order)
+            if keys is None:
+                continue
+            current_id, current_css_ids = keys
+            if (element_id and current_id == element_id) or (css_id and css_id in current_css_ids):
+                merged[entry.order] = entry
+        return [merged[order] for order in sorted(merged)]
+
+    def _is_alive(self, entry: IndexedElement) -> bool:
+        """요소나 조상이 삭제되지 않았는지 확인한다. 예: workspace._is_alive(entry)"""
+
+        if not self._deleted_orders:
+            return True
 
+        current: Optional[IndexedElement] = entry
+        while current is not None:
+            if current.order in self._deleted_orders:
+                return False
+            current = current.parent
+        return True
 
-def _walk_elements_with_parent(
-    elements: List[Dict[str, Any]],
-) -> Iterable[Tuple[List[Dict[str, Any]], int, Dict[str, Any]]]:
-    """요소와 부모 리스트를 함께 순회한다. 예: _walk_elements_with_parent(elements)"""
 
-    for index, element in enumerate(elements):
-        if not isinstance(element, dict):
-            continue
-        yield elements, index, element
+# _apply_compiled_patch의 target 기본값: 현재 문서에서 대상을 찾는다.
+_FIND_TARGET = object()
 
-        children = element.get("elements", [])
-        if isinstance(children, list):
-            yield from _walk_elements_with_parent(children)
 
+def _apply_compiled_patch(
+    workspace: _PatchWorkspace,
+    compiled: CompiledPatch,
+    site_spec: Dict[str, Any],
+    strict_path: bool,
+    target: Any = _FIND_TARGET,
+) -> Dict[str, Any]:
+    """컴파일된 단일 패치를 적용하고 결과 레코드를 반환한다. 예: _apply_compiled_patch(workspace, compiled, site_spec, True)
 
-def _matches_css_id(settings: Any, css_id: str) -> bool:
-    """settings의 CSS ID가 일치하는지 확인한다. 예: _matches_css_id(settings, "hero_title")"""
+    레코드는 패치를 복사하지 않고 어댑터 안 위치(page, patch_index)로 가리킨다.
+    실패/건너뜀은 code로 구분하고, 설명은 patch_results.PATCH_RESULT_MESSAGES에 있다.
+    target을 넘기면(증분 적용) 찾지 않고 그 요소에 쓴다. 뒤 패치가 지운 요소면 결과만 맞추고 문서에는 쓰지 않는다.
+    """
 
-    if not isinstance(settings, dict):
-        return False
+    if not compiled.is_valid:
+        return _patch_result(compiled, "error", code="invalid_patch")
 
-    # 한글: Elementor는 _element_id로 저장하는 경우가 많다.
-    for key in ("_element_id", "_css_id", "css_id", "cssId", "cssid"):
-        value = settings.get(key)
-        if isinstance(value, str) and value.strip() == css_id:
-            return True
+    entry = workspace.find(compiled.element_id, compiled.css_id, compiled.targets) if target is _FIND_TARGET else target
+    if entry is None:
+        return _patch_result(compiled, "error", code="element_not_found", target=compiled.element_id or compiled.css_id)
 
-    return False
+    if compiled.op == "delete":
+        # 삭제는 요소 자체를 리스트에서 제거한다.
+        workspace.delete(entry)
+        return _patch_result(compiled, "deleted")
+
+    value = get_compiled_value(site_spec, compiled.key_keys)
+    if value is None:
+        return _patch_result(compiled, "skipped", code="missing_value", key=compiled.key_path)
+
+    # 한글: op별 처리는 컴파일 시점에 묶어둔 핸들러가 담당한다.
+    alive = workspace.is_alive(entry)
+    success = compiled.handler(
+        workspace.writable_element(entry) if alive else deepcopy(entry.element),
+        compiled.target_keys,
+        value,
+        strict_path,
+    )
+    if alive:
+        workspace.refresh_keys(entry)
+    if not success:
+        return _patch_result(compiled, "error", code="path_failed", path=compiled.target_path)
+
+    return _patch_result(compiled, "applied")
+
+
+def _patch_result(compiled: CompiledPatch, status: str, code: Optional[str] = None, **detail: Any) -> Dict[str, Any]:
+    """결과 레코드 하나. 예: _patch_result(compiled, "skipped", code="missing_value", key="brand.name")"""
+
+    record: Dict[str, Any] = {"page": compiled.page, "patch_index": compiled.patch_index, "status": status}
+    if code is not None:
+        record["code"] = code
+        record.update(detail)
+    return record
+
+
+def _set_path_value(
+    element: Dict[str, Any],
+    target_keys: CompiledPath,
+    value: Any,
+    strict_path: bool,
+) -> bool:
+    """경로 그대로 값을 세팅한다. 예: _set_path_value(el, ("settings", "title"), "텍스트", True)"""
+
+    return set_compiled_value(element, target_keys, value, strict=strict_path)
 
 
 def _remove_element_by_index(
@@ -212,8 +721,35 @@ def _remove_element_by_index(
         elements_parent.pop(element_index)
 
 
-def _set_highlighted_text(element: Dict[str, Any], value: Any, strict_path: bool) -> bool:
-    """강조 텍스트 위젯에 안전하게 값 적용. 예: _set_highlighted_text(el, "문장", True)"""
+def _entry_order_desc(entry: IndexedElement) -> int:
+    """뒤에서부터 정렬하는 키. 예: sorted(entries, key=_entry_order_desc)"""
+
+    return -entry.order
+
+
+def _parent_key(entry: IndexedElement) -> int:
+    """부모 리스트 식별 키를 반환한다. 루트는 -1. 예: _parent_key(entry)"""
+
+    return -1 if entry.parent is None else entry.parent.order
+
+
+def _element_keys(element: Dict[str, Any]) -> Tuple[Optional[str], List[str]]:
+    """요소의 매칭 키(id, CSS ID 목록)를 반환한다. 예: _element_keys(element)"""
+
+    element_id = element.get("id")
+    return (
+        element_id if isinstance(element_id, str) else None,
+        extract_css_ids(element.get("settings")),
+    )
+
+
+def _set_highlighted_text(
+    element: Dict[str, Any],
+    target_keys: CompiledPath,
+    value: Any,
+    strict_path: bool,
+) -> bool:
+    """강조 텍스트 위젯에 안전하게 값 적용. 예: _set_highlighted_text(el, keys, "문장", True)"""
 
     settings = element.get("settings")
     if not isinstance(settings, dict):
@@ -222,7 +758,7 @@ def _set_highlighted_text(element: Dict[str, Any], value: Any, strict_path: bool
     content = settings.get("content")
     if not isinstance(content, list) or not content:
         # 한글: 구조가 다르면 기본 경로에 바로 세팅 시도
-        return set_nested_value(element, "settings.content", value, strict=strict_path)
+        return set_compiled_value(element, _SETTINGS_CONTENT_KEYS, value, strict=strict_path)
 
     # 한글: 문자열이면 첫 번째 텍스트만 교체한다.
     if isinstance(value, str):
@@ -243,8 +779,13 @@ def _set_highlighted_text(element: Dict[str, Any], value: Any, strict_path: bool
     return False
 
 
-def _set_icon_list(element: Dict[str, Any], value: Any, strict_path: bool) -> bool:
-    """아이콘 리스트 위젯에 안전하게 값 적용. 예: _set_icon_list(el, ["a","b"], True)"""
+def _set_icon_list(
+    element: Dict[str, Any],
+    target_keys: CompiledPath,
+    value: Any,
+    strict_path: bool,
+) -> bool:
+    """아이콘 리스트 위젯에 안전하게 값 적용. 예: _set_icon_list(el, keys, ["a","b"], True)"""
 
     settings = element.get("settings")
     if not isinstance(settings, dict):
@@ -252,7 +793,7 @@ def _set_icon_list(element: Dict[str, Any], value: Any, strict_path: bool) -> bo
 
     icon_list = settings.get("icon_list")
     if not isinstance(icon_list, list) or not icon_list:
-        return set_nested_value(element, "settings.icon_list", value, strict=strict_path)
+        return set_compiled_value(element, _SETTINGS_ICON_LIST_KEYS, value, strict=strict_path)
 
     if isinstance(value, str):
         if isinstance(icon_list[0], dict):
@@ -271,8 +812,13 @@ def _set_icon_list(element: Dict[str, Any], value: Any, strict_path: bool) -> bo
     return False
 
 
-def _set_counter(element: Dict[str, Any], value: Any, strict_path: bool) -> bool:
-    """카운터 위젯에 안전하게 값 적용. 예: _set_counter(el, {"number":"10","suffix":"%","title":"만족도"}, True)"""
+def _set_counter(
+    element: Dict[str, Any],
+    target_keys: CompiledPath,
+    value: Any,
+    strict_path: bool,
+) -> bool:
+    """카운터 위젯에 안전하게 값 적용. 예: _set_counter(el, keys, {"number":"10","suffix":"%","title":"만족도"}, True)"""
 
     settings = element.get("settings")
     if not isinstance(settings, dict):
@@ -293,8 +839,13 @@ def _set_counter(element: Dict[str, Any], value: Any, strict_path: bool) -> bool
     return False
 
 
-def _set_icon_box(element: Dict[str, Any], value: Any, strict_path: bool) -> bool:
-    """아이콘 박스 위젯에 안전하게 값 적용. 예: _set_icon_box(el, {...}, True)"""
+def _set_icon_box(
+    element: Dict[str, Any],
+    target_keys: CompiledPath,
+    value: Any,
+    strict_path: bool,
+) -> bool:
+    """아이콘 박스 위젯에 안전하게 값 적용. 예: _set_icon_box(el, keys, {...}, True)"""
 
     settings = element.get("settings")
     if not isinstance(settings, dict):
@@ -302,7 +853,7 @@ def _set_icon_box(element: Dict[str, Any], value: Any, strict_path: bool) -> boo
 
     if not isinstance(value, dict):
         # 한글: 비정상 값은 그대로 세팅 시도
-        return set_nested_value(element, "settings", value, strict=strict_path)
+        return set_compiled_value(element, _SETTINGS_KEYS, value, strict=strict_path)
 
     # 한글: 텍스트 계열
     for key in ("title", "subtitle", "description"):
@@ -322,3 +873,38 @@ def _set_icon_box(element: Dict[str, Any], value: Any, strict_path: bool) -> boo
         settings["image"] = value["image"]
 
     return True
+
+
+_SETTINGS_KEYS = compile_path("settings")
+_SETTINGS_CONTENT_KEYS = compile_path("settings.content")
+_SETTINGS_ICON_LIST_KEYS = compile_path("settings.icon_list")
+
+# 한글: op → 핸들러 테이블. 등록되지 않은 op는 경로 그대로 세팅한다.
+_OP_HANDLERS: Dict[str, OpHandler] = {
+    # 기본 텍스트/HTML/이미지 경로는 그대로 세팅한다.
+    "set_text": _set_path_value,
+    "set_html": _set_path_value,
+    "set_image": _set_path_value,
+    # 스캐너 어댑터 초안이 링크/이미지 필드에 쓰는 op
+    "set_url": _set_path_value,
+    "set_image_url": _set_path_value,
+    # 강조 텍스트는 리스트 구조를 유지해야 한다.
+    "set_highlighted_text": _set_highlighted_text,
+    # 아이콘 리스트는 배열 구조를 유지해야 한다.
+    "set_icon_list": _set_icon_list,
+    # UiCore Counter는 number/suffix/title만 부분 업데이트한다.
+    "set_counter": _set_counter,
+    # UiCore Icon Box는 기존 settings를 유지하며 필요한 필드만 업데이트한다.
+    "set_iconbox": _set_icon_box,
+}
+
+# 한글: 어댑터에 쓸 수 있는 op. 이 밖의 op도 경로 세팅으로 적용되지만 lint-adapter가 오타로 보고한다.
+SUPPORTED_OPS = frozenset(_OP_HANDLERS) | {"delete"}
+
+# 한글: 구조 전용 핸들러 op → 맞는 위젯 타입. 다른 위젯에 쓰면 settings 구조가 달라 값이 엉뚱한 곳에 들어간다.
+OP_WIDGET_TYPES: Dict[str, Tuple[str, ...]] = {
+    "set_highlighted_text": ("highlighted-text", "uicore-highlighted-text"),
+    "set_icon_list": ("icon-list",),
+    "set_counter": ("uicore-counter", "counter"),
+    "set_iconbox": ("uicore-icon-box", "icon-box"),
+}
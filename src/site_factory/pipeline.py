@@ -1,27 +1,192 @@
-# v0.1 - 파이프라인 실행 뼈대 추가 (2026-01-16)
+# v1.2 - thread 단계의 메모리 최대값이 다른 측정과 겹치면 null로 기록 (2026-10-17)
 # 기능: Mock 기반으로 어댑터 적용과 리포트 생성 (예: run_pipeline(..., use_mock=True))
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import threading
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
+from .checkpoint import CheckpointStore
 from .contracts import validate_adapter, validate_site_spec
+from .json_delta import DELTA_FILE_NAME, build_delta_document
+from .patch_results import PATCH_RESULTS_FILE_NAME, PatchResultWriter, PatchSummary
 from .patcher import apply_patches_to_elementor
 from .utils.error_utils import FriendlyError
-from .utils.io_utils import ensure_directory, read_json_file, write_json_file
+from .utils.io_utils import ensure_directory, file_sha256, file_signature, read_json_file, write_json_file
 from .utils.time_utils import get_iso_timestamp
+from .utils.trace_utils import StageTimer, file_size, memory_window_peak, start_memory_window
+
+STAGE_EXECUTORS = ("thread", "process")
+# docs/ROADMAP.md STEP 번호 → 단계 이름. 주입하는 단계도 이 이름을 쓰면 리포트에 STEP 번호가 붙는다.
+ROADMAP_STAGES: Dict[int, str] = {
+    1: "infra",
+    2: "template_import",
+    3: "site_spec",
+    4: "images",
+    5: "elementor_injection",
+    6: "seo",
+    7: "url_replace",
+    8: "smoke_test",
+}
+DEFAULT_STAGE_WORKERS = 4
+# 단계가 출력과 함께 돌려줄 수 있는 지표 키. provides에 적지 않아도 되고 timings의 그 단계 항목에 붙는다.
+STAGE_METRICS_KEY = "stage_metrics"
+
+StageRunner = Callable[[Dict[str, Any], "PipelineDependencies"], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """파이프라인 단계 하나. 예: Stage(name="images", run=generate_images, requires={"site_spec": dict}, provides={"image_map": dict})
+
+    run(inputs, deps)는 requires에 적은 입력만 받아 provides에 적은 출력을 딕셔너리로 돌려준다 (타입은 isinstance로 확인).
+    executor는 I/O 위주면 "thread", CPU 위주면 "process"다. process 단계는 run/입력/출력/deps가 pickle 가능해야 한다.
+    timeout(초)은 제출 시점부터 잰다. 넘으면 실행을 실패로 끝낸다 (이미 돌고 있는 스레드는 강제로 멈추지 못한다).
+    checkpoint면 입력 지문으로 출력을 저장해 두고, is_fresh가 있으면 저장된 출력이 아직 유효한지 한 번 더 확인한다.
+    run이 "stage_metrics" 딕셔너리(예: {"bytes_read": 1024})를 같이 돌려주면 run_report timings에 기록한다.
+    """
+
+    name: str
+    run: StageRunner
+    requires: Mapping[str, type] = field(default_factory=dict)
+    provides: Mapping[str, type] = field(default_factory=dict)
+    executor: str = "thread"
+    timeout: Optional[float] = None
+    checkpoint: bool = False
+    is_fresh: Optional[Callable[[Dict[str, Any]], bool]] = None
 
 
 @dataclass(frozen=True)
 class PipelineDependencies:
-    """테스트를 위한 의존성 묶음. 예: PipelineDependencies(read_json=mock_read_json, ...)"""
+    """테스트를 위한 의존성 묶음. 예: PipelineDependencies(read_json=mock_read_json, ...)
+
+    stages를 주면 기본 단계 대신 그 단계 그래프를 실행한다. 예: stages=default_stages() + (images_stage,)
+    """
 
     read_json: Callable[[Path], Dict[str, Any]]
-    write_json: Callable[[Path, Dict[str, Any]], None]
+    write_json: Callable[..., None]
     ensure_dir: Callable[[Path], Path]
     now_iso: Callable[[], str]
+    stages: Tuple[Stage, ...] = ()
+
+
+@dataclass
+class StageRecord:
+    """단계 실행 결과. 예: StageRecord(name="site_spec", executor="thread", status="completed")
+
+    status는 completed, reused(체크포인트), skipped(뒤 단계를 재사용해 필요 없음), failed, timeout, not_run 중 하나다.
+    """
+
+    name: str
+    executor: str
+    depends_on: List[str]
+    status: str = "not_run"
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        """실행 시간(초). 실행하지 않았으면 0. 예: record.duration"""
+
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+@dataclass
+class StageGraphResult:
+    """단계 그래프 실행 결과. 예: result.artifacts["patch_results"]"""
+
+    artifacts: Dict[str, Any]
+    records: Dict[str, StageRecord]
+    critical_path: List[str]
+    started: float
+    finished: float
+
+    def to_report(self) -> Dict[str, Any]:
+        """run_report의 stages/critical_path 섹션을 만든다. 예: report.update(result.to_report())"""
+
+        steps = {name: step for step, name in ROADMAP_STAGES.items()}
+        stages = []
+        for record in self.records.values():
+            stage: Dict[str, Any] = {
+                "name": record.name,
+                "step": steps.get(record.name),
+                "executor": record.executor,
+                "status": record.status,
+                "depends_on": record.depends_on,
+                "ms": round(record.duration * 1000, 3),
+            }
+            if record.started is not None:
+                stage["start_ms"] = round((record.started - self.started) * 1000, 3)
+            stages.append(stage)
+
+        return {
+            "stages": stages,
+            "critical_path": {
+                "stages": self.critical_path,
+                "ms": round(sum(self.records[name].duration for name in self.critical_path) * 1000, 3),
+                "wall_ms": round((self.finished - self.started) * 1000, 3),
+            },
+        }
+
+
+def default_stages() -> Tuple[Stage, ...]:
+    """현재 구현된 기본 단계. 예: PipelineDependencies(..., stages=default_stages() + (seo_stage,))
+
+    template_import와 site_spec은 서로 의존하지 않아 동시에 읽는다. 패치는 CPU 위주지만
+    큰 Elementor 트리를 프로세스로 넘기는 비용이 더 커서 thread로 둔다.
+    """
+
+    return (
+        Stage(
+            name="template_import",
+            run=_stage_template_import,
+            requires={"adapter_path": Path, "elementor_path": Path},
+            provides={"adapter": dict, "elementor": dict},
+        ),
+        Stage(
+            name="site_spec",
+            run=_stage_site_spec,
+            requires={"site_spec_path": Path},
+            provides={"site_spec": dict},
+        ),
+        Stage(
+            name="elementor_injection",
+            run=_stage_elementor_injection,
+            requires={"site_spec": dict, "adapter": dict, "elementor": dict},
+            provides={
+                "patched_elementor": dict,
+                "patch_results": list,
+                "patch_summary": dict,
+                "patch_stats": dict,
+                "elementor_delta": list,
+            },
+            checkpoint=True,
+        ),
+        Stage(
+            name="write_outputs",
+            run=_stage_write_outputs,
+            requires={
+                "patched_elementor": dict,
+                "patch_results": list,
+                "elementor_delta": list,
+                "elementor_path": Path,
+                "output_dir": Path,
+                "compact_json": bool,
+                "delta_only": bool,
+            },
+            provides={"output_files": dict},
+            checkpoint=True,
+            is_fresh=_outputs_unchanged,
+        ),
+    )
 
 
 def default_dependencies() -> PipelineDependencies:
@@ -32,6 +197,7 @@ def default_dependencies() -> PipelineDependencies:
         write_json=write_json_file,
         ensure_dir=ensure_directory,
         now_iso=get_iso_timestamp,
+        stages=default_stages(),
     )
 
 
@@ -45,12 +211,26 @@ def run_pipeline(
     use_mock: bool,
     logger,
     dependencies: Optional[PipelineDependencies] = None,
+    compact_json: bool = False,
+    timer: Optional[StageTimer] = None,
+    checkpoint_dir: Optional[Path] = None,
+    delta_only: bool = False,
 ) -> Dict[str, Any]:
-    """파이프라인 실행. 예: run_pipeline(..., use_mock=True)"""
+    """파이프라인 실행. 예: run_pipeline(..., use_mock=True)
+
+    compact_json이면 patched_elementor.json을 들여쓰기 없이 저장한다. 패치 결과는 항상 한 줄에 하나씩 patch_results.jsonl로 저장한다.
+    템플릿 → 결과 RFC 6902 델타(elementor_delta.json)는 항상 저장하고, delta_only면 patched_elementor.json은 쓰지 않는다.
+    단계별 소요 시간은 run_report의 timings에 기록된다 (timer를 넘기면 Chrome trace로도 꺼낼 수 있다).
+    단계는 deps.stages 그래프로 실행되고, 단계별 상태와 임계 경로가 run_report의 stages/critical_path에 남는다.
+    checkpoint_dir를 주면 체크포인트 단계 출력을 입력 지문 키로 저장해 두고,
+    재실행 때 입력이 그대로인 단계는 건너뛰고 첫 번째로 바뀐 단계부터 다시 계산한다.
+    """
 
     deps = dependencies or default_dependencies()
+    timer = timer or StageTimer()
 
-    config = _load_config(config_path=config_path, deps=deps)
+    with timer.span("load_config", bytes_read=file_size(config_path)):
+        config = _load_config(config_path=config_path, deps=deps)
 
     if use_mock:
         site_spec_path = Path("data/mock/site_spec.sample.json")
@@ -62,44 +242,545 @@ def run_pipeline(
             user_message="site_spec, adapter, elementor 경로가 필요합니다. --use-mock 또는 경로를 지정해주세요."
         )
 
-    site_spec = deps.read_json(site_spec_path)
-    adapter = deps.read_json(adapter_path)
-    elementor_data = deps.read_json(elementor_path)
-
-    validate_site_spec(site_spec)
-    validate_adapter(adapter)
-
-    logger.info("어댑터 패치를 적용합니다.")
-    patched_elementor, patch_results = apply_patches_to_elementor(
-        elementor_data=elementor_data,
-        adapter=adapter,
-        site_spec=site_spec,
-        strict_path=True,
-    )
-
     output_root = deps.ensure_dir(output_dir)
-    patched_path = output_root / "patched_elementor.json"
-    results_path = output_root / "patch_results.json"
     report_path = output_root / "run_report.json"
+    checkpoints = CheckpointStore(checkpoint_dir) if checkpoint_dir else None
 
-    deps.write_json(patched_path, patched_elementor)
-    deps.write_json(results_path, {"results": patch_results})
+    logger.info("어댑터 패치를 적용합니다.")
+    graph = run_stage_graph(
+        deps.stages or default_stages(),
+        {
+            "config": config,
+            "site_spec_path": Path(site_spec_path),
+            "adapter_path": Path(adapter_path),
+            "elementor_path": Path(elementor_path),
+            "output_dir": Path(output_root),
+            "compact_json": compact_json,
+            "delta_only": delta_only,
+        },
+        deps=deps,
+        outputs=("patch_summary", "patch_stats"),
+        checkpoints=checkpoints,
+        timer=timer,
+    )
+    patch_summary = graph.artifacts["patch_summary"]
+    patch_stats = graph.artifacts["patch_stats"]
+    logger.info(
+        "요소 인덱스: %s개 요소, 생성 %sms, 조회 %s회 %sms",
+        patch_stats["element_count"],
+        patch_stats["index_build_ms"],
+        patch_stats["lookup_count"],
+        patch_stats["lookup_ms"],
+    )
+    reused = [record.name for record in graph.records.values() if record.status == "reused"]
+    if reused:
+        logger.info("체크포인트를 재사용한 단계: %s", ", ".join(reused))
 
-    run_report = _build_run_report(
+    # run_report 자신의 저장 시간은 리포트에 넣을 수 없어 trace에만 남는다.
+    run_report = build_run_report(
         config=config,
         site_spec_path=site_spec_path,
         adapter_path=adapter_path,
         elementor_path=elementor_path,
         output_dir=output_root,
-        patch_results=patch_results,
+        patch_summary=patch_summary,
+        patch_stats=patch_stats,
+        timings=timer.to_report(),
         deps=deps,
+        checkpoints=checkpoints.to_report() if checkpoints else None,
+        stage_report=graph.to_report(),
+        delta_only=delta_only,
     )
-    deps.write_json(report_path, run_report)
+    with timer.span("write_run_report"):
+        deps.write_json(report_path, run_report)
 
     logger.info("파이프라인이 완료되었습니다.")
     return run_report
 
 
+def run_stage_graph(
+    stages: Sequence[Stage],
+    initial: Dict[str, Any],
+    *,
+    deps: PipelineDependencies,
+    outputs: Sequence[str] = (),
+    checkpoints: Optional[CheckpointStore] = None,
+    timer: Optional[StageTimer] = None,
+    max_workers: int = DEFAULT_STAGE_WORKERS,
+) -> StageGraphResult:
+    """단계 그래프를 의존성 순서대로 실행한다. 예: run_stage_graph(default_stages(), {"site_spec_path": path, ...}, deps=deps)
+
+    입력이 모두 준비된 단계는 바로 제출해 서로 의존하지 않는 단계가 겹쳐 돈다.
+    outputs는 호출한 쪽이 결과에서 꺼낼 산출물 이름이다. 체크포인트를 재사용한 단계의 출력은
+    뒤 단계나 outputs가 필요로 할 때만 읽고, 아무도 쓰지 않는 단계는 실행하지 않는다(skipped).
+    """
+
+    timer = timer or StageTimer()
+    order, providers, upstream = _resolve_stage_graph(stages, initial, outputs)
+    downstream: Dict[str, List[str]] = {stage.name: [] for stage in order}
+    for name, dependencies in upstream.items():
+        for dependency in dependencies:
+            downstream[dependency].append(name)
+
+    keys: Dict[str, str] = {}
+    if checkpoints:
+        with timer.span("hash_inputs"):
+            keys = _stage_keys(order, providers, initial, checkpoints)
+
+    artifacts = dict(initial)
+    run_set, reused, loaded = _plan_stage_reuse(order, downstream, outputs, checkpoints, keys, timer)
+    for values in loaded.values():
+        artifacts.update(values)
+
+    records = {
+        stage.name: StageRecord(name=stage.name, executor=stage.executor, depends_on=upstream[stage.name])
+        for stage in order
+    }
+    for stage in order:
+        if stage.name in reused:
+            records[stage.name].status = "reused"
+        elif stage.name not in run_set:
+            records[stage.name].status = "skipped"
+
+    started = perf_counter()
+    pending = [stage for stage in order if stage.name in run_set]
+    running: Dict[Future, Tuple[Stage, Optional[float]]] = {}
+    pools: Dict[str, Executor] = {}
+    try:
+        while pending or running:
+            for stage in list(pending):
+                if any(records[name].status == "not_run" for name in upstream[stage.name] if name in run_set):
+                    continue
+                pending.remove(stage)
+                pool = pools.get(stage.executor) or pools.setdefault(
+                    stage.executor,
+                    ProcessPoolExecutor(max_workers=max_workers)
+                    if stage.executor == "process"
+                    else ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stage"),
+                )
+                inputs = {name: artifacts[name] for name in stage.requires}
+                deadline = perf_counter() + stage.timeout if stage.timeout else None
+                running[pool.submit(_call_stage, stage.run, inputs, deps, timer.track_memory)] = (stage, deadline)
+
+            deadlines = [deadline for _, deadline in running.values() if deadline is not None]
+            wait_seconds = max(0.0, min(deadlines) - perf_counter()) if deadlines else None
+            done, _ = wait(running, timeout=wait_seconds, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                stage, _ = running.pop(future)
+                values = _finish_stage(stage, future, records[stage.name], timer)
+                artifacts.update(values)
+                if checkpoints and stage.checkpoint:
+                    with timer.span("save_checkpoint", stage=stage.name):
+                        checkpoints.save(stage.name, keys[stage.name], values)
+
+            now = perf_counter()
+            for stage, deadline in running.values():
+                if deadline is not None and now >= deadline:
+                    records[stage.name].status = "timeout"
+                    raise FriendlyError(
+                        user_message=f"'{stage.name}' 단계가 제한 시간({stage.timeout}초)을 넘었습니다.",
+                        detail=f"executor={stage.executor}",
+                    )
+    finally:
+        for pool in pools.values():
+            # 실패/타임아웃이면 남은 단계를 기다리지 않고 취소한다.
+            pool.shutdown(wait=not running, cancel_futures=True)
+
+    if checkpoints:
+        for stage in order:
+            status = records[stage.name].status
+            checkpoints.record(stage.name, keys[stage.name], "computed" if status == "completed" else status)
+
+    return StageGraphResult(
+        artifacts=artifacts,
+        records=records,
+        critical_path=_critical_path(records, upstream),
+        started=started,
+        finished=perf_counter(),
+    )
+
+
+def _resolve_stage_graph(
+    stages: Sequence[Stage],
+    initial: Dict[str, Any],
+    outputs: Sequence[str],
+) -> Tuple[List[Stage], Dict[str, str], Dict[str, List[str]]]:
+    """산출물 이름으로 단계 의존성을 풀고 위상 정렬한다. 예: order, providers, upstream = _resolve_stage_graph(stages, initial, [])"""
+
+    providers: Dict[str, str] = {}
+    provided_types: Dict[str, type] = {}
+    names: Set[str] = set()
+    for stage in stages:
+        if stage.name in names:
+            raise FriendlyError(user_message=f"같은 이름의 단계가 여러 개입니다: {stage.name}")
+        if stage.executor not in STAGE_EXECUTORS:
+            raise FriendlyError(
+                user_message=f"'{stage.name}' 단계의 executor는 {', '.join(STAGE_EXECUTORS)} 중 하나여야 합니다: {stage.executor}"
+            )
+        names.add(stage.name)
+        for name, expected in stage.provides.items():
+            if name in initial or name in providers:
+                owner = providers.get(name, "입력값")
+                raise FriendlyError(user_message=f"산출물 '{name}'을 여러 곳에서 만듭니다: {owner}, {stage.name}")
+            providers[name] = stage.name
+            provided_types[name] = expected
+
+    upstream: Dict[str, List[str]] = {}
+    for stage in stages:
+        for name, expected in stage.requires.items():
+            if name in providers:
+                if not issubclass(provided_types[name], expected):
+                    raise FriendlyError(
+                        user_message=f"'{stage.name}' 단계 입력 '{name}'의 타입이 맞지 않습니다.",
+                        detail=f"{providers[name]}: {provided_types[name].__name__}, {stage.name}: {expected.__name__}",
+                    )
+            elif name not in initial:
+                raise FriendlyError(user_message=f"'{stage.name}' 단계의 입력 '{name}'을 만드는 단계가 없습니다.")
+            elif not isinstance(initial[name], expected):
+                raise FriendlyError(
+                    user_message=f"'{stage.name}' 단계 입력 '{name}'의 타입이 맞지 않습니다.",
+                    detail=f"기대: {expected.__name__}, 실제: {type(initial[name]).__name__}",
+                )
+        upstream[stage.name] = sorted({providers[name] for name in stage.requires if name in providers})
+
+    missing_outputs = [name for name in outputs if name not in providers and name not in initial]
+    if missing_outputs:
+        raise FriendlyError(user_message=f"요청한 산출물을 만드는 단계가 없습니다: {', '.join(missing_outputs)}")
+
+    # 선언 순서를 유지하는 위상 정렬. 단계 수가 적어 단순 반복으로 충분하다.
+    order: List[Stage] = []
+    placed: Set[str] = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [stage for stage in remaining if all(name in placed for name in upstream[stage.name])]
+        if not ready:
+            raise FriendlyError(
+                user_message="단계 의존성에 순환이 있습니다.",
+                detail=", ".join(stage.name for stage in remaining),
+            )
+        for stage in ready:
+            order.append(stage)
+            placed.add(stage.name)
+            remaining.remove(stage)
+
+    return order, providers, upstream
+
+
+def _stage_keys(
+    order: List[Stage],
+    providers: Dict[str, str],
+    initial: Dict[str, Any],
+    checkpoints: CheckpointStore,
+) -> Dict[str, str]:
+    """단계별 체크포인트 키. 앞 단계 산출물은 그 단계 키로 대신해 변경이 뒤로 전파된다. 예: _stage_keys(order, providers, initial, store)"""
+
+    keys: Dict[str, str] = {}
+    fingerprints: Dict[str, str] = {}
+    for stage in order:
+        inputs = []
+        for name in sorted(stage.requires):
+            if name in providers:
+                inputs.append(f"{name}={keys[providers[name]]}")
+                continue
+            if name not in fingerprints:
+                fingerprints[name] = checkpoints.fingerprint(initial[name])
+            inputs.append(f"{name}={fingerprints[name]}")
+        keys[stage.name] = checkpoints.stage_key(stage.name, *inputs)
+    return keys
+
+
+def _plan_stage_reuse(
+    order: List[Stage],
+    downstream: Dict[str, List[str]],
+    outputs: Sequence[str],
+    checkpoints: Optional[CheckpointStore],
+    keys: Dict[str, str],
+    timer: StageTimer,
+) -> Tuple[Set[str], Set[str], Dict[str, Dict[str, Any]]]:
+    """실행할 단계, 재사용할 단계, 읽어 둔 체크포인트 출력을 정한다. 예: run_set, reused, loaded = _plan_stage_reuse(...)
+
+    읽다가 손상된 체크포인트가 나오면 지우고 그 단계를 다시 실행하도록 계획을 다시 세운다.
+    """
+
+    loaded: Dict[str, Dict[str, Any]] = {}
+    reused: Set[str] = set()
+    if checkpoints:
+        for stage in order:
+            if not stage.checkpoint or not checkpoints.has(stage.name, keys[stage.name]):
+                continue
+            if stage.is_fresh:
+                values = _load_stage_checkpoint(stage, checkpoints, keys[stage.name], timer)
+                if values is None or not stage.is_fresh(values):
+                    continue
+                loaded[stage.name] = values
+            reused.add(stage.name)
+
+    while True:
+        run_set: Set[str] = set()
+        load_set: Set[str] = set()
+        for stage in reversed(order):
+            needed = any(name in outputs for name in stage.provides) or any(
+                name in run_set for name in downstream[stage.name]
+            )
+            if stage.name in reused:
+                if needed:
+                    load_set.add(stage.name)
+            elif needed or not downstream[stage.name]:
+                run_set.add(stage.name)
+
+        missing = [stage for stage in order if stage.name in load_set and stage.name not in loaded]
+        if not missing:
+            return run_set, reused, {name: values for name, values in loaded.items() if name in load_set}
+
+        for stage in missing:
+            values = _load_stage_checkpoint(stage, checkpoints, keys[stage.name], timer)
+            if values is None:
+                checkpoints.discard(stage.name, keys[stage.name])
+                reused.discard(stage.name)
+            else:
+                loaded[stage.name] = values
+
+
+def _load_stage_checkpoint(
+    stage: Stage,
+    checkpoints: CheckpointStore,
+    key: str,
+    timer: StageTimer,
+) -> Optional[Dict[str, Any]]:
+    """단계 체크포인트 출력을 모두 읽는다. 하나라도 없으면 None. 예: _load_stage_checkpoint(stage, store, key, timer)"""
+
+    values: Dict[str, Any] = {}
+    with timer.span("read_checkpoint", stage=stage.name):
+        for name in stage.provides:
+            value = checkpoints.load(stage.name, key, name)
+            if value is None:
+                return None
+            values[name] = value
+    return values
+
+
+def _call_stage(
+    run: StageRunner,
+    inputs: Dict[str, Any],
+    deps: PipelineDependencies,
+    track_memory: bool = False,
+) -> Tuple[Dict[str, Any], float, float, int, int, Optional[int]]:
+    """워커 스레드/프로세스에서 단계를 실행하고 시간(과 메모리 최대 증가량)을 잰다. 예: _call_stage(stage.run, inputs, deps, True)
+
+    tracemalloc 최대값은 프로세스 전체에 하나라 reset_peak()이 다른 thread 단계의 측정을 지운다.
+    단계 도중 다른 단계/구간이 측정을 시작했으면 peak는 None이고, 아니어도 동시에 도는 thread 단계의 할당이 섞인 상한값이다.
+    process 단계는 워커 하나가 한 번에 단계 하나만 돌리므로 그 단계만의 값이다.
+    """
+
+    started_tracing = False
+    window = None
+    if track_memory:
+        if not tracemalloc.is_tracing():
+            # process 워커는 부모의 tracemalloc 상태를 물려받지 않는다.
+            tracemalloc.start()
+            started_tracing = True
+        window = start_memory_window()
+
+    started = perf_counter()
+    try:
+        values = run(inputs, deps)
+        finished = perf_counter()
+        peak_bytes = memory_window_peak(window) if window is not None else None
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return values, started, finished, os.getpid(), threading.get_ident(), peak_bytes
+
+
+def _finish_stage(
+    stage: Stage,
+    future: Future,
+    record: StageRecord,
+    timer: StageTimer,
+) -> Dict[str, Any]:
+    """끝난 단계의 출력을 확인하고 기록한다. 예: values = _finish_stage(stage, future, record, timer)"""
+
+    try:
+        values, started, finished, pid, thread_id, peak_bytes = future.result()
+    except FriendlyError:
+        record.status = "failed"
+        raise
+    except Exception as error:
+        record.status = "failed"
+        raise FriendlyError(
+            user_message=f"'{stage.name}' 단계가 실패했습니다.",
+            detail=str(error),
+        ) from error
+
+    if not isinstance(values, dict):
+        record.status = "failed"
+        raise FriendlyError(user_message=f"'{stage.name}' 단계는 딕셔너리를 반환해야 합니다.")
+    for name, expected in stage.provides.items():
+        if not isinstance(values.get(name), expected):
+            record.status = "failed"
+            raise FriendlyError(
+                user_message=f"'{stage.name}' 단계 출력 '{name}'이 없거나 타입이 맞지 않습니다.",
+                detail=f"기대: {expected.__name__}, 실제: {type(values.get(name)).__name__}",
+            )
+
+    metrics = values.get(STAGE_METRICS_KEY) or {}
+    if not isinstance(metrics, dict):
+        record.status = "failed"
+        raise FriendlyError(user_message=f"'{stage.name}' 단계의 {STAGE_METRICS_KEY}는 딕셔너리여야 합니다.")
+
+    record.status = "completed"
+    record.started = started
+    record.finished = finished
+    timer.add_span(
+        stage.name,
+        started,
+        finished,
+        # 프로세스 단계는 trace에서 워커 pid를 tid로 써서 따로 보이게 한다.
+        thread_id=pid if stage.executor == "process" else thread_id,
+        peak_bytes=peak_bytes,
+        executor=stage.executor,
+        **metrics,
+    )
+    return {name: values[name] for name in stage.provides}
+
+
+def _critical_path(records: Dict[str, StageRecord], upstream: Dict[str, List[str]]) -> List[str]:
+    """가장 늦게 끝난 단계에서 거슬러 올라간 임계 경로. 예: _critical_path(records, upstream) → ["site_spec", "elementor_injection"]"""
+
+    finished = {name: record for name, record in records.items() if record.finished is not None}
+    if not finished:
+        return []
+
+    current = max(finished.values(), key=lambda record: record.finished).name
+    path = [current]
+    while True:
+        previous = [finished[name] for name in upstream[current] if name in finished]
+        if not previous:
+            break
+        current = max(previous, key=lambda record: record.finished).name
+        path.append(current)
+    return list(reversed(path))
+
+
+def _stage_template_import(inputs: Dict[str, Any], deps: PipelineDependencies) -> Dict[str, Any]:
+    """STEP 2: 어댑터와 템플릿 Elementor JSON을 읽는다. 예: _stage_template_import({"adapter_path": ..., "elementor_path": ...}, deps)"""
+
+    adapter = deps.read_json(inputs["adapter_path"])
+    validate_adapter(adapter)
+    return {
+        "adapter": adapter,
+        "elementor": deps.read_json(inputs["elementor_path"]),
+        STAGE_METRICS_KEY: {"bytes_read": _total_size([inputs["adapter_path"], inputs["elementor_path"]])},
+    }
+
+
+def _stage_site_spec(inputs: Dict[str, Any], deps: PipelineDependencies) -> Dict[str, Any]:
+    """STEP 3: site_spec을 읽고 검증한다. 예: _stage_site_spec({"site_spec_path": Path("site_spec.json")}, deps)"""
+
+    site_spec = deps.read_json(inputs["site_spec_path"])
+    validate_site_spec(site_spec)
+    return {"site_spec": site_spec, STAGE_METRICS_KEY: {"bytes_read": file_size(inputs["site_spec_path"])}}
+
+
+def _stage_elementor_injection(inputs: Dict[str, Any], deps: PipelineDependencies) -> Dict[str, Any]:
+    """STEP 5: 어댑터 패치를 적용한다. 예: _stage_elementor_injection({"site_spec": ..., "adapter": ..., "elementor": ...}, deps)"""
+
+    patch_stats: Dict[str, Any] = {}
+    elementor_delta: List[Dict[str, Any]] = []
+    patch_results: List[Dict[str, Any]] = []
+    summary = PatchSummary()
+
+    def collect(record: Dict[str, Any]) -> None:
+        patch_results.append(record)
+        summary.add(record)
+
+    patched_elementor, _ = apply_patches_to_elementor(
+        elementor_data=inputs["elementor"],
+        adapter=inputs["adapter"],
+        site_spec=inputs["site_spec"],
+        strict_path=True,
+        stats=patch_stats,
+        copy_on_write=True,
+        delta=elementor_delta,
+        sink=collect,
+    )
+    return {
+        "patched_elementor": patched_elementor,
+        "patch_results": patch_results,
+        "patch_summary": summary.to_dict(),
+        "patch_stats": patch_stats,
+        "elementor_delta": elementor_delta,
+        STAGE_METRICS_KEY: {"element_count": patch_stats.get("element_count"), "patch_count": len(patch_results)},
+    }
+
+
+def _stage_write_outputs(inputs: Dict[str, Any], deps: PipelineDependencies) -> Dict[str, Any]:
+    """패치 결과 파일을 저장한다. 예: _stage_write_outputs({"patched_elementor": ..., "output_dir": Path("output"), ...}, deps)"""
+
+    output_root = inputs["output_dir"]
+    results_path = output_root / PATCH_RESULTS_FILE_NAME
+    delta_path = output_root / DELTA_FILE_NAME
+    written = [results_path, delta_path]
+    if not inputs["delta_only"]:
+        patched_path = output_root / "patched_elementor.json"
+        _write_artifact(deps, patched_path, inputs["patched_elementor"], inputs["compact_json"])
+        written.append(patched_path)
+    with PatchResultWriter(results_path) as writer:
+        for record in inputs["patch_results"]:
+            writer(record)
+    delta_document = build_delta_document(
+        inputs["elementor_delta"],
+        inputs["elementor_path"],
+        file_sha256(inputs["elementor_path"]),
+    )
+    _write_artifact(deps, delta_path, delta_document, inputs["compact_json"])
+    return {
+        "output_files": {str(path): file_signature(path) for path in written},
+        STAGE_METRICS_KEY: {"bytes_written": _total_size(written)},
+    }
+
+
+def _total_size(paths: Iterable[Path]) -> Optional[int]:
+    """있는 파일 크기의 합. 하나도 없으면 None. 예: _total_size([adapter_path, elementor_path])"""
+
+    sizes = [size for size in (file_size(path) for path in paths) if size is not None]
+    return sum(sizes) if sizes else None
+
+
+def _outputs_unchanged(values: Dict[str, Any]) -> bool:
+    """이전에 쓴 출력 파일이 그대로 남아 있는지 확인한다. 예: _outputs_unchanged({"output_files": {...}})"""
+
+    files = values.get("output_files") or {}
+    return bool(files) and all(
+        signature is not None and file_signature(Path(path)) == signature for path, signature in files.items()
+    )
+
+
+def summarize_patch_results(patch_results: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """패치 결과를 상태별로 센다. 예: summarize_patch_results(results) → {"total_patches": 3, "applied": 2, ...}"""
+
+    summary = PatchSummary()
+    for record in patch_results:
+        summary.add(record)
+    return summary.to_dict()
+
+
+def _write_artifact(
+    deps: PipelineDependencies,
+    path: Path,
+    data: Any,
+    compact: bool,
+) -> None:
+    """산출물을 저장한다. 예: _write_artifact(deps, path, data, compact=True)"""
+
+    # compact를 요청할 때만 인자를 넘겨 (path, data)만 받는 테스트용 write_json도 그대로 쓸 수 있게 한다.
+    if compact:
+        deps.write_json(path, data, compact=True)
+    else:
+        deps.write_json(path, data)
+
+
 def _load_config(config_path: Path, deps: PipelineDependencies) -> Dict[str, Any]:
     """설정 파일을 로드한다. 예: _load_config(Path("config.sample.json"), deps)"""
 
@@ -116,19 +797,27 @@ def _load_config(config_path: Path, deps: PipelineDependencies) -> Dict[str, Any
         ) from error
 
 
-def _build_run_report(
+def build_run_report(
     *,
     config: Dict[str, Any],
     site_spec_path: Path,
     adapter_path: Path,
     elementor_path: Path,
     output_dir: Path,
-    patch_results: list,
+    patch_summary: Dict[str, int],
+    patch_stats: Dict[str, Any],
+    timings: Dict[str, Any],
     deps: PipelineDependencies,
+    checkpoints: Optional[Dict[str, Any]] = None,
+    stage_report: Optional[Dict[str, Any]] = None,
+    delta_only: bool = False,
 ) -> Dict[str, Any]:
-    """실행 리포트를 생성한다. 예: report = _build_run_report(...)"""
+    """실행 리포트를 생성한다. 예: report = build_run_report(..., patch_summary=writer.summary.to_dict())
 
-    return {
+    summary는 결과를 다시 훑지 않고 적용하면서 센 patch_summary(PatchSummary.to_dict())를 그대로 쓴다.
+    """
+
+    report = {
         "status": "completed",
         "timestamp": deps.now_iso(),
         "config": {
@@ -142,14 +831,16 @@ def _build_run_report(
         },
         "outputs": {
             "output_dir": str(output_dir),
-            "patched_elementor": str(output_dir / "patched_elementor.json"),
-            "patch_results": str(output_dir / "patch_results.json"),
-        },
-        "summary": {
-            "total_patches": len(patch_results),
-            "applied": sum(1 for result in patch_results if result.get("status") == "applied"),
-            "skipped": sum(1 for result in patch_results if result.get("status") == "skipped"),
-            "errors": sum(1 for result in patch_results if result.get("status") == "error"),
-            "deleted": sum(1 for result in patch_results if result.get("status") == "deleted"),
+            "patched_elementor": None if delta_only else str(output_dir / "patched_elementor.json"),
+            "patch_results": str(output_dir / PATCH_RESULTS_FILE_NAME),
+            "elementor_delta": str(output_dir / DELTA_FILE_NAME),
         },
+        "summary": patch_summary,
+        "element_index": patch_stats,
+        "timings": timings,
     }
+    if stage_report is not None:
+        report.update(stage_report)
+    if checkpoints is not None:
+        report["checkpoints"] = checkpoints
+    return report
@@ -0,0 +1,138 @@
+# v0.4 - 파일 해시를 io_utils 헬퍼로 통일 (2026-10-17)
+# 기능: 입력 바이트 + ScanOptions 해시로 manifest/어댑터 스켈레톤을 디스크에 캐시 (예: ScanCache(".cache/scan"))
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import __version__
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import PathLike, ensure_directory, loads_json, update_file_digest, write_json_file
+
+# 스캐너 출력 형식이 바뀌면 올려서 기존 캐시를 무효화한다.
+SCAN_CACHE_FORMAT = 1
+DEFAULT_SCAN_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class ScanCacheStats:
+    """캐시 적중 통계. 예: cache.stats.hits"""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+
+class ScanCache:
+    """디스크 스캔 캐시. 예: cache = ScanCache(".cache/scan", max_bytes=64 * 1024 * 1024)"""
+
+    def __init__(
+        self,
+        cache_dir: PathLike,
+        max_bytes: int = DEFAULT_SCAN_CACHE_MAX_BYTES,
+    ) -> None:
+        self.cache_dir = ensure_directory(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = ScanCacheStats()
+
+    def build_key(self, raw: bytes, options: Any) -> str:
+        """입력 바이트와 옵션으로 캐시 키를 만든다. 예: cache.build_key(raw, options)"""
+
+        digest = hashlib.sha256()
+        digest.update(raw)
+        return self._finish_key(digest, options)
+
+    def build_file_key(self, file_path: PathLike, options: Any) -> str:
+        """파일 전체를 메모리에 올리지 않고 캐시 키를 만든다. 예: cache.build_file_key("data/kit.json", options)
+
+        build_key(파일 바이트, options)와 같은 키가 나온다.
+        """
+
+        digest = hashlib.sha256()
+        update_file_digest(digest, file_path)
+        return self._finish_key(digest, options)
+
+    def _finish_key(self, digest: Any, options: Any) -> str:
+        """입력 해시에 옵션/형식/버전을 더해 키를 완성한다. 예: self._finish_key(digest, options)"""
+
+        digest.update(b"\0")
+        option_values = asdict(options) if hasattr(options, "__dataclass_fields__") else options
+        digest.update(
+            json.dumps(
+                {
+                    "options": option_values,
+                    "format": SCAN_CACHE_FORMAT,
+                    "version": __version__,
+                },
+                sort_keys=True,
+                ensure_ascii=False,
+            ).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목을 조회한다. 없거나 손상되면 None. 예: cache.get(key)"""
+
+        entry_path = self._entry_path(key)
+        try:
+            entry = loads_json(entry_path.read_bytes())
+            # 최근 사용 시각을 갱신해 크기 기반 정리에서 뒤로 밀리게 한다.
+            os.utime(entry_path, None)
+        except (OSError, ValueError):
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """캐시 항목을 저장하고 용량을 넘으면 오래된 항목부터 지운다. 예: cache.put(key, entry)"""
+
+        try:
+            # write_json_file은 임시 파일 + rename이라 병렬 워커가 같은 키를 써도 안전하다.
+            write_json_file(self._entry_path(key), entry, compact=True)
+        except FriendlyError:
+            # 캐시 저장 실패는 스캔 결과에 영향을 주지 않는다.
+            return
+
+        self.stats.writes += 1
+        self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        """키에 해당하는 파일 경로. 예: cache._entry_path(key)"""
+
+        return self.cache_dir / f"{key}.json"
+
+    def _evict(self) -> None:
+        """용량 초과 시 가장 오래 사용하지 않은 항목부터 지운다. 예: cache._evict()"""
+
+        entries: List[Tuple[float, int, Path]] = []
+        total_bytes = 0
+        for item in os.scandir(self.cache_dir):
+            if not item.name.endswith(".json"):
+                continue
+            try:
+                item_stat = item.stat()
+            except OSError:
+                continue
+            entries.append((item_stat.st_mtime, item_stat.st_size, Path(item.path)))
+            total_bytes += item_stat.st_size
+
+        if total_bytes <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self.stats.evictions += 1
+            total_bytes -= size
+            if total_bytes <= self.max_bytes:
+                break
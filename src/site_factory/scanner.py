@@ -1,15 +1,28 @@
-# v0.1 - Elementor 스캐너 초기 구현 (2026-01-19)
+# v0.7 - elements 루트/settings 후보 추출 함수를 공개(extract_elements_root, extract_candidates_from_settings) (2026-10-17)
 # 기능: Elementor JSON에서 주입 후보를 추출하고 어댑터 스켈레톤을 생성
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from .auto_matcher import AutoMatcher, build_auto_adapter
+from .cssid_adapter import CssIdCollector, build_cssid_adapter
+from .scan_cache import ScanCache
+from .section_scanner import SectionScanner
+from .traversal import ElementVisit, ElementVisitor, run_visitors
 from .utils.error_utils import FriendlyError
-from .utils.io_utils import read_json_file, write_json_file, ensure_directory
+from .utils.io_utils import (
+    ensure_directory,
+    parse_json_bytes,
+    read_bytes_file,
+    read_json_file,
+    write_json_file,
+)
+from .utils.json_stream import ElementStream
 from .utils.time_utils import get_iso_timestamp
+from .utils.trace_utils import StageTimer, file_size
 
 
 @dataclass(frozen=True)
@@ -30,24 +43,18 @@ def scan_elementor_json(
     template_id: str = "unknown",
     max_candidates: int = 300,
     max_depth: int = 12,
+    cache: Optional[ScanCache] = None,
+    stream: bool = False,
+    timer: Optional[StageTimer] = None,
 ) -> Dict[str, Any]:
-    """Elementor JSON을 스캔한다. 예: scan_elementor_json(input_path=..., output_dir=...)"""
+    """Elementor JSON을 스캔한다. 예: scan_elementor_json(input_path=..., output_dir=..., cache=ScanCache(".cache/scan"))
 
-    try:
-        elementor_data = read_json_file(input_path)
-    except FriendlyError:
-        raise
-    except Exception as error:
-        raise FriendlyError(
-            user_message=f"Elementor JSON을 읽을 수 없습니다: {input_path}",
-            detail=str(error),
-        ) from error
+    cache가 있으면 입력 바이트 + 옵션 해시가 같은 이전 결과를 그대로 재사용한다.
+    stream=True면 문서 전체를 만들지 않고 루트 요소를 하나씩 읽으며, max_candidates에 닿으면 나머지를 읽지 않는다.
+    단계별 소요 시간은 결과의 timings에 기록된다.
+    """
 
-    elements_root = _extract_elements_root(elementor_data)
-    if not elements_root:
-        raise FriendlyError(
-            user_message="Elementor JSON에서 elements 루트를 찾을 수 없습니다."
-        )
+    timer = timer or StageTimer()
 
     options = ScanOptions(
         page_slug=page_slug,
@@ -56,33 +63,216 @@ def scan_elementor_json(
         max_depth=max_depth,
     )
 
-    candidates, stats = _collect_candidates(elements_root, options)
+    raw = None
+    if not stream:
+        with timer.span("read_input") as span:
+            raw = _read_elementor_bytes(input_path)
+            span["bytes_read"] = len(raw)
+
+    cache_key = None
+    cached = None
+    if cache is not None:
+        with timer.span("cache_lookup") as span:
+            cache_key = cache.build_file_key(input_path, options) if raw is None else cache.build_key(raw, options)
+            cached = cache.get(cache_key)
+            span["hit"] = cached is not None
+    stream_info: Optional[Dict[str, Any]] = None
+
+    if cached is not None:
+        # 같은 바이트가 다른 경로에 있을 수 있어 source_file만 현재 입력으로 바꾼다.
+        manifest = {**cached["manifest"], "source_file": str(input_path)}
+        adapter_skeleton = cached["adapter_skeleton"]
+        candidates = manifest["candidates"]
+        stats = manifest["stats"]
+    elif raw is None:
+        with timer.span("stream_collect", bytes_read=file_size(input_path)) as span:
+            candidates, stats, stream_info = _collect_candidates_streaming(input_path, options)
+            span["element_count"] = stats["element_count"]
+            span["candidate_count"] = len(candidates)
+    else:
+        with timer.span("parse"):
+            elements_root = extract_elements_root(parse_json_bytes(raw, input_path))
+        if not elements_root:
+            raise FriendlyError(
+                user_message="Elementor JSON에서 elements 루트를 찾을 수 없습니다."
+            )
 
-    manifest = _build_manifest(
-        input_path=input_path,
-        options=options,
-        candidates=candidates,
-        stats=stats,
-    )
-    adapter_skeleton = _build_adapter_skeleton(options, candidates)
+        with timer.span("collect") as span:
+            candidates, stats = _collect_candidates(elements_root, options)
+            span["element_count"] = stats["element_count"]
+            span["candidate_count"] = len(candidates)
+
+    if cached is None:
+        with timer.span("build_outputs"):
+            manifest = _build_manifest(
+                input_path=input_path,
+                options=options,
+                candidates=candidates,
+                stats=stats,
+            )
+            adapter_skeleton = _build_adapter_skeleton(options, candidates)
+        if cache is not None:
+            with timer.span("cache_store"):
+                cache.put(cache_key, {"manifest": manifest, "adapter_skeleton": adapter_skeleton})
 
     output_root = ensure_directory(output_dir)
     manifest_path = output_root / "manifest.json"
     adapter_path = output_root / "adapter_skeleton.json"
 
-    write_json_file(manifest_path, manifest)
-    write_json_file(adapter_path, adapter_skeleton)
+    with timer.span("write_outputs") as span:
+        write_json_file(manifest_path, manifest)
+        write_json_file(adapter_path, adapter_skeleton)
+        span["bytes_written"] = (file_size(manifest_path) or 0) + (file_size(adapter_path) or 0)
 
-    return {
+    result = {
         "manifest_path": str(manifest_path),
         "adapter_skeleton_path": str(adapter_path),
         "candidate_count": len(candidates),
         "stats": stats,
     }
+    if stream_info is not None:
+        result["stream"] = stream_info
+    if cache is not None:
+        result["cache"] = {
+            "status": "hit" if cached is not None else "miss",
+            "key": cache_key,
+            "hits": cache.stats.hits,
+            "misses": cache.stats.misses,
+            "evictions": cache.stats.evictions,
+        }
+    result["timings"] = timer.to_report()
+    return result
+
+
+def analyze_elementor_json(
+    *,
+    input_path: Path,
+    output_dir: Path,
+    page_slug: str,
+    template_id: str = "unknown",
+    site_spec: Optional[Dict[str, Any]] = None,
+    max_candidates: int = 300,
+    max_depth: int = 12,
+) -> Dict[str, Any]:
+    """한 번의 순회로 manifest/어댑터들/섹션 맵을 저장한다. 예: analyze_elementor_json(input_path=..., output_dir=...)"""
+
+    analysis = analyze_elementor_page(
+        elementor_data=_read_elementor_json(input_path),
+        page_slug=page_slug,
+        template_id=template_id,
+        site_spec=site_spec,
+        max_candidates=max_candidates,
+        max_depth=max_depth,
+    )
+
+    output_root = ensure_directory(output_dir)
+    output_paths = {
+        "manifest_path": output_root / "manifest.json",
+        "adapter_skeleton_path": output_root / "adapter_skeleton.json",
+        "cssid_adapter_path": output_root / "adapter_cssid.json",
+        "auto_adapter_path": output_root / "adapter_auto.json",
+        "sections_path": output_root / "sections.json",
+    }
+
+    write_json_file(
+        output_paths["manifest_path"],
+        _build_manifest(
+            input_path=input_path,
+            options=analysis["options"],
+            candidates=analysis["candidates"],
+            stats=analysis["stats"],
+        ),
+    )
+    write_json_file(output_paths["adapter_skeleton_path"], analysis["adapter_skeleton"])
+    write_json_file(output_paths["cssid_adapter_path"], analysis["cssid_adapter"])
+    write_json_file(output_paths["auto_adapter_path"], analysis["auto_adapter"])
+    write_json_file(output_paths["sections_path"], {"sections": analysis["sections"]})
+
+    return {
+        **{name: str(path) for name, path in output_paths.items()},
+        "candidate_count": len(analysis["candidates"]),
+        "css_id_count": len(analysis["cssid_adapter"]["pages"][0]["patches"]),
+        "auto_patch_count": len(analysis["auto_adapter"]["pages"][0]["patches"]),
+        "section_count": len(analysis["sections"]),
+        "traversal": analysis["traversal"],
+    }
+
+
+def analyze_elementor_page(
+    *,
+    elementor_data: Any,
+    page_slug: str,
+    template_id: str = "unknown",
+    site_spec: Optional[Dict[str, Any]] = None,
+    max_candidates: int = 300,
+    max_depth: int = 12,
+) -> Dict[str, Any]:
+    """후보/CSS ID 어댑터/자동 매칭 어댑터/섹션 맵을 한 번의 순회로 만든다. 예: analyze_elementor_page(elementor_data=data, page_slug="home")"""
+
+    elements_root = extract_elements_root(elementor_data)
+    if not elements_root:
+        raise FriendlyError(
+            user_message="Elementor JSON에서 elements 루트를 찾을 수 없습니다."
+        )
+
+    options = ScanOptions(
+        page_slug=page_slug,
+        template_id=template_id,
+        max_candidates=max_candidates,
+        max_depth=max_depth,
+    )
+
+    collector = CandidateCollector(options)
+    css_id_collector = CssIdCollector()
+    matcher = AutoMatcher(elements_root, site_spec or {})
+    section_scanner = SectionScanner(elements_root)
+    traversal_stats = run_visitors(
+        elements_root,
+        [collector, css_id_collector, matcher, section_scanner],
+    )
+
+    return {
+        "options": options,
+        "candidates": collector.candidates,
+        "stats": collector.stats,
+        "adapter_skeleton": _build_adapter_skeleton(options, collector.candidates),
+        "cssid_adapter": build_cssid_adapter(css_id_collector.css_id_map, template_id, page_slug),
+        "auto_adapter": build_auto_adapter(matcher.patches, page_slug, template_id),
+        "sections": section_scanner.sections,
+        "traversal": asdict(traversal_stats),
+    }
+
+
+def _read_elementor_json(input_path: Path) -> Any:
+    """Elementor JSON을 읽는다. 예: _read_elementor_json(Path("data/elementor-home.json"))"""
+
+    try:
+        return read_json_file(input_path)
+    except FriendlyError:
+        raise
+    except Exception as error:
+        raise FriendlyError(
+            user_message=f"Elementor JSON을 읽을 수 없습니다: {input_path}",
+            detail=str(error),
+        ) from error
+
+
+def _read_elementor_bytes(input_path: Path) -> bytes:
+    """Elementor JSON 원본 바이트를 읽는다. 예: _read_elementor_bytes(Path("data/elementor-home.json"))"""
+
+    try:
+        return read_bytes_file(input_path)
+    except FriendlyError:
+        raise
+    except Exception as error:
+        raise FriendlyError(
+            user_message=f"Elementor JSON을 읽을 수 없습니다: {input_path}",
+            detail=str(error),
+        ) from error
 
 
-def _extract_elements_root(data: Any) -> List[Dict[str, Any]]:
-    """Elementor JSON의 elements 루트를 찾는다. 예: _extract_elements_root(data)"""
+def extract_elements_root(data: Any) -> List[Dict[str, Any]]:
+    """Elementor JSON의 elements 루트를 찾는다. 예: extract_elements_root(data)"""
 
     if isinstance(data, list):
         return [item for item in data if isinstance(item, dict)]
@@ -112,74 +302,100 @@ def _looks_like_element_list(value: List[Any]) -> bool:
     return True
 
 
-def _collect_candidates(
-    elements_root: List[Dict[str, Any]],
-    options: ScanOptions,
-) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    """후보를 수집한다. 예: candidates, stats = _collect_candidates(elements_root, options)"""
+class CandidateCollector(ElementVisitor):
+    """순회 방문자: 주입 후보를 수집한다. 예: run_visitors(elements_root, [CandidateCollector(options)])"""
 
-    candidates: List[Dict[str, Any]] = []
-    seen: Set[Tuple[str, str]] = set()
-    stats = {
-        "element_count": 0,
-        "candidate_limit_reached": False,
-        "skipped_text": 0,
-    }
+    def __init__(self, options: ScanOptions) -> None:
+        self.options = options
+        self.max_depth = options.max_depth
+        self.candidates: List[Dict[str, Any]] = []
+        self.seen: Set[Tuple[str, str]] = set()
+        self.stats: Dict[str, Any] = {
+            "element_count": 0,
+            "candidate_limit_reached": False,
+            "skipped_text": 0,
+            "depth_limited": 0,
+        }
 
-    for element in _walk_elements(elements_root, depth=0, max_depth=options.max_depth):
-        stats["element_count"] += 1
+    def visit(self, visit: ElementVisit) -> bool:
+        """요소 하나에서 후보를 뽑는다. 예: collector.visit(visit)"""
+
+        element = visit.element
+        self.stats["element_count"] += 1
 
         element_id = element.get("id")
         settings = element.get("settings", {})
         widget_type = element.get("widgetType") or element.get("widget_type")
-        css_id = _extract_css_id(settings)
 
         if not isinstance(settings, dict):
-            continue
+            return False
 
-        extracted = _extract_candidates_from_settings(
+        extracted = extract_candidates_from_settings(
             settings=settings,
             element_id=element_id,
             widget_type=widget_type,
-            css_id=css_id,
-            stats=stats,
+            css_id=_extract_css_id(settings),
+            stats=self.stats,
         )
 
         for item in extracted:
             candidate_key = (item["element_id"], item["path"])
-            if candidate_key in seen:
+            if candidate_key in self.seen:
                 continue
-            seen.add(candidate_key)
-            candidates.append(item)
+            self.seen.add(candidate_key)
+            self.candidates.append(item)
 
-            if len(candidates) >= options.max_candidates:
-                stats["candidate_limit_reached"] = True
-                return candidates, stats
+            if len(self.candidates) >= self.options.max_candidates:
+                self.stats["candidate_limit_reached"] = True
+                return True
 
-    return candidates, stats
+        return False
 
+    def skip_depth(self, visit: ElementVisit) -> None:
+        """max_depth를 넘은 요소 수를 기록한다. 예: collector.skip_depth(visit)"""
 
-def _walk_elements(
-    elements: List[Dict[str, Any]],
-    depth: int,
-    max_depth: int,
-) -> Iterable[Dict[str, Any]]:
-    """Elementor elements 트리를 순회한다. 예: for el in _walk_elements(elements, 0, 10)"""
+        self.stats["depth_limited"] += 1
 
-    if depth > max_depth:
-        return
 
-    for element in elements:
-        if not isinstance(element, dict):
-            continue
-        yield element
+def _collect_candidates(
+    elements_root: List[Dict[str, Any]],
+    options: ScanOptions,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """후보를 수집한다. 예: candidates, stats = _collect_candidates(elements_root, options)"""
+
+    collector = CandidateCollector(options)
+    run_visitors(elements_root, [collector])
+    return collector.candidates, collector.stats
+
+
+def _collect_candidates_streaming(
+    input_path: Path,
+    options: ScanOptions,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, Any]]:
+    """루트 요소를 스트리밍으로 읽으며 후보를 수집한다. 예: _collect_candidates_streaming(path, options)"""
+
+    # extract_elements_root와 같은 얕은 규칙으로 {"content": [...]} 같은 루트도 스트리밍한다.
+    element_stream = ElementStream(input_path, looks_like_elements=_looks_like_element_list)
+    collector = CandidateCollector(options)
+    traversal_stats = run_visitors(element_stream, [collector])
 
-        children = element.get("elements", [])
-        if isinstance(children, list):
-            yield from _walk_elements(children, depth + 1, max_depth)
+    if not element_stream.root_found or traversal_stats.visited == 0:
+        raise FriendlyError(
+            user_message="Elementor JSON에서 elements 루트를 찾을 수 없습니다."
+        )
+
+    return (
+        collector.candidates,
+        collector.stats,
+        {
+            "full_load": False,
+            "root_elements_read": element_stream.root_count,
+            "stopped_early": traversal_stats.stopped_early,
+        },
+    )
 
 
-def _extract_candidates_from_settings(
+def extract_candidates_from_settings(
     *,
     settings: Dict[str, Any],
     element_id: Optional[str],
@@ -187,7 +403,7 @@ def _extract_candidates_from_settings(
     css_id: Optional[str],
     stats: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
-    """settings에서 후보를 추출한다. 예: _extract_candidates_from_settings(settings=..., ...)"""
+    """settings에서 후보를 추출한다. 예: extract_candidates_from_settings(settings=..., ...)"""
 
     if not element_id:
         return []
@@ -0,0 +1,276 @@
+# v0.3 - scanner/contracts 공개 API만 사용 (데몬 모듈을 읽지 않음) (2026-10-17)
+# 기능: print_sections_interactive 없이 규칙으로 주입 위젯을 골라 같은 selected_injections를 만든다 (예: select_injections(sections, load_section_rules("rules/sections.json")))
+
+from __future__ import annotations
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .batch_scanner import discover_input_files, page_identity, resolve_worker_count
+from .contracts import ADAPTER_FILE_NAME
+from .scanner import extract_elements_root
+from .section_scanner import SectionScanner, generate_adapter_from_selection
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import PathLike, ensure_directory, read_json_file, write_json_file
+from .utils.time_utils import get_iso_timestamp
+
+SECTION_SELECTION_REPORT_NAME = "section_selection_report.json"
+SELECTION_FILE_SUFFIX = ".selection.json"
+# 규칙에 없는 섹션 이름에 쓰는 기본 규칙 키
+DEFAULT_SECTION_RULE_KEY = "*"
+
+_RULE_FIELDS = frozenset({"widget_types", "indices", "preview"})
+_RANGE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?\Z")
+
+
+@dataclass(frozen=True)
+class SectionRule:
+    """섹션 하나에 적용할 선택 조건. 주어진 조건을 모두 만족하는 주입 가능 위젯을 고른다. 예: SectionRule(widget_types=frozenset({"heading"}))
+
+    widget_types: 위젯 타입 집합, indices: 주입 가능 위젯만 0부터 센 위치, preview: 미리보기에 search할 정규식.
+    indices는 대화형 선택 입력이 받는 번호와 같다. 화면의 [n](widget["index"])은 섹션 전체 위젯 번호라
+    앞에 spacer/아이콘 같은 주입 불가 위젯이 있으면 다르다.
+    None인 조건은 검사하지 않는다.
+    """
+
+    widget_types: Optional[FrozenSet[str]] = None
+    indices: Optional[FrozenSet[int]] = None
+    preview: Optional["re.Pattern[str]"] = None
+
+    def matches(self, widget_index: int, widget: Dict[str, Any]) -> bool:
+        """주입 가능 위젯 하나가 조건을 만족하는지. 예: rule.matches(0, {"widget_type": "heading", "preview": "Hello"})"""
+
+        if self.widget_types is not None and widget["widget_type"] not in self.widget_types:
+            return False
+        if self.indices is not None and widget_index not in self.indices:
+            return False
+        if self.preview is not None and not self.preview.search(str(widget["preview"])):
+            return False
+        return True
+
+
+# 섹션 이름(suggested_name) → 규칙 목록. 목록 중 하나라도 맞으면 고른다.
+SectionRules = Dict[str, Tuple[SectionRule, ...]]
+
+
+def load_section_rules(rules_path: PathLike) -> SectionRules:
+    """섹션 선택 규칙 JSON을 읽고 컴파일한다. 예: load_section_rules("rules/sections.json")
+
+    예: {"sections": {"hero": {"widget_types": ["heading", "button"], "indices": ["0-2", 4]},
+                      "pricing": [{"widget_types": ["heading"]}, {"preview": ["\\\\$\\\\d+"]}],
+                      "*": {"widget_types": ["heading"], "preview": ["\\\\S"]}}}
+    "*"는 규칙에 이름이 없는 섹션에 쓴다. "*"도 없으면 그런 섹션은 고르지 않는다.
+    """
+
+    raw = read_json_file(rules_path)
+    sections = raw.get("sections") if isinstance(raw, dict) else None
+    if not isinstance(sections, dict):
+        raise FriendlyError(user_message=f"섹션 선택 규칙에는 sections 객체가 필요합니다: {rules_path}")
+    return {
+        str(name): tuple(_compile_rule(name, item) for item in (value if isinstance(value, list) else [value]))
+        for name, value in sections.items()
+    }
+
+
+def _compile_rule(name: str, raw: Any) -> SectionRule:
+    """규칙 객체 하나를 SectionRule로 바꾼다. 예: _compile_rule("hero", {"indices": ["0-2"]})"""
+
+    if not isinstance(raw, dict):
+        raise FriendlyError(user_message=f"섹션 선택 규칙 '{name}'은 객체 또는 객체 리스트여야 합니다.")
+    unknown = sorted(set(raw) - _RULE_FIELDS)
+    if unknown:
+        raise FriendlyError(user_message=f"알 수 없는 섹션 선택 조건입니다 ({name}): {', '.join(unknown)}")
+
+    widget_types = raw.get("widget_types")
+    if widget_types is not None and (
+        not isinstance(widget_types, list) or not all(isinstance(item, str) for item in widget_types)
+    ):
+        raise FriendlyError(user_message=f"섹션 선택 규칙 '{name}'의 widget_types는 문자열 리스트여야 합니다.")
+
+    indices = raw.get("indices")
+    if indices is not None:
+        indices = _parse_indices(name, indices)
+
+    preview = raw.get("preview")
+    if preview is not None:
+        if isinstance(preview, str):
+            preview = [preview]
+        if not isinstance(preview, list) or not all(isinstance(item, str) for item in preview) or not preview:
+            raise FriendlyError(user_message=f"섹션 선택 규칙 '{name}'의 preview는 정규식 문자열(리스트)이어야 합니다.")
+        try:
+            # 한글: 정규식 여러 개를 교대(|) 하나로 묶어 위젯마다 search 한 번만 한다.
+            preview = re.compile("|".join(f"(?:{pattern})" for pattern in preview))
+        except re.error as error:
+            raise FriendlyError(user_message=f"섹션 선택 규칙 '{name}'의 정규식이 올바르지 않습니다.", detail=str(error)) from error
+
+    return SectionRule(
+        widget_types=frozenset(widget_types) if widget_types is not None else None,
+        indices=indices,
+        preview=preview,
+    )
+
+
+def _parse_indices(name: str, raw: Any) -> FrozenSet[int]:
+    """번호/범위 목록 → 번호 집합. 예: _parse_indices("hero", [0, "2-4", "6,7"]) → {0, 2, 3, 4, 6, 7}"""
+
+    items = raw if isinstance(raw, list) else [raw]
+    indices = set()
+    for item in items:
+        if isinstance(item, int) and not isinstance(item, bool) and item >= 0:
+            indices.add(item)
+            continue
+        parts = item.split(",") if isinstance(item, str) else [None]
+        for part in parts:
+            match = _RANGE.match(part) if part is not None else None
+            if match is None:
+                raise FriendlyError(user_message=f"섹션 선택 규칙 '{name}'의 indices 형식이 올바르지 않습니다: {item!r} (예: 0, \"2-4\")")
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) is not None else start
+            indices.update(range(start, end + 1))
+    return frozenset(indices)
+
+
+def select_injections(sections: List[Dict[str, Any]], rules: SectionRules) -> Dict[str, Any]:
+    """규칙으로 주입 위젯을 고른다. print_sections_interactive와 같은 구조를 반환한다. 예: select_injections(SectionScanner(data).scan(), rules)
+
+    대화형 선택처럼 주입 가능한 위젯만 보고, widget_index는 그 목록 안 위치다(widget["index"]가 아니다).
+    """
+
+    selected_injections: List[Dict[str, Any]] = []
+    for section in sections:
+        name = section["suggested_name"]
+        section_rules = rules.get(name, rules.get(DEFAULT_SECTION_RULE_KEY))
+        if not section_rules:
+            continue
+        injectable = [widget for widget in section["widgets"] if widget["injectable"]]
+        for index, widget in enumerate(injectable):
+            if any(rule.matches(index, widget) for rule in section_rules):
+                selected_injections.append(
+                    {
+                        "section": name,
+                        "section_index": section["index"],
+                        "widget_index": index,
+                        "element_id": widget["element_id"],
+                        "widget_type": widget["widget_type"],
+                        "path": widget["path"],
+                        "preview": widget["preview"],
+                    }
+                )
+    return {"sections": sections, "selected_injections": selected_injections}
+
+
+def select_sections_batch(
+    *,
+    input_pattern: str,
+    rules_path: PathLike,
+    output_dir: Path,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """라이브러리 전체 페이지에 규칙을 적용해 템플릿별 어댑터를 만든다. 예: select_sections_batch(input_pattern="templates", rules_path="rules/sections.json", output_dir=Path("output/adapters"))
+
+    템플릿 ID/페이지 슬러그는 scan-batch와 같은 규칙으로 정하고 adapter.json은 입력에서 뺀다.
+    페이지별 선택 결과는 <output_dir>/<template_id>/<page_slug>.selection.json,
+    템플릿 어댑터는 serve/index가 읽는 <output_dir>/<template_id>/adapter.json으로 저장한다.
+    """
+
+    input_files = [path for path in discover_input_files(input_pattern) if path.name != ADAPTER_FILE_NAME]
+    if not input_files:
+        raise FriendlyError(user_message=f"섹션을 고를 Elementor JSON이 없습니다: {input_pattern}")
+    # 규칙 오류는 워커를 띄우기 전에 알린다.
+    load_section_rules(rules_path)
+
+    output_root = ensure_directory(output_dir)
+    input_root = Path(input_pattern) if Path(input_pattern).is_dir() else None
+    jobs = []
+    for input_path in input_files:
+        template_id, page_slug = page_identity(input_path, input_root)
+        jobs.append(
+            {
+                "input_path": str(input_path),
+                "rules_path": str(rules_path),
+                "template_id": template_id,
+                "page_slug": page_slug,
+                "selection_path": str(output_root / template_id / f"{page_slug}{SELECTION_FILE_SUFFIX}"),
+            }
+        )
+
+    worker_count = resolve_worker_count(workers, len(jobs))
+    started = perf_counter()
+    if worker_count == 1:
+        results = [_select_job(job) for job in jobs]
+    else:
+        # executor.map은 입력 순서를 유지하므로 어댑터의 페이지 순서가 항상 같다.
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            results = list(executor.map(_select_job, jobs))
+
+    adapters: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        page = result.pop("adapter_page", None)
+        if page is not None:
+            adapter = adapters.setdefault(result["template_id"], {"template_id": result["template_id"], "pages": []})
+            adapter["pages"].append(page)
+    adapter_paths = []
+    for template_id, adapter in adapters.items():
+        adapter_path = ensure_directory(output_root / template_id) / ADAPTER_FILE_NAME
+        write_json_file(adapter_path, adapter)
+        adapter_paths.append(str(adapter_path))
+    elapsed_ms = round((perf_counter() - started) * 1000, 3)
+
+    report = {
+        "generated_at": get_iso_timestamp(),
+        "input": input_pattern,
+        "rules": str(rules_path),
+        "workers": worker_count,
+        "summary": {
+            "file_count": len(results),
+            "selected": sum(1 for result in results if result["status"] == "ok"),
+            "errors": sum(1 for result in results if result["status"] == "error"),
+            "templates": len(adapters),
+            "injection_count": sum(result.get("injection_count", 0) for result in results),
+            "elapsed_ms": elapsed_ms,
+        },
+        "adapters": adapter_paths,
+        "files": results,
+    }
+    report_path = output_root / SECTION_SELECTION_REPORT_NAME
+    write_json_file(report_path, report)
+
+    return {"report_path": str(report_path), **report["summary"], "workers": worker_count}
+
+
+def _select_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """워커 프로세스에서 페이지 하나의 섹션을 고른다. 예: _select_job(job)"""
+
+    started = perf_counter()
+    record: Dict[str, Any] = {
+        "source_file": job["input_path"],
+        "template_id": job["template_id"],
+        "page_slug": job["page_slug"],
+    }
+    try:
+        rules = load_section_rules(job["rules_path"])
+        sections = SectionScanner(extract_elements_root(read_json_file(job["input_path"]))).scan()
+        selection = select_injections(sections, rules)
+        write_json_file(job["selection_path"], selection)
+        adapter = generate_adapter_from_selection(selection, job["template_id"], job["page_slug"])
+        record.update(
+            {
+                "status": "ok",
+                "selection_path": job["selection_path"],
+                "section_count": len(sections),
+                "injection_count": len(selection["selected_injections"]),
+                "adapter_page": adapter["pages"][0],
+            }
+        )
+    except FriendlyError as error:
+        # 한 페이지가 실패해도 나머지 템플릿 어댑터 생성은 계속한다.
+        record.update({"status": "error", "message": error.user_message, "detail": error.detail})
+    except Exception as error:
+        record.update({"status": "error", "message": "예상치 못한 오류", "detail": str(error)})
+
+    record["elapsed_ms"] = round((perf_counter() - started) * 1000, 3)
+    return record
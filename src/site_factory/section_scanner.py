@@ -5,6 +5,7 @@
 - Elementor 페이지를 섹션별로 분석
 - 각 섹션 내 주입 가능한 위젯 추출
 - 대화형 인터페이스로 선택 지원
+- 섹션 지문(fingerprint)으로 같은 레이아웃의 섹션 찾기
 
 사용 예시:
     python -m site_factory.cli section-scan \
@@ -13,12 +14,16 @@
 """
 
 from typing import Dict, List, Any
+import hashlib
 import json
 from pathlib import Path
 
+from .traversal import ElementVisit, ElementVisitor, run_visitors
+from .utils.dict_utils import compile_path, get_compiled_value
 
-class SectionScanner:
-    """섹션 단위로 Elementor 구조 분석"""
+
+class SectionScanner(ElementVisitor):
+    """섹션 단위로 Elementor 구조 분석 (공통 순회 엔진 방문자)"""
     
     # 주입 가능한 위젯 타입
     INJECTABLE_WIDGETS = {
@@ -31,24 +36,49 @@ class SectionScanner:
         'highlighted-text': '강조 텍스트',
     }
     
+    # 미리보기용 settings 경로 (한 번만 컴파일)
+    IMAGE_URL_PATH = compile_path('image.url')
+    
     def __init__(self, elementor_data: List[Dict]):
         self.elementor_data = elementor_data
         self.sections = []
+        self._pending = []  # (섹션 요소, 위젯 목록) - 순회 중 수집
+        self._current = None
     
     def scan(self) -> List[Dict]:
         """섹션별로 구조 추출"""
-        section_index = 0
+        run_visitors(self.elementor_data, [self])
+        return self.sections
+    
+    def visit(self, visit: ElementVisit) -> bool:
+        """최상위 섹션 아래의 위젯을 한 번의 순회로 모은다"""
+        element = visit.element
         
-        for element in self.elementor_data:
+        if visit.depth == 0:
+            self._current = None
             if element.get('elType') == 'section':
-                section = self._extract_section(element, section_index)
-                if section['widgets']:  # 위젯이 있는 섹션만
-                    self.sections.append(section)
-                    section_index += 1
+                self._current = (element, [])
+                self._pending.append(self._current)
         
-        return self.sections
+        if self._current is not None and element.get('widgetType'):
+            self._current[1].append(element)
+        
+        return False
+    
+    def finish(self) -> None:
+        """수집한 섹션을 정리 (위젯이 있는 섹션만)"""
+        section_index = 0
+        
+        for section_element, widgets in self._pending:
+            section = self._extract_section(section_element, section_index, widgets)
+            if section['widgets']:  # 위젯이 있는 섹션만
+                self.sections.append(section)
+                section_index += 1
+        
+        self._pending = []
+        self._current = None
     
-    def _extract_section(self, section_element: Dict, index: int) -> Dict:
+    def _extract_section(self, section_element: Dict, index: int, widgets: List[Dict]) -> Dict:
         """섹션 정보 추출"""
         
         # 섹션 기본 정보
@@ -56,13 +86,11 @@ class SectionScanner:
             'index': index,
             'element_id': section_element.get('id'),
             'name': f'section_{index}',  # 기본 이름
-            'suggested_name': self._suggest_section_name(section_element, index),
+            'suggested_name': self._suggest_section_name(widgets, index),
+            'fingerprint': section_fingerprint(widgets),
             'widgets': []
         }
         
-        # 섹션 내 모든 위젯 추출
-        widgets = self._extract_widgets(section_element)
-        
         for widget_idx, widget in enumerate(widgets):
             widget_info = {
                 'index': widget_idx,
@@ -81,7 +109,7 @@ class SectionScanner:
         
         return section_info
     
-    def _suggest_section_name(self, section_element: Dict, index: int) -> str:
+    def _suggest_section_name(self, widgets: List[Dict], index: int) -> str:
         """섹션 이름 자동 추천"""
         
         # 첫 번째 섹션은 보통 Hero
@@ -89,7 +117,6 @@ class SectionScanner:
             return 'hero'
         
         # 위젯 내용으로 추측
-        widgets = self._extract_widgets(section_element)
         
         # 가격 관련 키워드
         for widget in widgets:
@@ -105,19 +132,6 @@ class SectionScanner:
         
         return f'section_{index}'
     
-    def _extract_widgets(self, element: Dict) -> List[Dict]:
-        """재귀적으로 모든 위젯 추출"""
-        widgets = []
-        
-        if element.get('widgetType'):
-            widgets.append(element)
-        
-        # 자식 요소 탐색 (컬럼, 컨테이너 등)
-        for child in element.get('elements', []):
-            widgets.extend(self._extract_widgets(child))
-        
-        return widgets
-    
     def _get_widget_preview(self, widget: Dict) -> str:
         """위젯 미리보기 텍스트"""
         widget_type = widget.get('widgetType')
@@ -138,7 +152,7 @@ class SectionScanner:
             return settings.get('text', '(버튼 텍스트 없음)')
         
         elif widget_type == 'image':
-            url = settings.get('image', {}).get('url', '')
+            url = get_compiled_value(settings, self.IMAGE_URL_PATH, '')
             filename = url.split('/')[-1] if url else '(이미지 없음)'
             return filename
         
@@ -166,6 +180,23 @@ class SectionScanner:
         return paths.get(widget_type, 'settings')
 
 
+def section_fingerprint(widgets: List[Dict]) -> str:
+    """
+    섹션 지문: 위젯 타입 순서 + 위젯별 settings 키 목록의 해시
+    
+    문구/이미지/id가 달라도 레이아웃이 같으면 같은 값이 된다.
+    예: section_fingerprint([{'widgetType': 'heading', 'settings': {'title': 'A'}}])
+    """
+    shape = []
+    for widget in widgets:
+        settings = widget.get('settings')
+        keys = sorted(settings) if isinstance(settings, dict) else []
+        shape.append([widget.get('widgetType'), keys])
+    
+    raw = json.dumps(shape, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=12).hexdigest()
+
+
 def print_sections_interactive(sections: List[Dict]) -> Dict:
     """
     대화형으로 섹션 구조 출력 및 선택
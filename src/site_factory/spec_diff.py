@@ -0,0 +1,104 @@
+# v0.1 - site_spec 변경 키 diff + 키 → 패치 의존성 인덱스 추가 (2026-10-17)
+# 기능: 바뀐 site_spec 키를 읽는 패치만 골라낸다 (예: KeyDependencyIndex.build(plan.patches).affected(diff_site_spec(old, new)))
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .utils.dict_utils import CompiledPath, compile_path
+
+
+def diff_site_spec(old_spec: Any, new_spec: Any) -> List[str]:
+    """두 site_spec에서 값이 달라진 경로를 반환한다. 예: diff_site_spec(old, new) → ["brand.tagline", "content.titles[3]"]
+
+    dict는 키 단위로 내려가고, 길이가 같은 리스트는 항목 단위로 내려간다.
+    길이가 다른 리스트나 타입이 바뀐 값은 그 경로 전체를 바뀐 것으로 본다. 루트가 통째로 바뀌면 [""]다.
+    """
+
+    changed: List[str] = []
+    _diff_values(old_spec, new_spec, "", changed)
+    return changed
+
+
+def _diff_values(old: Any, new: Any, path: str, changed: List[str]) -> None:
+    """값 두 개를 비교해 바뀐 경로를 모은다. 예: _diff_values(old, new, "brand", changed)"""
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, old_value in old.items():
+            child_path = f"{path}.{key}" if path else str(key)
+            if key not in new:
+                changed.append(child_path)
+            else:
+                _diff_values(old_value, new[key], child_path, changed)
+        for key in new:
+            if key not in old:
+                changed.append(f"{path}.{key}" if path else str(key))
+        return
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            _diff_values(old_item, new_item, f"{path}[{index}]", changed)
+        return
+
+    if type(old) is not type(new) or old != new:
+        changed.append(path)
+
+
+class _KeyNode:
+    """경로 트라이 노드. 예: node.children["brand"].patches"""
+
+    __slots__ = ("children", "patches")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _KeyNode] = {}
+        self.patches: List[int] = []
+
+
+class KeyDependencyIndex:
+    """site_spec 키 경로 → 그 키를 읽는 패치 번호. 예: index = KeyDependencyIndex.build([(0, ("brand", "name"))])
+
+    경로는 세그먼트 트라이로 저장한다. 바뀐 경로 하나를 찾을 때 그 경로의 길이 + 걸리는 패치 수만큼만 본다.
+    바뀐 경로의 조상 키를 읽는 패치(예: content.titles 전체를 읽는 패치)와 자손 키를 읽는 패치(예: pages.home이 통째로 바뀜)를 모두 포함한다.
+    """
+
+    def __init__(self) -> None:
+        self._root = _KeyNode()
+        self.size = 0
+
+    @classmethod
+    def build(cls, key_paths: Iterable[Tuple[int, CompiledPath]]) -> "KeyDependencyIndex":
+        """(패치 번호, 컴파일된 key 경로) 목록으로 인덱스를 만든다. 예: KeyDependencyIndex.build(pairs)"""
+
+        index = cls()
+        for patch_index, keys in key_paths:
+            node = index._root
+            for segment in keys:
+                node = node.children.setdefault(str(segment), _KeyNode())
+            node.patches.append(patch_index)
+            index.size += 1
+        return index
+
+    def affected(self, changed_paths: Iterable[str]) -> List[int]:
+        """바뀐 경로들에 영향받는 패치 번호를 정렬해 반환한다. 예: index.affected(["brand.tagline"])"""
+
+        found: Set[int] = set()
+        for changed_path in changed_paths:
+            node: Optional[_KeyNode] = self._root
+            for segment in compile_path(changed_path):
+                found.update(node.patches)
+                node = node.children.get(str(segment))
+                if node is None:
+                    break
+            if node is not None:
+                _collect_subtree(node, found)
+        return sorted(found)
+
+
+def _collect_subtree(node: _KeyNode, found: Set[int]) -> None:
+    """노드 아래 모든 패치 번호를 모은다. 예: _collect_subtree(node, found)"""
+
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        found.update(current.patches)
+        stack.extend(current.children.values())
@@ -0,0 +1,451 @@
+# v0.2 - 재매핑 어댑터를 입력 기준 상대 경로로 저장, 어댑터가 아닌 JSON은 건너뜀 (2026-10-17)
+# 기능: 다시 내보낸 템플릿의 요소를 이전 판과 짝짓고 어댑터 id를 새 id로 바꾼다 (예: diff_template(old_path=..., new_path=..., adapter_pattern="data/adapters", output_dir=...))
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+from .batch_scanner import discover_input_files
+from .element_index import ElementIndex, IndexedElement
+from .json_delta import element_pointer
+from .utils.error_utils import FriendlyError
+from .utils.io_utils import dumps_json, ensure_directory, read_json_file, write_json_file
+
+TEMPLATE_DIFF_REPORT_NAME = "template_diff.json"
+REMAPPED_ADAPTER_DIR = "adapters"
+
+_HASH_SIZE = 16
+_FIELD_SEPARATOR = b"\x1f"
+
+
+@dataclass(frozen=True)
+class SubtreeHashes:
+    """요소 순서(order)별 해시. 예: hashes.structure[0], hashes.content[0]
+
+    structure는 elType/widgetType/settings 키 목록 + 자식 structure 해시로, 문구나 id가 바뀌어도 같다.
+    content는 settings 값까지 포함해 같은 모양이 반복되는 요소(아이콘 박스 여러 개 등)를 구분한다. 둘 다 요소 id는 넣지 않는다.
+    local은 자식을 뺀 요소 자체의 모양이다.
+    """
+
+    structure: List[bytes]
+    content: List[bytes]
+    local: List[bytes]
+    children: List[List[int]]
+
+
+def compute_subtree_hashes(index: ElementIndex) -> SubtreeHashes:
+    """전위 순서의 역순으로 한 번 지나가며 모든 서브트리 해시를 만든다. 예: compute_subtree_hashes(ElementIndex.build(data))
+
+    역순으로 돌면 자식이 항상 부모보다 먼저 끝나므로 재귀 없이 요소 수에 비례하는 시간에 끝난다.
+    """
+
+    entries = index.entries
+    count = len(entries)
+    children: List[List[int]] = [[] for _ in range(count)]
+    for entry in entries:
+        if entry.parent is not None:
+            children[entry.parent.order].append(entry.order)
+
+    structure: List[bytes] = [b""] * count
+    content: List[bytes] = [b""] * count
+    local: List[bytes] = [b""] * count
+    for entry in reversed(entries):
+        element = entry.element
+        settings = element.get("settings")
+        settings = settings if isinstance(settings, dict) else {}
+        shape = _FIELD_SEPARATOR.join(
+            (
+                str(element.get("elType") or "").encode(),
+                str(element.get("widgetType") or element.get("widget_type") or "").encode(),
+                ",".join(sorted(str(key) for key in settings)).encode(),
+            )
+        )
+        local[entry.order] = _digest(shape)
+        child_orders = children[entry.order]
+        structure[entry.order] = _digest(shape, *(structure[child] for child in child_orders))
+        values = dumps_json(settings, compact=True, sort_keys=True)
+        content[entry.order] = _digest(shape, values, *(content[child] for child in child_orders))
+
+    return SubtreeHashes(structure=structure, content=content, local=local, children=children)
+
+
+def _digest(*parts: bytes) -> bytes:
+    hasher = hashlib.blake2b(digest_size=_HASH_SIZE)
+    for part in parts:
+        hasher.update(part)
+        hasher.update(_FIELD_SEPARATOR)
+    return hasher.digest()
+
+
+class _TreeMatcher:
+    """이전/새 요소 트리를 짝짓는다. 예: _TreeMatcher(old_index, new_index).run()
+
+    모든 단계는 "양쪽에서 유일한" 근거로만 짝을 지으므로 결과는 모두 모호하지 않다.
+    1) id: 같은 id + 같은 모양(local)인 요소
+    2) structure: 양쪽에서 한 번씩만 나오는 구조 해시 → 서브트리 전체를 위치대로 짝지음
+    3) content: 구조가 반복되는 곳은 값까지 포함한 해시가 유일하면 같은 방식
+    4) children: 자식이 바뀐 컨테이너는 짝지어진 자식 대부분이 가리키는 새 부모와 서로 가리킬 때 (아래에서 위로)
+    5) sibling: 짝지어진 부모 아래에서 같은 모양의 자식이 양쪽에 하나씩만 남은 경우
+    각 단계는 요소 수에 비례한다.
+    """
+
+    def __init__(self, old_index: ElementIndex, new_index: ElementIndex) -> None:
+        self.old = old_index
+        self.new = new_index
+        self.old_hashes = compute_subtree_hashes(old_index)
+        self.new_hashes = compute_subtree_hashes(new_index)
+        self.old_to_new: List[int] = [-1] * len(old_index)
+        self.new_to_old: List[int] = [-1] * len(new_index)
+        self.reasons: List[Optional[str]] = [None] * len(old_index)
+
+    def run(self) -> "_TreeMatcher":
+        self._match_ids()
+        self._match_unique(self.old_hashes.structure, self.new_hashes.structure, "structure")
+        self._match_unique(self.old_hashes.content, self.new_hashes.content, "content")
+        self._match_parents()
+        self._match_siblings()
+        return self
+
+    def _pair(self, old_order: int, new_order: int, reason: str) -> bool:
+        if self.old_to_new[old_order] != -1 or self.new_to_old[new_order] != -1:
+            return False
+        self.old_to_new[old_order] = new_order
+        self.new_to_old[new_order] = old_order
+        self.reasons[old_order] = reason
+        return True
+
+    def _pair_subtree(self, old_order: int, new_order: int, reason: str) -> None:
+        """구조 해시가 같은 두 서브트리를 위치대로 짝짓는다. 예: matcher._pair_subtree(3, 5, "structure")"""
+
+        stack = [(old_order, new_order)]
+        while stack:
+            old_current, new_current = stack.pop()
+            self._pair(old_current, new_current, reason)
+            stack.extend(zip(self.old_hashes.children[old_current], self.new_hashes.children[new_current]))
+
+    def _match_ids(self) -> None:
+        old_local = self.old_hashes.local
+        new_local = self.new_hashes.local
+        for element_id, old_entries in self.old.by_id.items():
+            new_entries = self.new.by_id.get(element_id)
+            if len(old_entries) != 1 or not new_entries or len(new_entries) != 1:
+                continue
+            old_order, new_order = old_entries[0].order, new_entries[0].order
+            if old_local[old_order] == new_local[new_order]:
+                self._pair(old_order, new_order, "id")
+
+    def _match_unique(self, old_hashes: List[bytes], new_hashes: List[bytes], reason: str) -> None:
+        new_unique = _unique_positions(new_hashes)
+        old_unique = _unique_positions(old_hashes)
+        # 전위 순서라 바깥 서브트리가 먼저 잡히고, 그 안은 위치대로 한꺼번에 짝지어진다.
+        for old_order, digest in enumerate(old_hashes):
+            if self.old_to_new[old_order] != -1 or old_unique.get(digest) is None:
+                continue
+            new_order = new_unique.get(digest)
+            if new_order is not None and self.new_to_old[new_order] == -1:
+                self._pair_subtree(old_order, new_order, reason)
+
+    def _match_parents(self) -> None:
+        old_local = self.old_hashes.local
+        new_local = self.new_hashes.local
+        new_entries = self.new.entries
+        # 역순(아래에서 위로)이라 컬럼이 짝지어진 뒤 그 컬럼을 근거로 섹션이 짝지어진다.
+        for old_entry in reversed(self.old.entries):
+            old_order = old_entry.order
+            if self.old_to_new[old_order] != -1:
+                continue
+            new_order = _majority_parent(self.old_hashes.children[old_order], self.old_to_new, new_entries)
+            if new_order is None or self.new_to_old[new_order] != -1 or old_local[old_order] != new_local[new_order]:
+                continue
+            back = _majority_parent(self.new_hashes.children[new_order], self.new_to_old, self.old.entries)
+            if back == old_order:
+                self._pair(old_order, new_order, "children")
+
+    def _match_siblings(self) -> None:
+        old_local = self.old_hashes.local
+        new_local = self.new_hashes.local
+        old_roots = [entry.order for entry in self.old.entries if entry.parent is None]
+        new_roots = [entry.order for entry in self.new.entries if entry.parent is None]
+        self._match_children(old_roots, new_roots, old_local, new_local)
+        # 전위 순서라 이 단계에서 새로 짝지어진 부모의 자식도 같은 반복 안에서 처리된다.
+        for entry in self.old.entries:
+            new_order = self.old_to_new[entry.order]
+            if new_order != -1:
+                self._match_children(
+                    self.old_hashes.children[entry.order], self.new_hashes.children[new_order], old_local, new_local
+                )
+
+    def _match_children(
+        self,
+        old_children: List[int],
+        new_children: List[int],
+        old_local: List[bytes],
+        new_local: List[bytes],
+    ) -> None:
+        old_groups = _group_unmatched(old_children, old_local, self.old_to_new)
+        new_groups = _group_unmatched(new_children, new_local, self.new_to_old)
+        for digest, old_orders in old_groups.items():
+            new_orders = new_groups.get(digest)
+            if len(old_orders) == 1 and new_orders is not None and len(new_orders) == 1:
+                self._pair(old_orders[0], new_orders[0], "sibling")
+
+
+def _unique_positions(hashes: List[bytes]) -> Dict[bytes, Optional[int]]:
+    """해시 → 유일하면 위치, 여러 번 나오면 None. 예: _unique_positions([b"a", b"b", b"a"]) → {b"a": None, b"b": 1}"""
+
+    positions: Dict[bytes, Optional[int]] = {}
+    for position, digest in enumerate(hashes):
+        positions[digest] = None if digest in positions else position
+    return positions
+
+
+def _majority_parent(children: List[int], mapping: List[int], other_entries: List[IndexedElement]) -> Optional[int]:
+    """짝지어진 자식의 과반이 반대편에서 같은 부모 아래 있으면 그 부모 순서. 예: _majority_parent([4, 5], old_to_new, new.entries)"""
+
+    votes: Dict[int, int] = {}
+    for child in children:
+        other = mapping[child]
+        if other != -1:
+            parent = other_entries[other].parent
+            if parent is not None:
+                votes[parent.order] = votes.get(parent.order, 0) + 1
+    if not votes:
+        return None
+    winner, count = max(votes.items(), key=lambda item: item[1])
+    return winner if count * 2 > len(children) else None
+
+
+def _group_unmatched(orders: List[int], local: List[bytes], matched: List[int]) -> Dict[bytes, List[int]]:
+    groups: Dict[bytes, List[int]] = {}
+    for order in orders:
+        if matched[order] == -1:
+            groups.setdefault(local[order], []).append(order)
+    return groups
+
+
+def _sibling_ranks(entries: List[IndexedElement], orders: List[int]) -> Dict[int, int]:
+    """orders에 든 요소만 세어 같은 부모 아래 몇 번째인지 반환한다. 예: _sibling_ranks(index.entries, [1, 2, 5])"""
+
+    ranks: Dict[int, int] = {}
+    next_rank: Dict[int, int] = {}
+    # 전위 순서에서 형제는 인덱스 순서대로 나오므로 순서대로 세면 된다.
+    for order in sorted(orders):
+        parent = entries[order].parent
+        key = -1 if parent is None else parent.order
+        ranks[order] = next_rank.get(key, 0)
+        next_rank[key] = ranks[order] + 1
+    return ranks
+
+
+def diff_elementor_trees(old_data: Any, new_data: Any) -> Dict[str, Any]:
+    """두 Elementor 문서를 비교한다. 예: diff = diff_elementor_trees(read_json_file("old.json"), read_json_file("new.json"))
+
+    반환값의 id_map은 이전 id → 새 id(짝지어진 요소 중 id가 있는 것), 나머지는 리포트용 목록이다.
+    moved는 부모가 바뀐 요소, reordered는 부모는 같고 형제 안 위치만 바뀐 요소다.
+    """
+
+    old_index = ElementIndex.build(old_data)
+    new_index = ElementIndex.build(new_data)
+    matcher = _TreeMatcher(old_index, new_index).run()
+    old_is_list = isinstance(old_data, list)
+    new_is_list = isinstance(new_data, list)
+
+    def describe(entry: IndexedElement, root_is_list: bool) -> Dict[str, Any]:
+        element = entry.element
+        return {
+            "id": element.get("id"),
+            "el_type": element.get("elType"),
+            "widget_type": element.get("widgetType") or element.get("widget_type"),
+            "path": element_pointer(entry.index_path(), root_is_list),
+        }
+
+    id_map: Dict[str, str] = {}
+    moved: List[Dict[str, Any]] = []
+    reasons: Dict[str, int] = {}
+    removed: List[Dict[str, Any]] = []
+    staying: List[int] = []
+    for old_entry in old_index.entries:
+        new_order = matcher.old_to_new[old_entry.order]
+        if new_order == -1:
+            removed.append(describe(old_entry, old_is_list))
+            continue
+        reason = matcher.reasons[old_entry.order] or ""
+        reasons[reason] = reasons.get(reason, 0) + 1
+        new_entry = new_index.entries[new_order]
+        old_id, new_id = old_entry.element.get("id"), new_entry.element.get("id")
+        if isinstance(old_id, str) and isinstance(new_id, str):
+            id_map[old_id] = new_id
+
+        # 루트는 -1, 짝이 없는 부모는 -2로 두어 "부모가 같은가"를 새 문서 기준 순서로 비교한다.
+        old_parent = -1
+        if old_entry.parent is not None:
+            old_parent = matcher.old_to_new[old_entry.parent.order]
+            old_parent = -2 if old_parent == -1 else old_parent
+        new_parent = -1 if new_entry.parent is None else new_entry.parent.order
+        if old_parent != new_parent:
+            moved.append({"old": describe(old_entry, old_is_list), "new": describe(new_entry, new_is_list)})
+        else:
+            staying.append(old_entry.order)
+
+    # 추가/삭제로 밀린 형제는 빼고, 부모에 남은 형제들 사이의 순번이 달라진 요소만 reordered로 본다.
+    old_ranks = _sibling_ranks(old_index.entries, staying)
+    new_ranks = _sibling_ranks(new_index.entries, [matcher.old_to_new[order] for order in staying])
+    reordered = [
+        {"old": describe(old_index.entries[order], old_is_list), "new": describe(new_index.entries[matcher.old_to_new[order]], new_is_list)}
+        for order in staying
+        if old_ranks[order] != new_ranks[matcher.old_to_new[order]]
+    ]
+
+    added = [
+        describe(new_entry, new_is_list) for new_entry in new_index.entries if matcher.new_to_old[new_entry.order] == -1
+    ]
+    # 한 문서 안에 같은 id가 여러 번 나오면 어느 요소인지 정할 수 없어 재매핑에서 뺀다.
+    ambiguous_ids = sorted(element_id for element_id, entries in old_index.by_id.items() if len(entries) > 1)
+    for element_id in ambiguous_ids:
+        id_map.pop(element_id, None)
+
+    return {
+        "summary": {
+            "old_elements": len(old_index),
+            "new_elements": len(new_index),
+            "matched": len(old_index) - len(removed),
+            "id_changed": sum(1 for old_id, new_id in id_map.items() if old_id != new_id),
+            "added": len(added),
+            "removed": len(removed),
+            "moved": len(moved),
+            "reordered": len(reordered),
+            "matched_by": dict(sorted(reasons.items())),
+        },
+        "id_map": id_map,
+        "ambiguous_ids": ambiguous_ids,
+        "added": added,
+        "removed": removed,
+        "moved": moved,
+        "reordered": reordered,
+    }
+
+
+def remap_adapter(
+    adapter: Dict[str, Any],
+    id_map: Dict[str, str],
+    old_ids: Collection[str],
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """어댑터 patch의 element_id를 새 id로 바꾼 사본과 패치별 결과를 반환한다. 예: remap_adapter(adapter, diff["id_map"], {"a1b2c3"})
+
+    상태: remapped(바뀜), unchanged(id 그대로), unresolved(이전 요소가 새 판에서 짝을 못 찾음 → 그대로 둠),
+    unknown(이전 문서에도 없는 id → 그대로 둠). css_id만 쓰는 패치는 settings 값으로 찾으므로 건드리지 않는다.
+    """
+
+    remapped_pages: List[Any] = []
+    changes: List[Dict[str, Any]] = []
+    for page in adapter.get("pages", []):
+        if not isinstance(page, dict) or not isinstance(page.get("patches"), list):
+            remapped_pages.append(page)
+            continue
+        patches: List[Any] = []
+        for patch_index, patch in enumerate(page["patches"]):
+            element_id = patch.get("element_id") if isinstance(patch, dict) else None
+            if not isinstance(element_id, str) or not element_id:
+                patches.append(patch)
+                continue
+            new_id = id_map.get(element_id)
+            if new_id is None:
+                status = "unresolved" if element_id in old_ids else "unknown"
+            else:
+                status = "unchanged" if new_id == element_id else "remapped"
+            patches.append({**patch, "element_id": new_id} if status == "remapped" else patch)
+            changes.append(
+                {
+                    "page": page.get("post_slug"),
+                    "patch_index": patch_index,
+                    "status": status,
+                    "element_id": element_id,
+                    "new_element_id": new_id,
+                }
+            )
+        remapped_pages.append({**page, "patches": patches})
+    return {**adapter, "pages": remapped_pages}, changes
+
+
+def _common_parent(paths: List[Path]) -> Path:
+    """파일들의 공통 상위 폴더. 예: _common_parent([Path("templates/t1/adapter.json"), Path("templates/t2/adapter.json")]) → Path("templates")"""
+
+    return Path(os.path.commonpath([str(path.parent) for path in paths]))
+
+
+def diff_template(
+    *,
+    old_path: Path,
+    new_path: Path,
+    output_dir: Path,
+    adapter_pattern: Optional[str] = None,
+) -> Dict[str, Any]:
+    """템플릿 두 판을 비교해 template_diff.json을 저장하고, 어댑터가 있으면 id를 바꾼 사본을 저장한다. 예: diff_template(old_path=Path("old/home.json"), new_path=Path("templates/t1/home.json"), output_dir=Path("output/diff"), adapter_pattern="data/adapters")
+
+    어댑터는 <output_dir>/adapters/<입력 기준 상대 경로>로 저장하고 원본은 건드리지 않는다
+    (예: templates/t1/adapter.json → adapters/t1/adapter.json). pages 리스트가 없는 JSON(페이지 문서 등)은 건너뛴다.
+    """
+
+    started = perf_counter()
+    old_data = read_json_file(old_path)
+    new_data = read_json_file(new_path)
+    diff = diff_elementor_trees(old_data, new_data)
+    old_ids = set(diff["id_map"]) | set(diff["ambiguous_ids"]) | {item["id"] for item in diff["removed"]}
+
+    output_root = ensure_directory(output_dir)
+    adapters: List[Dict[str, Any]] = []
+    skipped: List[str] = []
+    if adapter_pattern:
+        loaded = []
+        for path in discover_input_files(adapter_pattern):
+            if path.suffix != ".json":
+                continue
+            adapter = read_json_file(path)
+            if isinstance(adapter, dict) and isinstance(adapter.get("pages"), list):
+                loaded.append((path, adapter))
+            else:
+                skipped.append(str(path))
+        if not loaded:
+            raise FriendlyError(user_message=f"재매핑할 어댑터가 없습니다: {adapter_pattern}")
+
+        # 파일 이름만 쓰면 templates/<template_id>/adapter.json끼리 덮어쓰므로 입력 기준 상대 경로를 유지한다.
+        input_root = Path(adapter_pattern) if Path(adapter_pattern).is_dir() else _common_parent([path for path, _ in loaded])
+        adapter_root = output_root / REMAPPED_ADAPTER_DIR
+        for adapter_path, adapter in loaded:
+            remapped, changes = remap_adapter(adapter, diff["id_map"], old_ids)
+            output_path = adapter_root / adapter_path.relative_to(input_root)
+            write_json_file(output_path, remapped)
+            counts: Dict[str, int] = {}
+            for change in changes:
+                counts[change["status"]] = counts.get(change["status"], 0) + 1
+            adapters.append(
+                {
+                    "adapter": str(adapter_path),
+                    "output": str(output_path),
+                    "counts": dict(sorted(counts.items())),
+                    "patches": [change for change in changes if change["status"] != "unchanged"],
+                }
+            )
+
+    report = {
+        "old": str(old_path),
+        "new": str(new_path),
+        "elapsed_ms": round((perf_counter() - started) * 1000, 3),
+        **diff,
+        "adapters": adapters,
+        "skipped_files": skipped,
+    }
+    report_path = output_root / TEMPLATE_DIFF_REPORT_NAME
+    write_json_file(report_path, report)
+
+    return {
+        "template_diff_path": str(report_path),
+        **diff["summary"],
+        "adapters": [{key: item[key] for key in ("adapter", "output", "counts")} for item in adapters],
+        "elapsed_ms": report["elapsed_ms"],
+    }
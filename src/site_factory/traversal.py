@@ -0,0 +1,138 @@
+# v0.2 - 루트 elements를 이터러블로도 받도록 확장 (2026-10-17)
+# 기능: 스택 기반 단일 순회 + 방문자 플러그인 (예: run_visitors(elements, [collector, matcher]))
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class ElementVisit:
+    """순회 중 방문한 요소와 위치. 예: visit.element, visit.parent, visit.index, visit.depth"""
+
+    element: Dict[str, Any]
+    parent: Optional["ElementVisit"]
+    index: int
+    order: int
+    depth: int
+
+    def index_path(self) -> Tuple[int, ...]:
+        """루트부터의 인덱스 경로를 반환한다. 예: visit.index_path() → (0, 2, 1)"""
+
+        indexes: List[int] = []
+        current: Optional[ElementVisit] = self
+        while current is not None:
+            indexes.append(current.index)
+            current = current.parent
+        return tuple(reversed(indexes))
+
+
+@dataclass
+class TraversalStats:
+    """순회 통계. 예: stats.visited, stats.depth_limited"""
+
+    visited: int = 0
+    max_depth_seen: int = 0
+    depth_limited: int = 0
+    stopped_early: bool = False
+
+
+class ElementVisitor:
+    """순회 플러그인 기본 클래스. 예: class Collector(ElementVisitor): def visit(self, visit): ..."""
+
+    # 이 깊이보다 깊은 요소는 이 방문자에게 전달하지 않는다 (None이면 제한 없음).
+    max_depth: Optional[int] = None
+
+    def visit(self, visit: ElementVisit) -> bool:
+        """요소 하나를 처리한다. True를 반환하면 이 방문자는 더 이상 호출되지 않는다."""
+
+        return False
+
+    def skip_depth(self, visit: ElementVisit) -> None:
+        """max_depth를 넘어 전달되지 않은 요소마다 호출된다. 예: visitor.skip_depth(visit)"""
+
+    def finish(self) -> None:
+        """순회가 끝난 뒤 한 번 호출된다. 예: visitor.finish()"""
+
+
+def walk_elements(
+    elements: Iterable[Any],
+    max_depth: Optional[int] = None,
+    stats: Optional[TraversalStats] = None,
+) -> Iterator[ElementVisit]:
+    """elements 트리를 스택으로 전위 순회한다. 예: for visit in walk_elements(elements): ...
+
+    루트는 리스트뿐 아니라 스트리밍 리더 같은 이터러블도 받으며, 루트 요소는 필요할 때 하나씩 꺼낸다.
+    """
+
+    order = 0
+    for root_index, root in enumerate(elements):
+        if not isinstance(root, dict):
+            continue
+
+        # 재귀 대신 (요소, 위치, 부모, 깊이) 스택을 사용해 깊은 트리도 안전하게 순회한다.
+        stack: List[Tuple[Dict[str, Any], int, Optional[ElementVisit], int]] = [(root, root_index, None, 0)]
+        while stack:
+            element, position, parent, depth = stack.pop()
+            visit = ElementVisit(
+                element=element,
+                parent=parent,
+                index=position,
+                order=order,
+                depth=depth,
+            )
+            order += 1
+            if stats is not None:
+                stats.visited += 1
+                if depth > stats.max_depth_seen:
+                    stats.max_depth_seen = depth
+            yield visit
+
+            children = element.get("elements")
+            if not isinstance(children, list) or not children:
+                continue
+
+            if max_depth is not None and depth + 1 > max_depth:
+                # 잘라낸 하위 트리는 조용히 버리지 않고 통계로 남긴다.
+                if stats is not None:
+                    stats.depth_limited += sum(1 for child in children if isinstance(child, dict))
+                continue
+
+            # 전위 순서를 지키기 위해 뒤의 자식부터 쌓는다.
+            for child_index in range(len(children) - 1, -1, -1):
+                child = children[child_index]
+                if isinstance(child, dict):
+                    stack.append((child, child_index, visit, depth + 1))
+
+
+def run_visitors(
+    elements: Iterable[Any],
+    visitors: Sequence[ElementVisitor],
+) -> TraversalStats:
+    """한 번의 순회로 여러 방문자를 실행한다. 예: run_visitors(elements, [collector, matcher])"""
+
+    stats = TraversalStats()
+    active = list(visitors)
+
+    for visit in walk_elements(elements, stats=stats):
+        finished = []
+        for visitor in active:
+            limit = visitor.max_depth
+            if limit is not None and visit.depth > limit:
+                visitor.skip_depth(visit)
+                continue
+            if visitor.visit(visit):
+                finished.append(visitor)
+
+        if finished:
+            active = [visitor for visitor in active if visitor not in finished]
+            if not active:
+                # 모든 방문자가 끝나면 남은 트리는 읽지 않는다.
+                stats.stopped_early = True
+                break
+
+    for visitor in visitors:
+        visitor.finish()
+
+    return stats
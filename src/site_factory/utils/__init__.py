@@ -1,7 +1,16 @@
 # v0.1 - 유틸 모듈 집합 초기화 (2026-01-16)
 # 기능: 공통 유틸 모듈 공개 (예: from site_factory.utils import io_utils)
 
-from .dict_utils import get_nested_value, has_nested_value, set_nested_value
+from .dict_utils import (
+    compile_path,
+    get_compiled_value,
+    get_nested_value,
+    has_compiled_value,
+    has_nested_value,
+    path_cache_info,
+    set_compiled_value,
+    set_nested_value,
+)
 from .error_utils import FriendlyError, build_user_friendly_message
 from .io_utils import ensure_directory, read_json_file, write_json_file
 from .log_utils import create_logger
@@ -10,6 +19,11 @@ from .time_utils import get_iso_timestamp
 __all__ = [
     "FriendlyError",
     "build_user_friendly_message",
+    "compile_path",
+    "get_compiled_value",
+    "set_compiled_value",
+    "has_compiled_value",
+    "path_cache_info",
     "get_nested_value",
     "has_nested_value",
     "set_nested_value",
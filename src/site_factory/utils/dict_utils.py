@@ -1,10 +1,73 @@
-# v0.2 - 리스트 인덱스 경로 지원 추가 (2026-01-19)
-# 기능: 중첩 키 조회/설정 (예: get_nested_value(data, "settings.items.0.text"))
+# v0.5 - 설정 없이 대상 경로 상태만 확인하는 probe_compiled_target 추가 (2026-10-17)
+# 기능: 중첩 키 조회/설정 (예: get_nested_value(data, "content.titles[0]"))
 
-from typing import Any, Dict, Iterable, Optional
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 _MISSING = object()
 
+# 한글: str 세그먼트는 dict 키(숫자면 리스트 인덱스도 허용), int 세그먼트는 [n] 리스트 인덱스다.
+PathSegment = Union[str, int]
+CompiledPath = Tuple[PathSegment, ...]
+
+PATH_CACHE_SIZE = 4096
+
+_BRACKET_INDEX_PATTERN = re.compile(r"\[(\d+)\]")
+
+
+def compile_path(key_path: str, separator: str = ".") -> CompiledPath:
+    """경로 문자열을 접근자 튜플로 컴파일한다. 예: compile_path("content.titles[0]") → ("content", "titles", 0)
+
+    지원 문법: 점 구분 키(a.b), 숫자 세그먼트(items.0.text), 대괄호 인덱스(titles[0], [0][1]).
+    컴파일 결과는 크기가 제한된 LRU 캐시에 보관한다.
+    """
+
+    if not key_path:
+        return ()
+    return _compile_path_cached(key_path, separator)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _compile_path_cached(key_path: str, separator: str) -> CompiledPath:
+    """compile_path의 캐시 본체. 예: _compile_path_cached("a.b[0]", ".")"""
+
+    segments: List[PathSegment] = []
+    for raw_segment in _split_path(key_path, separator):
+        segments.extend(_parse_segment(raw_segment))
+    return tuple(segments)
+
+
+def _parse_segment(raw_segment: str) -> List[PathSegment]:
+    """세그먼트 하나의 대괄호 인덱스를 분리한다. 예: _parse_segment("titles[0]") → ["titles", 0]"""
+
+    bracket_start = raw_segment.find("[")
+    if bracket_start < 0:
+        return [raw_segment]
+
+    suffix = raw_segment[bracket_start:]
+    indexes = _BRACKET_INDEX_PATTERN.findall(suffix)
+    # 한글: "[숫자]" 반복이 아니면 대괄호까지 포함한 일반 키로 취급한다.
+    if not indexes or "".join(f"[{index}]" for index in indexes) != suffix:
+        return [raw_segment]
+
+    name = raw_segment[:bracket_start]
+    segments: List[PathSegment] = [name] if name else []
+    segments.extend(int(index) for index in indexes)
+    return segments
+
+
+def path_cache_info() -> Dict[str, int]:
+    """경로 컴파일 캐시 상태를 반환한다. 예: path_cache_info()["hits"]"""
+
+    info = _compile_path_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize or 0,
+    }
+
 
 def get_nested_value(
     data: Dict[str, Any],
@@ -17,16 +80,26 @@ def get_nested_value(
     if not key_path:
         return default
 
+    return get_compiled_value(data, compile_path(key_path, separator), default)
+
+
+def get_compiled_value(
+    data: Dict[str, Any],
+    keys: CompiledPath,
+    default: Optional[Any] = None,
+) -> Any:
+    """분할된 경로로 값을 조회한다. 예: get_compiled_value(site_spec, ("brand", "name"))"""
+
     current: Any = data
-    for key in _split_path(key_path, separator):
+    for key in keys:
         # 딕셔너리 경로 처리
         if isinstance(current, dict) and key in current:
             current = current[key]
             continue
 
         # 리스트 인덱스 처리
-        if isinstance(current, list) and key.isdigit():
-            index = int(key)
+        index = _as_list_index(key)
+        if isinstance(current, list) and index is not None:
             if 0 <= index < len(current):
                 current = current[index]
                 continue
@@ -35,6 +108,12 @@ def get_nested_value(
     return current
 
 
+def has_compiled_value(data: Dict[str, Any], keys: CompiledPath) -> bool:
+    """분할된 경로의 존재 여부를 확인한다. 예: has_compiled_value(site_spec, compile_path("brand.name"))"""
+
+    return get_compiled_value(data, keys, default=_MISSING) is not _MISSING
+
+
 def has_nested_value(
     data: Dict[str, Any],
     key_path: str,
@@ -57,7 +136,20 @@ def set_nested_value(
     if not key_path:
         return False
 
-    keys = list(_split_path(key_path, separator))
+    return set_compiled_value(data, compile_path(key_path, separator), value, strict=strict)
+
+
+def set_compiled_value(
+    data: Dict[str, Any],
+    keys: CompiledPath,
+    value: Any,
+    strict: bool = True,
+) -> bool:
+    """분할된 경로에 값을 설정한다. 예: set_compiled_value(element, ("settings", "title"), "새 제목")"""
+
+    if not keys:
+        return False
+
     current: Any = data
 
     # 중간 경로를 따라간다. dict 또는 list 인덱스를 허용한다.
@@ -66,8 +158,8 @@ def set_nested_value(
             current = current[key]
             continue
 
-        if isinstance(current, list) and key.isdigit():
-            index = int(key)
+        index = _as_list_index(key)
+        if isinstance(current, list) and index is not None:
             if 0 <= index < len(current):
                 current = current[index]
                 continue
@@ -76,7 +168,8 @@ def set_nested_value(
         if strict:
             return False
 
-        if isinstance(current, dict):
+        # 한글: [n] 인덱스 세그먼트로는 새 dict 키를 만들지 않는다.
+        if isinstance(current, dict) and isinstance(key, str):
             current[key] = {}
             current = current[key]
             continue
@@ -84,12 +177,12 @@ def set_nested_value(
         return False
 
     last_key = keys[-1]
-    if isinstance(current, dict):
+    if isinstance(current, dict) and isinstance(last_key, str):
         current[last_key] = value
         return True
 
-    if isinstance(current, list) and last_key.isdigit():
-        index = int(last_key)
+    index = _as_list_index(last_key)
+    if isinstance(current, list) and index is not None:
         if 0 <= index < len(current):
             current[index] = value
             return True
@@ -97,6 +190,47 @@ def set_nested_value(
     return False
 
 
+def probe_compiled_target(data: Any, keys: CompiledPath) -> str:
+    """strict 설정이 성공할지 값을 바꾸지 않고 확인한다. 예: probe_compiled_target(element, ("settings", "title")) → "exists"
+
+    반환값: "exists"(마지막 키까지 있음), "new_key"(부모 dict는 있고 마지막 키만 새로 생김), "unresolved"(strict 설정 실패).
+    """
+
+    if not keys:
+        return "unresolved"
+
+    current: Any = data
+    for key in keys[:-1]:
+        if isinstance(current, dict) and key in current:
+            current = current[key]
+            continue
+
+        index = _as_list_index(key)
+        if isinstance(current, list) and index is not None and 0 <= index < len(current):
+            current = current[index]
+            continue
+        return "unresolved"
+
+    last_key = keys[-1]
+    if isinstance(current, dict) and isinstance(last_key, str):
+        return "exists" if last_key in current else "new_key"
+
+    index = _as_list_index(last_key)
+    if isinstance(current, list) and index is not None and 0 <= index < len(current):
+        return "exists"
+    return "unresolved"
+
+
+def _as_list_index(key: PathSegment) -> Optional[int]:
+    """세그먼트를 리스트 인덱스로 해석한다. 예: _as_list_index("0") → 0"""
+
+    if isinstance(key, int):
+        return key
+    if key.isdigit():
+        return int(key)
+    return None
+
+
 def _split_path(key_path: str, separator: str) -> Iterable[str]:
     """경로 문자열을 분할한다. 예: list(_split_path("a.b.c", "."))"""
 
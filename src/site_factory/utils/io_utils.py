@@ -1,14 +1,71 @@
-# v0.1 - 파일 입출력 유틸 추가 (2026-01-16)
+# v0.7 - 프로세스/스레드별 임시 파일 경로(temp_path_for) 공개 (2026-10-17)
 # 기능: JSON 읽기/쓰기와 디렉터리 보장 (예: read_json_file("data/mock/site_spec.sample.json"))
 
+import hashlib
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Union
 
 from .error_utils import FriendlyError
 
+try:
+    # 설치되어 있으면 빠른 인코더/디코더를 사용하고, 없으면 표준 json으로 동작한다.
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
 PathLike = Union[str, Path]
 
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# SITE_FACTORY_JSON_BACKEND=stdlib 로 설치된 orjson을 끌 수 있다 (출력 비교/디버깅용).
+JSON_BACKEND = (
+    "orjson"
+    if orjson is not None and os.environ.get("SITE_FACTORY_JSON_BACKEND", "").lower() != "stdlib"
+    else "stdlib"
+)
+
+
+def dumps_json(data: Any, compact: bool = False, sort_keys: bool = False) -> bytes:
+    """JSON을 UTF-8 바이트로 직렬화한다. 예: dumps_json({"a": 1}, compact=True) → b'{"a":1}'
+
+    compact가 아니면 indent=2, compact면 공백 없이 쓴다. 두 백엔드의 들여쓰기/구분자 형식은 같다.
+    sort_keys면 키 순서와 무관하게 같은 값은 같은 바이트가 된다 (해시용).
+    """
+
+    if JSON_BACKEND == "orjson":
+        try:
+            option = orjson.OPT_NON_STR_KEYS
+            if not compact:
+                option |= orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # 64비트를 넘는 정수처럼 orjson이 못 쓰는 값은 표준 json으로 처리한다.
+            pass
+
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    return text.encode("utf-8")
+
+
+def loads_json(raw: Union[bytes, str]) -> Any:
+    """JSON 바이트/문자열을 해석한다. 예: loads_json(b'{"a": 1}')"""
+
+    if JSON_BACKEND == "orjson":
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # 큰 정수/NaN 등 표준 json만 받는 입력이 있어 한 번 더 시도한다.
+            pass
+
+    return json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else raw)
+
 
 def ensure_directory(directory_path: PathLike) -> Path:
     """디렉터리를 생성/보장한다. 예: ensure_directory("output")"""
@@ -27,6 +84,13 @@ def ensure_directory(directory_path: PathLike) -> Path:
 def read_json_file(file_path: PathLike) -> Dict[str, Any]:
     """JSON 파일을 읽는다. 예: read_json_file("data/mock/site_spec.sample.json")"""
 
+    normalized_path = Path(file_path)
+    return parse_json_bytes(read_bytes_file(normalized_path), normalized_path)
+
+
+def read_bytes_file(file_path: PathLike) -> bytes:
+    """파일 원본 바이트를 읽는다. 예: read_bytes_file("data/elementor-home.json")"""
+
     normalized_path = Path(file_path)
 
     if not normalized_path.exists():
@@ -35,30 +99,86 @@ def read_json_file(file_path: PathLike) -> Dict[str, Any]:
         )
 
     try:
-        with normalized_path.open("r", encoding="utf-8") as file_handle:
-            return json.load(file_handle)
-    except json.JSONDecodeError as error:
+        return normalized_path.read_bytes()
+    except OSError as error:
         raise FriendlyError(
-            user_message=f"JSON 파싱에 실패했습니다: {normalized_path}",
+            user_message=f"JSON 파일을 읽을 수 없습니다: {normalized_path}",
             detail=str(error),
         ) from error
+
+
+def update_file_digest(digest: Any, file_path: PathLike) -> None:
+    """파일 전체를 메모리에 올리지 않고 해시에 더한다. 예: update_file_digest(hashlib.sha256(), "data/kit.json")"""
+
+    try:
+        with Path(file_path).open("rb") as file_handle:
+            for chunk in iter(lambda: file_handle.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
     except OSError as error:
         raise FriendlyError(
-            user_message=f"JSON 파일을 읽을 수 없습니다: {normalized_path}",
+            user_message=f"JSON 파일을 읽을 수 없습니다: {file_path}",
             detail=str(error),
         ) from error
 
 
-def write_json_file(file_path: PathLike, data: Dict[str, Any]) -> None:
-    """JSON 파일을 저장한다. 예: write_json_file("output/result.json", data)"""
+def file_sha256(file_path: PathLike) -> str:
+    """파일 바이트의 sha256 16진수 문자열. 예: file_sha256("data/elementor-home.json")"""
+
+    digest = hashlib.sha256()
+    update_file_digest(digest, file_path)
+    return digest.hexdigest()
+
+
+def file_signature(file_path: PathLike) -> Optional[List[int]]:
+    """파일 크기와 수정 시각(ns). 없으면 None. 바뀌었는지 싸게 확인할 때 쓴다. 예: file_signature("output/patch_results.json")"""
+
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def parse_json_bytes(raw: bytes, source: PathLike = "<bytes>") -> Any:
+    """이미 읽은 바이트를 JSON으로 해석한다. 예: parse_json_bytes(raw, "data/elementor-home.json")"""
+
+    try:
+        return loads_json(raw)
+    except ValueError as error:
+        # JSONDecodeError와 UTF-8 디코딩 오류를 함께 처리한다.
+        raise FriendlyError(
+            user_message=f"JSON 파싱에 실패했습니다: {source}",
+            detail=str(error),
+        ) from error
+
+
+def temp_path_for(file_path: PathLike) -> Path:
+    """같은 폴더에 프로세스/스레드별로 겹치지 않는 임시 파일 경로를 만든다. 예: temp_path_for("output/report.json")"""
+
+    normalized_path = Path(file_path)
+    return normalized_path.with_name(f".{normalized_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def write_json_file(file_path: PathLike, data: Dict[str, Any], compact: bool = False) -> None:
+    """JSON 파일을 저장한다. 예: write_json_file("output/result.json", data, compact=True)
+
+    임시 파일에 쓴 뒤 rename으로 교체하므로 병렬 워커가 반쯤 쓴 파일을 보지 않는다.
+    """
 
     normalized_path = Path(file_path)
+    payload = dumps_json(data, compact=compact)
+    temp_path = temp_path_for(normalized_path)
 
     try:
         normalized_path.parent.mkdir(parents=True, exist_ok=True)
-        with normalized_path.open("w", encoding="utf-8") as file_handle:
-            json.dump(data, file_handle, ensure_ascii=False, indent=2)
+        with temp_path.open("wb") as file_handle:
+            file_handle.write(payload)
+        os.replace(temp_path, normalized_path)
     except OSError as error:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
         raise FriendlyError(
             user_message=f"JSON 파일을 저장할 수 없습니다: {normalized_path}",
             detail=str(error),
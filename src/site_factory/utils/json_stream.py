@@ -0,0 +1,319 @@
+# v0.2 - elements 키가 없는 문서도 요소처럼 보이는 첫 최상위 리스트를 스트리밍 (2026-10-17)
+# 기능: 큰 Elementor JSON을 전체 로드 없이 루트 elements 단위로 읽는다 (예: ElementStream("data/kit.json"))
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from json.decoder import scanstring
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator, List, Optional, Tuple
+
+from .error_utils import FriendlyError
+from .io_utils import PathLike
+
+# (이벤트, 값) 쌍. 이벤트 이름은 ijson.basic_parse와 같다.
+JsonEvent = Tuple[str, Any]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?")
+_LITERALS = {"true": ("boolean", True), "false": ("boolean", False), "null": ("null", None)}
+_JSON_DECODER = json.JSONDecoder()
+_START_EVENTS = ("start_map", "start_array")
+_END_EVENTS = ("end_map", "end_array")
+# 다른 키의 리스트가 elements인지 판단할 때 보는 앞 항목 수 (scanner의 얕은 탐색과 같다)
+ROOT_PROBE_ITEMS = 5
+
+
+def iter_json_events(
+    file_handle: IO[bytes],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[JsonEvent]:
+    """바이너리 파일에서 JSON 이벤트를 순서대로 읽는다. 예: for event, value in iter_json_events(handle): ..."""
+
+    return _PythonEventReader(file_handle, chunk_size)
+
+
+def skip_value(events: Iterator[JsonEvent], event: str) -> None:
+    """현재 값을 만들지 않고 건너뛴다. 예: skip_value(events, "start_array")"""
+
+    if event not in _START_EVENTS:
+        return
+
+    depth = 1
+    for event, _ in events:
+        if event in _START_EVENTS:
+            depth += 1
+        elif event in _END_EVENTS:
+            depth -= 1
+            if depth == 0:
+                return
+
+    raise ValueError("JSON이 중간에 끝났습니다.")
+
+
+class ElementStream:
+    """루트 elements를 하나씩 읽는 스트림. 예: for element in ElementStream(path): ...
+
+    최상위가 리스트면 그 항목을, 딕셔너리면 "elements" 리스트의 항목을 순서대로 만든다.
+    looks_like_elements를 주면 다른 키의 리스트도 앞 ROOT_PROBE_ITEMS개 항목이 그 판정을 통과할 때 루트로 쓴다
+    (예: {"content": [...]} 내보내기). 키 순서대로 처음 찾은 루트만 읽고 나머지 키는 읽지 않는다.
+    구조는 이벤트로 따라가고 루트 요소는 json 디코더(C 구현)로 하나씩 만들므로,
+    한 번에 메모리에 올라가는 것은 루트 요소 하나(판정 중에는 앞 항목 몇 개)뿐이다.
+    루트를 못 찾으면 root_found가 False로 남는다.
+    """
+
+    def __init__(
+        self,
+        file_path: PathLike,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        looks_like_elements: Optional[Callable[[List[Any]], bool]] = None,
+    ) -> None:
+        self.file_path = Path(file_path)
+        self.chunk_size = chunk_size
+        self.looks_like_elements = looks_like_elements
+        self.root_found = False
+        self.root_count = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        if not self.file_path.exists():
+            raise FriendlyError(
+                user_message=f"JSON 파일을 찾을 수 없습니다: {self.file_path}",
+            )
+
+        try:
+            with self.file_path.open("rb") as file_handle:
+                yield from self._iter_root_elements(_PythonEventReader(file_handle, self.chunk_size))
+        except OSError as error:
+            raise FriendlyError(
+                user_message=f"JSON 파일을 읽을 수 없습니다: {self.file_path}",
+                detail=str(error),
+            ) from error
+        except ValueError as error:
+            # JSONDecodeError와 UTF-8 디코딩 오류를 함께 처리한다.
+            raise FriendlyError(
+                user_message=f"JSON 파싱에 실패했습니다: {self.file_path}",
+                detail=str(error),
+            ) from error
+
+    def _iter_root_elements(self, events: "_PythonEventReader") -> Iterator[Any]:
+        """루트 elements 항목을 만든다. 예: self._iter_root_elements(events)"""
+
+        event, _ = next(events, (None, None))
+        if event == "start_array":
+            self.root_found = True
+            yield from self._iter_array_items(events)
+            return
+
+        if event != "start_map":
+            return
+
+        for event, key in events:
+            if event == "end_map":
+                return
+            event, value = next(events)
+            if event == "start_array" and key == "elements":
+                self.root_found = True
+                yield from self._iter_array_items(events)
+                # 나머지 키는 읽지 않는다 (조기 종료와 같은 이유).
+                return
+            if event == "start_array" and self.looks_like_elements is not None:
+                head, finished = self._read_head(events)
+                if head and self.looks_like_elements(head):
+                    self.root_found = True
+                    self.root_count += len(head)
+                    yield from head
+                    if not finished:
+                        yield from self._iter_array_items(events)
+                    return
+                if not finished:
+                    skip_value(events, event)
+                continue
+            skip_value(events, event)
+
+    def _read_head(self, events: "_PythonEventReader") -> Tuple[List[Any], bool]:
+        """열린 리스트의 앞 항목을 읽는다. (항목들, 리스트가 끝났는지). 예: self._read_head(events)"""
+
+        head: List[Any] = []
+        while len(head) < ROOT_PROBE_ITEMS:
+            has_item, item = events.read_array_item()
+            if not has_item:
+                return head, True
+            head.append(item)
+            if not isinstance(item, dict):
+                # 판정에 실패할 리스트라 더 읽지 않는다.
+                break
+        return head, False
+
+    def _iter_array_items(self, events: "_PythonEventReader") -> Iterator[Any]:
+        """리스트 항목을 하나씩 완성해 반환한다. 예: self._iter_array_items(events)"""
+
+        while True:
+            # 항목마다 이벤트를 만들지 않고 json 디코더로 통째로 읽는다.
+            has_item, item = events.read_array_item()
+            if not has_item:
+                return
+            self.root_count += 1
+            yield item
+
+
+class _PythonEventReader:
+    """순수 파이썬 JSON 토크나이저. 예: for event, value in _PythonEventReader(handle, 65536): ...
+
+    문자열은 json 모듈의 scanstring(C 구현)으로 해석하고, 청크 경계에 걸린 토큰은 다음 청크를 붙여 다시 읽는다.
+    read_array_item()은 이벤트를 만들지 않고 리스트 항목 하나를 json 디코더로 통째로 읽는다.
+    쉼표/콜론 위치는 검사하지 않으므로 문법 검증은 json.loads보다 느슨하다.
+    """
+
+    def __init__(self, file_handle: IO[bytes], chunk_size: int) -> None:
+        self.file_handle = file_handle
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+        # 열린 컨테이너가 딕셔너리인지 여부, 다음 문자열이 키인지 여부
+        self.containers: List[bool] = []
+        self.expect_key = False
+        self._events = self._generate_events()
+
+    def __iter__(self) -> "_PythonEventReader":
+        return self
+
+    def __next__(self) -> JsonEvent:
+        return next(self._events)
+
+    def read_array_item(self) -> Tuple[bool, Any]:
+        """열린 리스트의 다음 항목을 읽는다. 리스트가 끝나면 (False, None). 예: reader.read_array_item()"""
+
+        char = self._peek()
+        if char == ",":
+            self.position += 1
+            char = self._peek()
+        if char == "]":
+            self.position += 1
+            if not self.containers or self.containers.pop():
+                raise ValueError("짝이 맞지 않는 ']'가 있습니다.")
+            return False, None
+        if not char:
+            raise ValueError("JSON이 중간에 끝났습니다.")
+
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._fill(grow=True)
+                continue
+            # 숫자는 버퍼 끝에서 잘렸을 수 있으므로 더 읽어 확인한다.
+            if end >= len(self.buffer) - 2 and not self.eof and not isinstance(value, (dict, list, str)):
+                self._fill(grow=True)
+                continue
+            self.position = end
+            return True, value
+
+    def _peek(self) -> str:
+        """공백을 건너뛰고 다음 글자를 본다. 끝이면 빈 문자열. 예: self._peek()"""
+
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if self.eof:
+                return ""
+            self._fill()
+
+    def _fill(self, grow: bool = False) -> None:
+        """읽은 부분을 버리고 다음 청크를 붙인다. grow면 남은 길이만큼 더 읽어 재시도 비용을 줄인다."""
+
+        size = max(self.chunk_size, len(self.buffer) - self.position) if grow else self.chunk_size
+        chunk = self.file_handle.read(size)
+        if chunk:
+            text = self.decoder.decode(chunk)
+        else:
+            self.eof = True
+            text = self.decoder.decode(b"", final=True)
+        self.buffer = self.buffer[self.position:] + text
+        self.position = 0
+
+    def _generate_events(self) -> Iterator[JsonEvent]:
+        """이벤트를 순서대로 만든다. 예: self._generate_events()"""
+
+        while True:
+            char = self._peek()
+            if not char:
+                break
+
+            position = self.position
+            if char == '"':
+                try:
+                    text, end = scanstring(self.buffer, position + 1)
+                except json.JSONDecodeError:
+                    if self.eof:
+                        raise
+                    self._fill(grow=True)
+                    continue
+                self.position = end
+                if self.expect_key:
+                    self.expect_key = False
+                    yield ("map_key", text)
+                else:
+                    yield ("string", text)
+            elif char == "{":
+                self.position += 1
+                self.containers.append(True)
+                self.expect_key = True
+                yield ("start_map", None)
+            elif char == "[":
+                self.position += 1
+                self.containers.append(False)
+                yield ("start_array", None)
+            elif char == "}" or char == "]":
+                self.position += 1
+                if not self.containers or self.containers.pop() != (char == "}"):
+                    raise ValueError(f"짝이 맞지 않는 '{char}'가 있습니다.")
+                self.expect_key = False
+                yield ("end_map" if char == "}" else "end_array", None)
+            elif char == ",":
+                self.position += 1
+                self.expect_key = bool(self.containers) and self.containers[-1]
+            elif char == ":":
+                self.position += 1
+            else:
+                number = _NUMBER.match(self.buffer, position)
+                if number and number.end() > position:
+                    # "1." / "1e+"처럼 청크 끝에서 잘렸을 수 있으면 더 읽고 다시 확인한다.
+                    if len(self.buffer) - number.end() < 3 and not self.eof:
+                        self._fill(grow=True)
+                        continue
+                    self.position = number.end()
+                    is_float = number.group(1) or number.group(2)
+                    token = number.group(0)
+                    yield ("number", float(token) if is_float else int(token))
+                    continue
+
+                literal = _read_literal(self.buffer, position)
+                if literal is None:
+                    if len(self.buffer) - position < 5 and not self.eof:
+                        self._fill(grow=True)
+                        continue
+                    raise ValueError(f"알 수 없는 JSON 토큰입니다: {self.buffer[position:position + 20]!r}")
+                name, event = literal
+                self.position += len(name)
+                yield event
+
+        if self.containers:
+            raise ValueError("JSON이 중간에 끝났습니다.")
+
+
+def _read_literal(buffer: str, position: int) -> Optional[Tuple[str, JsonEvent]]:
+    """true/false/null 리터럴을 읽는다. 예: _read_literal("null]", 0)"""
+
+    for name, event in _LITERALS.items():
+        if buffer.startswith(name, position):
+            return name, event
+    return None
@@ -0,0 +1,181 @@
+# v0.4 - 동시에 겹친 메모리 측정은 최대값을 null로 기록 (2026-10-17)
+# 기능: perf_counter 기반 구간 측정 + Chrome trace 출력 (예: with timer.span("patch") as span: ...)
+
+from __future__ import annotations
+
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# tracemalloc 최대값은 프로세스 전체에 하나라, 초기화할 때마다 번호를 올려 겹친 측정을 알아낸다.
+_MEMORY_LOCK = threading.Lock()
+_memory_window_count = 0
+
+
+def start_memory_window() -> Tuple[int, int]:
+    """tracemalloc 최대값을 초기화하고 측정 창을 연다. (창 번호, 기준 메모리)를 반환한다. 예: window = start_memory_window()"""
+
+    global _memory_window_count
+    with _MEMORY_LOCK:
+        tracemalloc.reset_peak()
+        _memory_window_count += 1
+        return _memory_window_count, tracemalloc.get_traced_memory()[0]
+
+
+def memory_window_peak(window: Tuple[int, int]) -> Optional[int]:
+    """창을 연 뒤 늘어난 최대 메모리(바이트). 예: memory_window_peak(window)
+
+    그 사이 다른 스레드가 창을 열어 최대값을 초기화했으면 믿을 수 없으므로 None이다.
+    None이 아니어도 같은 프로세스에서 동시에 도는 스레드의 할당이 섞이므로 상한값이다.
+    """
+
+    number, baseline = window
+    with _MEMORY_LOCK:
+        if number != _memory_window_count:
+            return None
+        return tracemalloc.get_traced_memory()[1] - baseline
+
+
+@dataclass
+class Span:
+    """측정한 구간 하나. 예: Span(name="patch", start=0.01, duration=0.2)"""
+
+    name: str
+    start: float
+    duration: float = 0.0
+    peak_bytes: Optional[int] = None
+    thread_id: int = 0
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+
+class StageTimer:
+    """파이프라인 단계 측정기. 예: timer = StageTimer(track_memory=True)
+
+    구간은 평평하게(중첩 없이) 쓰는 것을 전제로 한다. track_memory면 구간마다 tracemalloc 최대 증가량을 기록한다.
+    다른 구간/단계와 겹쳐 최대값이 초기화된 구간은 peak_kb가 null이다(memory_window_peak 참고).
+    """
+
+    def __init__(self, track_memory: bool = False) -> None:
+        self.track_memory = track_memory
+        self.spans: List[Span] = []
+        self._origin = perf_counter()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Dict[str, Any]]:
+        """구간을 측정한다. 반환된 딕셔너리에 바이트 수/개수를 추가할 수 있다. 예: with timer.span("read") as span: ..."""
+
+        window = None
+        if self.track_memory:
+            self._ensure_tracemalloc()
+            window = start_memory_window()
+
+        record = Span(
+            name=name,
+            start=perf_counter() - self._origin,
+            thread_id=threading.get_ident(),
+            attrs=dict(attrs),
+        )
+        try:
+            yield record.attrs
+        finally:
+            record.duration = perf_counter() - self._origin - record.start
+            if window is not None:
+                # 구간 시작 시점보다 늘어난 최대 메모리만 기록한다.
+                record.peak_bytes = memory_window_peak(window)
+            with self._lock:
+                self.spans.append(record)
+
+    def add_span(
+        self,
+        name: str,
+        started: float,
+        finished: float,
+        thread_id: Optional[int] = None,
+        peak_bytes: Optional[int] = None,
+        **attrs: Any,
+    ) -> None:
+        """perf_counter 값으로 이미 잰 구간을 추가한다. 예: timer.add_span("images", started, finished, thread_id=pid, bytes_read=1024)
+
+        워커 스레드/프로세스에서 잰 단계처럼 with 블록으로 감쌀 수 없는 구간에 쓴다.
+        메모리는 직접 재지 않으므로 워커가 잰 peak_bytes를 넘긴다.
+        """
+
+        record = Span(
+            name=name,
+            start=started - self._origin,
+            duration=finished - started,
+            peak_bytes=peak_bytes,
+            thread_id=thread_id if thread_id is not None else threading.get_ident(),
+            attrs=dict(attrs),
+        )
+        with self._lock:
+            self.spans.append(record)
+
+    def close(self) -> None:
+        """직접 시작한 tracemalloc을 멈춘다. 예: timer.close()"""
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def to_report(self) -> Dict[str, Any]:
+        """run_report의 timings 섹션을 만든다. 예: report["timings"] = timer.to_report()"""
+
+        stages = []
+        for record in self.spans:
+            stage: Dict[str, Any] = {"name": record.name, "ms": round(record.duration * 1000, 3)}
+            if self.track_memory:
+                stage["peak_kb"] = round(record.peak_bytes / 1024, 1) if record.peak_bytes is not None else None
+            stage.update(record.attrs)
+            stages.append(stage)
+
+        return {
+            "total_ms": round(sum(record.duration for record in self.spans) * 1000, 3),
+            "memory_tracked": self.track_memory,
+            "stages": stages,
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """chrome://tracing / Perfetto에서 여는 JSON을 만든다. 예: write_json_file("trace.json", timer.to_chrome_trace())"""
+
+        pid = os.getpid()
+        events = []
+        for record in self.spans:
+            args = dict(record.attrs)
+            if record.peak_bytes is not None:
+                args["peak_bytes"] = record.peak_bytes
+            events.append(
+                {
+                    "name": record.name,
+                    "ph": "X",
+                    "ts": round(record.start * 1_000_000, 1),
+                    "dur": round(record.duration * 1_000_000, 1),
+                    "pid": pid,
+                    "tid": record.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def _ensure_tracemalloc(self) -> None:
+        """tracemalloc이 꺼져 있으면 켠다. 예: self._ensure_tracemalloc()"""
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+
+def file_size(path: Any) -> Optional[int]:
+    """파일 크기(바이트)를 반환한다. 없으면 None. 예: file_size("output/run_report.json")"""
+
+    try:
+        return Path(path).stat().st_size
+    except (OSError, TypeError):
+        return None